@@ -1,6 +1,23 @@
 """CacheManager package for efficient caching with multiple backends."""
 
-from .cache_config import CacheConfig
-from .cache_manager import CacheManager
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["CacheManager", "CacheConfig"]
+if TYPE_CHECKING:
+    from .cache_config import CacheConfig, get_cache_config
+    from .cache_manager import CacheManager
+
+__all__ = ["CacheManager", "CacheConfig", "get_cache_config"]
+
+def __getattr__(name: str) -> Any:
+    """Import the public classes on first access (PEP 562).
+
+    Keeps ``import src.cache_layers`` and other submodule imports from loading
+    pydantic and the full manager stack.
+    """
+    if name in ("CacheConfig", "get_cache_config"):
+        from . import cache_config
+        return getattr(cache_config, name)
+    if name == "CacheManager":
+        from .cache_manager import CacheManager
+        return CacheManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
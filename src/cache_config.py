@@ -1,140 +1,161 @@
-import os
-from enum import Enum
-from typing import List, Optional
-from dotenv import load_dotenv
-from pydantic import BaseModel, Field, field_validator
+import hashlib
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Annotated, Any, List, Optional, Tuple
+from pydantic import BeforeValidator, Field, PositiveFloat, PositiveInt, PrivateAttr, model_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
-load_dotenv()
+from .cache_enums import CacheLayerType, Environment, EvictionPolicy, LogLevel, SerializationCodec
 
-class EvictionPolicy(str, Enum):
-    """Enum defining cache eviction policies.
-    
-    Available policies:
-    - LRU: Least Recently Used - evicts least recently accessed items first
-    - FIFO: First In First Out - evicts oldest items first
-    - LFU: Least Frequently Used - evicts least frequently accessed items
-    """
-    LRU = "lru"
-    FIFO = "fifo"
-    LFU = "lfu"
+# Cached CacheConfig properties to drop when one of their input fields is assigned
+# (or updated through model_copy)
+_LAYER_VIEWS = ("enabled_layer_types", "enabled_layer_ttls")
+_DERIVED_BY_FIELD = {
+    "redis_url": ("full_redis_url",),
+    "redis_port": ("full_redis_url",),
+    "redis_username": ("full_redis_url",),
+    "redis_password": ("full_redis_url",),
+    "cache_layers": _LAYER_VIEWS,
+}
 
-class CacheLayerType(str, Enum):
-    """Enum defining cache layer types.
-    
-    Available types:
-    - MEMORY: In-memory cache (fastest, but volatile)
-    - REDIS: Redis cache (networked, shared across instances)
-    - DISK: Local disk storage via shelve (persistent, but slow)
-    """
-    MEMORY = "memory"
-    REDIS = "redis"
-    DISK = "disk"
+# Constrained field types, enforced by pydantic-core without a Python callback
+Percentage = Annotated[float, Field(ge=0.0, le=100.0)]
+CompressionLevel = Annotated[int, Field(ge=1, le=9)]
 
-class LogLevel(str, Enum):
-    """Enum defining log levels.
-    
-    Available levels:
-    - DEBUG: Detailed debugging information
-    - INFO: Confirmation that things are working as expected
-    - WARNING: Indication that something unexpected happened
-    - ERROR: Due to a more serious problem, the software hasn't been able to perform a function
-    - CRITICAL: A serious error indicating the program may be unable to continue running
-    """
-    DEBUG = "debug"
-    INFO = "info"
-    WARNING = "warning"
-    ERROR = "error"
-    CRITICAL = "critical"
+_HASH_ALGOS = frozenset(hashlib.algorithms_guaranteed)
 
-class Environment(str, Enum):
-    """Enum defining environment types.
-    
-    Available environments:
-    - DEV: Development environment
-    - TEST: Testing environment
-    - PROD: Production environment
-    """
-    DEV = "dev"
-    TEST = "test"
-    PROD = "prod"
+def _split_csv(value: Any) -> Any:
+    """Split a comma-separated environment string into a tuple of non-empty items."""
+    if isinstance(value, str):
+        return tuple(item for item in map(str.strip, value.split(",")) if item)
+    return value
+
+# Default log level for each deployment environment
+_LOG_LEVEL_BY_ENV = {
+    Environment.DEV: LogLevel.DEBUG,
+    Environment.TEST: LogLevel.INFO,
+    Environment.PROD: LogLevel.WARNING
+}
 
-class CacheLayerConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CacheLayerConfig:
     """Configuration for a single cache layer.
     
     Defines the type, TTL, and other settings for a specific cache layer.
+    A plain slotted dataclass: pydantic still validates it when it is used
+    inside CacheConfig, without a model validator per layer instance.
     """
     type: CacheLayerType
     ttl: int
     enabled: bool = True
-    weight: int = Field(default=1, description="For future use with weighted distribution")
-    max_size: Optional[int] = Field(default=None, description="Size limit for this layer (None = use parent setting)")
+    weight: int = 1  # For future use with weighted distribution
+    max_size: Optional[int] = None  # Size limit for this layer (None = use parent setting)
 
-class CacheConfig(BaseModel):
+# Layers used when an empty cache_layers list is given. The entries are
+# immutable constants, so every CacheConfig shares the same instances.
+_DEFAULT_CACHE_LAYERS = (
+    CacheLayerConfig(type=CacheLayerType.MEMORY, ttl=60, max_size=1000),
+    CacheLayerConfig(type=CacheLayerType.REDIS, ttl=300, enabled=False),
+    CacheLayerConfig(type=CacheLayerType.DISK, ttl=3600)
+)
+
+class CacheConfig(BaseSettings):
     """Configuration for the CacheManager.
     
     Provides settings for cache storage, Redis connection, and retry behavior.
+    Unset fields are read from environment variables named after the field in
+    upper case, unless a ``validation_alias`` says otherwise. A ``.env`` file
+    is only read when requested through ``from_env``.
     """
+    model_config = SettingsConfigDict(
+        env_file=None,
+        case_sensitive=False,
+        extra="ignore",
+        populate_by_name=True
+    )
+    
+    # Bumped by __setattr__ on every field assignment (see revision)
+    _revision: int = PrivateAttr(default=0)
+    
     # Cache settings
     cache_dir: str = Field(
-        default_factory=lambda: os.getenv("CACHE_DIR", ".cache"),
+        default=".cache",
         description="Directory where cache files are stored"
     )
     cache_file: str = Field(
-        default_factory=lambda: os.getenv("CACHE_FILE", "cache.db"),
+        default="cache.db",
         description="Filename for disk cache storage"
     )
-    cache_max_size: int = Field(
-        default_factory=lambda: int(os.getenv("CACHE_MAX_SIZE", "5000")),
+    cache_max_size: PositiveInt = Field(
+        default=5000,
         description="Maximum number of items to store in the cache"
     )
     cache_ttl: float = Field(
-        default_factory=lambda: float(os.getenv("CACHE_TTL", "300.0")),
+        default=300.0,
         description="Default time-to-live for cache entries in seconds"
     )
     eviction_policy: EvictionPolicy = Field(
-        default_factory=lambda: EvictionPolicy(os.getenv("EVICTION_POLICY", "lru").lower()),
+        default=EvictionPolicy.LRU,
         description="Policy for evicting items when cache is full"
     )
     namespace: str = Field(
-        default_factory=lambda: os.getenv("CACHE_NAMESPACE", "default"),
+        default="default",
+        validation_alias="CACHE_NAMESPACE",
         description="Namespace for cache keys to avoid collisions"
     )
     
     # Redis settings
     use_redis: bool = Field(
-        default_factory=lambda: os.getenv("USE_REDIS", "false").lower() in ("true", "1", "yes"),
+        default=False,
         description="Whether to use Redis as a cache backend"
     )
     redis_url: str = Field(
-        default_factory=lambda: os.getenv("REDIS_URL", "redis://localhost"),
+        default="redis://localhost",
         description="Base URL for Redis connection"
     )
-    redis_port: int = Field(
-        default_factory=lambda: int(os.getenv("REDIS_PORT", "6379")),
+    redis_port: PositiveInt = Field(
+        default=6379,
         description="Port for Redis connection"
     )
     redis_username: str = Field(
-        default_factory=lambda: os.getenv("REDIS_USERNAME", ""),
+        default="",
         description="Username for Redis authentication"
     )
     redis_password: str = Field(
-        default_factory=lambda: os.getenv("REDIS_PASSWORD", ""),
+        default="",
         description="Password for Redis authentication"
     )
     
     # Memory cache settings
-    memory_cache_ttl: int = Field(
-        default_factory=lambda: int(os.getenv("MEMORY_CACHE_TTL", "60")),
+    memory_cache_ttl: PositiveInt = Field(
+        default=60,
         description="TTL for in-memory cache entries in seconds"
     )
     memory_cache_enabled: bool = Field(
-        default_factory=lambda: os.getenv("MEMORY_CACHE_ENABLED", "true").lower() in ("true", "1", "yes"),
+        default=True,
         description="Whether to use in-memory caching"
     )
+    enable_ttl_sweeper: bool = Field(
+        default=False,
+        description="Whether to periodically remove expired entries from the memory cache in the background"
+    )
+    ttl_sweep_interval: PositiveInt = Field(
+        default=60,
+        description="How often the TTL sweeper runs (in seconds)"
+    )
+    l0_cache_size: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum entries in the front-tier cache checked before any layer, e.g. 512 (0 disables it); values are shared by reference, not copied"
+    )
+    l0_cache_ttl: PositiveFloat = Field(
+        default=1.0,
+        description="How long a front-tier entry is served without consulting the cache layers (in seconds); values read from a layer may outlive their layer TTL by up to this long"
+    )
     
     # Hybrid caching settings
     use_layered_cache: bool = Field(
-        default_factory=lambda: os.getenv("USE_LAYERED_CACHE", "false").lower() in ("true", "1", "yes"),
+        default=False,
         description="Whether to use multiple cache layers with different speeds/persistence"
     )
     cache_layers: List[CacheLayerConfig] = Field(
@@ -142,357 +163,394 @@ class CacheConfig(BaseModel):
         description="Configuration for each cache layer when using layered caching"
     )
     write_through: bool = Field(
-        default_factory=lambda: os.getenv("CACHE_WRITE_THROUGH", "true").lower() in ("true", "1", "yes"),
+        default=True,
+        validation_alias="CACHE_WRITE_THROUGH",
         description="Whether to write to all cache layers on set operations"
     )
     read_through: bool = Field(
-        default_factory=lambda: os.getenv("CACHE_READ_THROUGH", "true").lower() in ("true", "1", "yes"),
+        default=True,
+        validation_alias="CACHE_READ_THROUGH",
         description="Whether to read from slower layers when item not found in faster layers"
     )
     
     # Cache compression
     enable_compression: bool = Field(
-        default_factory=lambda: os.getenv("ENABLE_COMPRESSION", "false").lower() in ("true", "1", "yes"),
+        default=False,
         description="Whether to compress cache entries to save space"
     )
-    compression_min_size: int = Field(
-        default_factory=lambda: int(os.getenv("COMPRESSION_MIN_SIZE", "1024")),
+    compression_min_size: PositiveInt = Field(
+        default=1024,
         description="Minimum size in bytes for compression to be applied"
     )
-    compression_level: int = Field(
-        default_factory=lambda: int(os.getenv("COMPRESSION_LEVEL", "6")),
-        description="Compression level (1-9) for zlib compression"
+    compression_level: CompressionLevel = Field(
+        default=6,
+        description="Compression level (1-9) for zlib compression; 1-3 trade little size for much less CPU"
+    )
+    serialization_codec: SerializationCodec = Field(
+        default=SerializationCodec.MSGPACK,
+        description="Codec used to encode values: msgpack, msgspec (faster, needs the msgspec package) or pickle"
     )
     
     # Disk usage monitoring and cleanup settings
     disk_usage_monitoring: bool = Field(
-        default_factory=lambda: os.getenv("DISK_USAGE_MONITORING", "true").lower() in ("true", "1", "yes"),
+        default=True,
         description="Whether to monitor disk usage and perform cleanup"
     )
-    disk_usage_threshold: float = Field(
-        default_factory=lambda: float(os.getenv("DISK_USAGE_THRESHOLD", "75.0")),
+    disk_usage_threshold: Percentage = Field(
+        default=75.0,
         description="Percentage threshold (0-100) to trigger cleanup"
     )
-    disk_critical_threshold: float = Field(
-        default_factory=lambda: float(os.getenv("DISK_CRITICAL_THRESHOLD", "90.0")),
+    disk_critical_threshold: Percentage = Field(
+        default=90.0,
         description="Critical percentage threshold for aggressive cleanup"
     )
     disk_check_interval: int = Field(
-        default_factory=lambda: int(os.getenv("DISK_CHECK_INTERVAL", "3600")),
+        default=3600,
         description="How often to check disk usage (in seconds)"
     )
     disk_retention_days: int = Field(
-        default_factory=lambda: int(os.getenv("DISK_RETENTION_DAYS", "30")),
+        default=30,
         description="Default days to keep cached items during cleanup"
     )
 
     # Retry settings
-    retry_attempts: int = Field(
-        default_factory=lambda: int(os.getenv("RETRY_ATTEMPTS", "3")),
+    retry_attempts: PositiveInt = Field(
+        default=3,
         description="Number of retry attempts for failed operations"
     )
-    retry_delay: int = Field(
-        default_factory=lambda: int(os.getenv("RETRY_DELAY", "2")),
+    retry_delay: PositiveInt = Field(
+        default=2,
         description="Delay between retry attempts in seconds"
     )
     
     # Environment and logging settings
     environment: Environment = Field(
-        default_factory=lambda: Environment(os.getenv("ENV", "dev").lower()),
+        default=Environment.DEV,
+        validation_alias="ENV",
         description="Current environment (dev, test, prod)"
     )
     log_level: LogLevel = Field(
-        default_factory=lambda: {
-            "dev": LogLevel.DEBUG,
-            "test": LogLevel.INFO,
-            "prod": LogLevel.WARNING
-        }[os.getenv("ENV", "dev").lower()],
+        default_factory=lambda data: _LOG_LEVEL_BY_ENV[data.get("environment", Environment.DEV)],
         description="Logging level based on environment"
     )
     log_dir: str = Field(
-        default_factory=lambda: os.getenv("LOG_DIR", "./logs"),
+        default="./logs",
         description="Directory where log files are stored"
     )
     log_to_file: bool = Field(
-        default_factory=lambda: os.getenv("LOG_TO_FILE", "false").lower() in ("true", "1", "yes")
-        or os.getenv("ENV", "dev").lower() == "prod",
-        description="Whether to write logs to file in addition to console"
+        default_factory=lambda data: data.get("environment") is Environment.PROD,
+        description="Whether to write logs to file in addition to console; defaults to True in prod. "
+                    "An explicit LOG_TO_FILE, including false, overrides that default"
     )
     log_max_size: int = Field(
-        default_factory=lambda: int(os.getenv("LOG_MAX_SIZE", "10485760")),
+        default=10485760,
         description="Maximum size of log files in bytes (10MB default)"
     )
     log_backup_count: int = Field(
-        default_factory=lambda: int(os.getenv("LOG_BACKUP_COUNT", "5")),
+        default=5,
         description="Number of log file backups to keep"
     )
     
     # Telemetry and performance monitoring
     enable_telemetry: bool = Field(
-        default_factory=lambda: os.getenv("ENABLE_TELEMETRY", "false").lower() in ("true", "1", "yes"),
+        default=False,
         description="Whether to collect telemetry data for performance monitoring"
     )
     telemetry_interval: int = Field(
-        default_factory=lambda: int(os.getenv("TELEMETRY_INTERVAL", "60")),
+        default=60,
         description="Interval in seconds for collecting telemetry data"
     )
     metrics_collection: bool = Field(
-        default_factory=lambda: os.getenv("METRICS_COLLECTION", "true").lower() in ("true", "1", "yes"),
+        default=True,
         description="Whether to collect cache performance metrics"
     )
     
     # Cache warmup settings
     enable_warmup: bool = Field(
-        default_factory=lambda: os.getenv("ENABLE_WARMUP", "false").lower() in ("true", "1", "yes"),
+        default=False,
         description="Whether to pre-warm the cache with frequently used keys"
     )
     warmup_keys_file: Optional[str] = Field(
-        default_factory=lambda: os.getenv("WARMUP_KEYS_FILE", None),
+        default=None,
         description="Path to file containing keys for cache warmup"
     )
     warmup_on_start: bool = Field(
-        default_factory=lambda: os.getenv("WARMUP_ON_START", "false").lower() in ("true", "1", "yes"),
+        default=False,
         description="Whether to perform cache warmup on startup"
     )
     
     # Adaptive TTL settings
     enable_adaptive_ttl: bool = Field(
-        default_factory=lambda: os.getenv("ENABLE_ADAPTIVE_TTL", "false").lower() in ("true", "1", "yes"),
+        default=False,
         description="Whether to adjust TTL based on access patterns"
     )
     adaptive_ttl_min: int = Field(
-        default_factory=lambda: int(os.getenv("ADAPTIVE_TTL_MIN", "60")),
+        default=60,
+        ge=1,
         description="Minimum TTL in seconds for adaptive TTL"
     )
     adaptive_ttl_max: int = Field(
-        default_factory=lambda: int(os.getenv("ADAPTIVE_TTL_MAX", "86400")),
+        default=86400,
         description="Maximum TTL in seconds (1 day) for adaptive TTL"
     )
     access_count_threshold: int = Field(
-        default_factory=lambda: int(os.getenv("ACCESS_COUNT_THRESHOLD", "10")),
+        default=10,
         description="Number of accesses to trigger TTL adjustment"
     )
     adaptive_ttl_adjustment_factor: float = Field(
-        default_factory=lambda: float(os.getenv("ADAPTIVE_TTL_ADJUSTMENT_FACTOR", "1.5")),
+        default=1.5,
         description="Factor by which to adjust TTL when threshold is reached"
     )
     
     # Distributed locking settings
     use_distributed_locking: bool = Field(
-        default_factory=lambda: os.getenv("USE_DISTRIBUTED_LOCKING", "false").lower() in ("true", "1", "yes"),
+        default=False,
         description="Whether to use distributed locking for concurrent operations"
     )
-    lock_timeout: int = Field(
-        default_factory=lambda: int(os.getenv("LOCK_TIMEOUT", "30")),
+    lock_timeout: PositiveInt = Field(
+        default=30,
         description="Lock expiration time in seconds"
     )
-    lock_retry_attempts: int = Field(
-        default_factory=lambda: int(os.getenv("LOCK_RETRY_ATTEMPTS", "5")),
+    lock_retry_attempts: PositiveInt = Field(
+        default=5,
         description="Maximum number of retry attempts for acquiring a lock"
     )
-    lock_retry_interval: float = Field(
-        default_factory=lambda: float(os.getenv("LOCK_RETRY_INTERVAL", "0.2")),
+    lock_retry_interval: PositiveFloat = Field(
+        default=0.2,
         description="Time between lock retry attempts in seconds"
     )
     
     # Cache sharding settings
     enable_sharding: bool = Field(
-        default_factory=lambda: os.getenv("ENABLE_SHARDING", "false").lower() in ("true", "1", "yes"),
+        default=False,
         description="Whether to shard the cache across multiple partitions"
     )
-    num_shards: int = Field(
-        default_factory=lambda: int(os.getenv("NUM_SHARDS", "1")),
+    num_shards: PositiveInt = Field(
+        default=1,
         description="Number of cache shards to use"
     )
     sharding_algorithm: str = Field(
-        default_factory=lambda: os.getenv("SHARDING_ALGORITHM", "consistent_hash"),
+        default="consistent_hash",
         description="Algorithm for sharding ('consistent_hash' or 'modulo')"
     )
     
     # Cross-node cache invalidation
     enable_invalidation: bool = Field(
-        default_factory=lambda: os.getenv("ENABLE_INVALIDATION", "false").lower() in ("true", "1", "yes"),
+        default=False,
         description="Whether to enable cross-node cache invalidation"
     )
     invalidation_channel: str = Field(
-        default_factory=lambda: os.getenv("INVALIDATION_CHANNEL", "cache:invalidation"),
+        default="cache:invalidation",
         description="Redis channel for invalidation messages"
     )
     
     # Security settings
     enable_encryption: bool = Field(
-        default_factory=lambda: os.getenv("ENABLE_ENCRYPTION", "false").lower() in ("true", "1", "yes"),
+        default=False,
         description="Whether to encrypt cache data"
     )
     encryption_key: Optional[str] = Field(
-        default_factory=lambda: os.getenv("ENCRYPTION_KEY", None),
+        default=None,
         description="Secret key for encryption"
     )
     encryption_salt: Optional[str] = Field(
-        default_factory=lambda: os.getenv("ENCRYPTION_SALT", None),
+        default=None,
         description="Salt for encryption key derivation"
     )
     
     enable_data_signing: bool = Field(
-        default_factory=lambda: os.getenv("ENABLE_DATA_SIGNING", "false").lower() in ("true", "1", "yes"),
+        default=False,
         description="Whether to cryptographically sign cache data"
     )
     signing_key: Optional[str] = Field(
-        default_factory=lambda: os.getenv("SIGNING_KEY", None),
+        default=None,
         description="Secret key for signing"
     )
     signing_algorithm: str = Field(
-        default_factory=lambda: os.getenv("SIGNING_ALGORITHM", "sha256"),
+        default="sha256",
         description="Hash algorithm for signing"
     )
     
     enable_access_control: bool = Field(
-        default_factory=lambda: os.getenv("ENABLE_ACCESS_CONTROL", "false").lower() in ("true", "1", "yes"),
+        default=False,
         description="Whether to enable access control for cache operations"
     )
     
     # Redis connection security settings
     redis_ssl: bool = Field(
-        default_factory=lambda: os.getenv("REDIS_SSL", "false").lower() in ("true", "1", "yes"),
+        default=False,
         description="Whether to use SSL for Redis connections"
     )
     redis_ssl_cert_reqs: Optional[str] = Field(
-        default_factory=lambda: os.getenv("REDIS_SSL_CERT_REQS", None),
+        default=None,
         description="SSL certificate requirements ('none', 'optional', or 'required')"
     )
     redis_ssl_ca_certs: Optional[str] = Field(
-        default_factory=lambda: os.getenv("REDIS_SSL_CA_CERTS", None),
+        default=None,
         description="Path to CA certificates file for SSL verification"
     )
     
     # Secure connection pool settings
-    redis_connection_timeout: float = Field(
-        default_factory=lambda: float(os.getenv("REDIS_CONNECTION_TIMEOUT", "5.0")),
+    redis_connection_timeout: PositiveFloat = Field(
+        default=5.0,
         description="Timeout for Redis connections in seconds"
     )
-    redis_max_connections: int = Field(
-        default_factory=lambda: int(os.getenv("REDIS_MAX_CONNECTIONS", "10")),
+    redis_max_connections: PositiveInt = Field(
+        default=10,
         description="Maximum number of Redis connections in the pool"
     )
     
     # Redis Sentinel/Cluster support
     use_redis_sentinel: bool = Field(
-        default_factory=lambda: os.getenv("USE_REDIS_SENTINEL", "false").lower() in ("true", "1", "yes"),
+        default=False,
         description="Whether to use Redis Sentinel for high availability"
     )
     sentinel_master_name: str = Field(
-        default_factory=lambda: os.getenv("SENTINEL_MASTER_NAME", "mymaster"),
+        default="mymaster",
         description="Name of the master in Redis Sentinel configuration"
     )
-    sentinel_addresses: List[str] = Field(
-        default_factory=lambda: os.getenv("SENTINEL_ADDRESSES", "").split(",") if os.getenv("SENTINEL_ADDRESSES") else [],
-        description="List of Redis Sentinel addresses"
+    sentinel_addresses: Annotated[Tuple[str, ...], NoDecode, BeforeValidator(_split_csv)] = Field(
+        default=(),
+        description="Redis Sentinel addresses (comma-separated in the environment)"
     )
 
     # Disk cache settings
     disk_cache_enabled: bool = Field(
-        default_factory=lambda: os.getenv("DISK_CACHE_ENABLED", "true").lower() in ("true", "1", "yes"),
+        default=True,
         description="Whether to enable disk-based caching"
     )
     disk_cache_ttl: float = Field(
-        default_factory=lambda: float(os.getenv("DISK_CACHE_TTL", "3600.0")),
+        default=3600.0,
         description="Time-to-live for disk cache entries in seconds (1 hour default)"
     )
+    disk_write_behind: bool = Field(
+        default=False,
+        description="Whether disk cache writes return before reaching disk (written by a background task)"
+    )
 
-    @field_validator("cache_max_size", "retry_attempts", "retry_delay", "redis_port", "memory_cache_ttl", "compression_min_size")
-    @classmethod
-    def validate_positive_int(cls, v: int) -> int:
-        """Validate that integer fields are positive."""
-        if v <= 0:
-            raise ValueError(f"Value must be positive, got {v}")
-        return v
-
-    @field_validator("disk_usage_threshold", "disk_critical_threshold")
-    @classmethod
-    def validate_percentage(cls, v: float) -> float:
-        """Validate that threshold values are valid percentages."""
-        if not 0.0 <= v <= 100.0:
-            raise ValueError(f"Percentage value must be between 0 and 100, got {v}")
-        return v
-    
-    @field_validator("compression_level")
-    @classmethod
-    def validate_compression_level(cls, v: int) -> int:
-        """Validate compression level is between 1 and 9."""
-        if not 1 <= v <= 9:
-            raise ValueError(f"Compression level must be between 1 and 9, got {v}")
-        return v
-    
-    @field_validator("namespace")
-    @classmethod
-    def validate_namespace(cls, v: str) -> str:
-        """Validate the namespace string."""
-        if not v:
-            raise ValueError("Namespace cannot be empty")
-        if ":" in v:
-            raise ValueError("Namespace cannot contain ':' character")
-        return v
-    
-    @field_validator("cache_layers")
-    @classmethod
-    def initialize_default_layers(cls, v: List[CacheLayerConfig]) -> List[CacheLayerConfig]:
-        """Initialize default cache layers if none provided."""
-        if not v:
-            return [
-                CacheLayerConfig(type=CacheLayerType.MEMORY, ttl=60, max_size=1000),
-                CacheLayerConfig(type=CacheLayerType.REDIS, ttl=300, enabled=False),
-                CacheLayerConfig(type=CacheLayerType.DISK, ttl=3600)
-            ]
-        return v
+    @model_validator(mode="after")
+    def _validate(self) -> "CacheConfig":
+        """Validate explicitly provided fields that need more than a type constraint.
+        
+        Numeric ranges are declared on the field types. The namespace, TTL range
+        and algorithm checks run here in a single pass, and only for fields
+        that were provided, so the built-in defaults are left as-is.
+        
+        Returns:
+            CacheConfig: The validated configuration
+        
+        Raises:
+            ValueError: If any provided field holds an invalid value
+        """
+        provided = self.model_fields_set
+        errors = []
+        
+        if "namespace" in provided:
+            if not self.namespace:
+                errors.append("Namespace cannot be empty")
+            elif ":" in self.namespace:
+                errors.append("Namespace cannot contain ':' character")
+        if "adaptive_ttl_max" in provided and self.adaptive_ttl_max < self.adaptive_ttl_min:
+            errors.append(
+                f"Maximum adaptive TTL must be greater than minimum ({self.adaptive_ttl_min}), "
+                f"got {self.adaptive_ttl_max}"
+            )
+        if "signing_algorithm" in provided and self.signing_algorithm not in _HASH_ALGOS:
+            errors.append(f"Unsupported hash algorithm: {self.signing_algorithm}")
+        if "sharding_algorithm" in provided and self.sharding_algorithm not in ("consistent_hash", "modulo"):
+            errors.append(f"Unsupported sharding algorithm: {self.sharding_algorithm}")
+        
+        if errors:
+            raise ValueError("; ".join(errors))
+        
+        # Initialize default cache layers if an empty list was provided
+        if "cache_layers" in provided and not self.cache_layers:
+            self.cache_layers = list(_DEFAULT_CACHE_LAYERS)
+        return self
     
-    @field_validator("adaptive_ttl_min", "adaptive_ttl_max")
     @classmethod
-    def validate_adaptive_ttl_range(cls, v: int, info) -> int:
-        """Validate that adaptive TTL values are reasonable."""
-        if info.field_name == "adaptive_ttl_min" and v < 1:
-            raise ValueError(f"Minimum adaptive TTL must be at least 1 second, got {v}")
-        if info.field_name == "adaptive_ttl_max" and v < info.data.get("adaptive_ttl_min", 60):
-            raise ValueError(f"Maximum adaptive TTL must be greater than minimum ({info.data.get('adaptive_ttl_min', 60)}), got {v}")
-        return v
+    def from_env(cls, env_file: Optional[str] = ".env", **overrides: Any) -> "CacheConfig":
+        """Build a configuration from the environment and a dotenv file.
+        
+        Args:
+            env_file: Path of the dotenv file to read, or None to skip it
+            **overrides: Field values that take precedence over the environment
+            
+        Returns:
+            CacheConfig: The new configuration
+        """
+        return cls(_env_file=env_file, **overrides)
     
-    @field_validator("lock_timeout", "lock_retry_attempts", "num_shards", "redis_max_connections")
-    @classmethod
-    def validate_positive_ints(cls, v: int) -> int:
-        """Validate that int fields are positive."""
-        if v <= 0:
-            raise ValueError("Value must be positive")
-        return v
+    def __setattr__(self, name: str, value) -> None:
+        """Set a field, dropping any cached property derived from it."""
+        super().__setattr__(name, value)
+        for derived in _DERIVED_BY_FIELD.get(name, ()):
+            self.__dict__.pop(derived, None)
+        if name in type(self).model_fields:
+            self._revision += 1
     
-    @field_validator("lock_retry_interval", "redis_connection_timeout")
-    @classmethod
-    def validate_positive_float(cls, v: float) -> float:
-        """Validate that float fields are positive."""
-        if v <= 0:
-            raise ValueError("Value must be positive")
-        return v
+    @property
+    def revision(self) -> int:
+        """Number of field assignments made since the config was created.
+        
+        Lets components that resolve settings up front (such as
+        CacheManager.get) notice that they need to resolve them again.
+        
+        Returns:
+            int: The assignment counter
+        """
+        return self._revision
     
-    @field_validator("signing_algorithm")
-    @classmethod
-    def validate_signing_algorithm(cls, v: str) -> str:
-        """Validate the signing algorithm."""
-        import hashlib
-        if v not in hashlib.algorithms_guaranteed:
-            raise ValueError(f"Unsupported hash algorithm: {v}")
-        return v
+    def model_copy(self, *, update: Optional[dict] = None, deep: bool = False) -> "CacheConfig":
+        """Copy the configuration, dropping cached properties derived from updated fields.
+        
+        pydantic copies ``__dict__`` (cached properties included) and applies
+        ``update`` without going through ``__setattr__``.
+        
+        Args:
+            update: Field values to change in the copy
+            deep: Whether to make a deep copy
+            
+        Returns:
+            CacheConfig: The copied configuration
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        for name in update or ():
+            for derived in _DERIVED_BY_FIELD.get(name, ()):
+                copied.__dict__.pop(derived, None)
+        return copied
+    
+    @cached_property
+    def enabled_layer_types(self) -> Tuple[CacheLayerType, ...]:
+        """Types of the enabled cache layers, in lookup order.
+        
+        Cached alongside ``enabled_layer_ttls`` as parallel tuples so per-request
+        layer loops avoid reading each CacheLayerConfig. Recomputed when
+        ``cache_layers`` is assigned or replaced through ``model_copy``;
+        mutating the list in place does not refresh it.
+        
+        Returns:
+            Tuple[CacheLayerType, ...]: Enabled layer types
+        """
+        return tuple(layer.type for layer in self.cache_layers if layer.enabled)
     
-    @field_validator("sharding_algorithm")
-    @classmethod
-    def validate_sharding_algorithm(cls, v: str) -> str:
-        """Validate the sharding algorithm."""
-        if v not in ("consistent_hash", "modulo"):
-            raise ValueError(f"Unsupported sharding algorithm: {v}")
-        return v
+    @cached_property
+    def enabled_layer_ttls(self) -> Tuple[int, ...]:
+        """TTLs of the enabled cache layers, parallel to ``enabled_layer_types``.
+        
+        Returns:
+            Tuple[int, ...]: Enabled layer TTLs in seconds
+        """
+        return tuple(layer.ttl for layer in self.cache_layers if layer.enabled)
     
-    @property
+    @cached_property
     def full_redis_url(self) -> str:
         """
         Constructs the full Redis URL based on the individual settings.
         
+        The result is computed once and cached on the instance; assigning any
+        of the Redis connection fields invalidates it.
+        
         Returns:
             str: The complete Redis URL including credentials if provided
         """
@@ -506,3 +564,16 @@ class CacheConfig(BaseModel):
             credentials = f":{self.redis_password}@"
             
         return f"{scheme}://{credentials}{host}:{self.redis_port}"
+
+@lru_cache(maxsize=1)
+def get_cache_config() -> CacheConfig:
+    """Return the process-wide CacheConfig built from the environment and ``.env``.
+    
+    The configuration is parsed and validated on the first call only. Call
+    ``get_cache_config.cache_clear()`` after changing the environment (e.g. in
+    tests) to force a rebuild.
+    
+    Returns:
+        CacheConfig: The shared configuration instance
+    """
+    return CacheConfig.from_env()
@@ -0,0 +1,89 @@
+"""Enumerations shared by the cache configuration and the cache layers.
+
+Kept free of pydantic so that modules which only need these values (such as
+the cache layers) can import them without loading the configuration model.
+"""
+
+from enum import Enum
+from typing import Any
+
+class _CaseInsensitiveEnum(str, Enum):
+    """String enum that also accepts upper- or mixed-case values (e.g. from the environment)."""
+    
+    @classmethod
+    def _missing_(cls, value: object) -> Any:
+        if isinstance(value, str):
+            lowered = value.lower()
+            for member in cls:
+                if member.value == lowered:
+                    return member
+        return None
+
+class EvictionPolicy(_CaseInsensitiveEnum):
+    """Enum defining cache eviction policies.
+    
+    Available policies:
+    - LRU: Least Recently Used - evicts least recently accessed items first
+    - FIFO: First In First Out - evicts oldest items first
+    - LFU: Least Frequently Used - evicts least frequently accessed items
+    - CLOCK: Second-chance approximation of LRU - reads only set a reference
+      flag, and eviction skips (and clears) recently referenced items
+    """
+    LRU = "lru"
+    FIFO = "fifo"
+    LFU = "lfu"
+    CLOCK = "clock"
+
+class CacheLayerType(_CaseInsensitiveEnum):
+    """Enum defining cache layer types.
+    
+    Available types:
+    - MEMORY: In-memory cache (fastest, but volatile)
+    - REDIS: Redis cache (networked, shared across instances)
+    - DISK: Local disk storage via shelve (persistent, but slow)
+    """
+    MEMORY = "memory"
+    REDIS = "redis"
+    DISK = "disk"
+
+class LogLevel(_CaseInsensitiveEnum):
+    """Enum defining log levels.
+    
+    Available levels:
+    - DEBUG: Detailed debugging information
+    - INFO: Confirmation that things are working as expected
+    - WARNING: Indication that something unexpected happened
+    - ERROR: Due to a more serious problem, the software hasn't been able to perform a function
+    - CRITICAL: A serious error indicating the program may be unable to continue running
+    """
+    DEBUG = "debug"
+    INFO = "info"
+    WARNING = "warning"
+    ERROR = "error"
+    CRITICAL = "critical"
+
+class Environment(_CaseInsensitiveEnum):
+    """Enum defining environment types.
+    
+    Available environments:
+    - DEV: Development environment
+    - TEST: Testing environment
+    - PROD: Production environment
+    """
+    DEV = "dev"
+    TEST = "test"
+    PROD = "prod"
+
+class SerializationCodec(_CaseInsensitiveEnum):
+    """Enum defining value encodings for the serializer.
+    
+    Available codecs:
+    - MSGPACK: msgpack via the msgpack package
+    - MSGSPEC: msgpack via msgspec, which encodes and decodes faster; falls
+      back to MSGPACK when msgspec is not installed
+    - PICKLE: msgpack, with values msgpack cannot encode pickled instead;
+      only enable it when every writer to the cache is trusted
+    """
+    MSGPACK = "msgpack"
+    MSGSPEC = "msgspec"
+    PICKLE = "pickle"
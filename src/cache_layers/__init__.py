@@ -1,8 +1,33 @@
-"""Cache layer implementations for different storage backends."""
+"""Cache layer implementations for different storage backends.
+
+Layer classes are imported on first access (PEP 562), so using only the
+memory layer does not import the Redis client or shelve.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from .base_layer import BaseCacheLayer
-from .memory_layer import MemoryLayer
-from .redis_layer import RedisLayer
-from .disk_layer import DiskLayer
 
-__all__ = ["BaseCacheLayer", "MemoryLayer", "RedisLayer", "DiskLayer"] 
\ No newline at end of file
+if TYPE_CHECKING:
+    from .memory_layer import MemoryLayer
+    from .redis_layer import RedisLayer
+    from .disk_layer import DiskLayer
+
+__all__ = ["BaseCacheLayer", "MemoryLayer", "RedisLayer", "DiskLayer"]
+
+# Public layer class name -> defining submodule
+_LAYER_MODULES = {
+    "MemoryLayer": ".memory_layer",
+    "RedisLayer": ".redis_layer",
+    "DiskLayer": ".disk_layer",
+}
+
+def __getattr__(name: str) -> Any:
+    """Import a layer class from its submodule on first access."""
+    module_name = _LAYER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
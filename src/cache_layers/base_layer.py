@@ -26,6 +26,10 @@ class BaseCacheLayer(ABC):
         self.ttl = ttl
         self._correlation_id = f"L-{namespace[:4]}"
         
+        # Key prefix computed once; the default namespace leaves keys untouched
+        self._prefix = "" if namespace == "default" else f"{namespace}:"
+        self._prefix_len = len(self._prefix)
+        
     def _namespace_key(self, key: str) -> str:
         """Add namespace prefix to a key.
         
@@ -35,9 +39,19 @@ class BaseCacheLayer(ABC):
         Returns:
             str: The namespaced key
         """
-        if self.namespace == "default":
-            return key
-        return f"{self.namespace}:{key}"
+        return self._prefix + key
+    
+    def _namespace_keys(self, keys: List[str]) -> List[str]:
+        """Add namespace prefix to a list of keys.
+        
+        Args:
+            keys: The original keys
+            
+        Returns:
+            List[str]: The namespaced keys, in the same order
+        """
+        prefix = self._prefix
+        return [prefix + key for key in keys]
     
     def _remove_namespace(self, namespaced_key: str) -> str:
         """Remove namespace prefix from a key.
@@ -48,10 +62,9 @@ class BaseCacheLayer(ABC):
         Returns:
             str: The original key without namespace
         """
-        if self.namespace == "default" or ":" not in namespaced_key:
-            return namespaced_key
-        _, key = namespaced_key.split(":", 1)
-        return key
+        if self._prefix and namespaced_key.startswith(self._prefix):
+            return namespaced_key[self._prefix_len:]
+        return namespaced_key
     
     @abstractmethod
     async def get(self, key: str) -> Tuple[bool, Any]:
@@ -91,6 +104,24 @@ class BaseCacheLayer(ABC):
         """
         pass
     
+    async def delete_many(self, keys: List[str]) -> int:
+        """Delete multiple values from the cache layer.
+        
+        Deletes one key at a time; layers that can remove several keys in a
+        single round trip override this.
+        
+        Args:
+            keys: List of cache keys (already namespaced)
+            
+        Returns:
+            int: Number of keys that were deleted
+        """
+        deleted = 0
+        for key in keys:
+            if await self.delete(key):
+                deleted += 1
+        return deleted
+    
     @abstractmethod
     async def get_many(self, keys: List[str]) -> Dict[str, Any]:
         """Get multiple values from the cache layer.
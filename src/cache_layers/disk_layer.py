@@ -1,12 +1,16 @@
 """Disk-based cache layer implementation."""
 
 import asyncio
+import dbm
 import os
+import pickle
 import shelve
+import struct
 import time
 import logging
-from typing import Any, Dict, List, Optional, Tuple
-from threading import RLock
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from threading import Lock, RLock
 
 from .base_layer import BaseCacheLayer
 from ..core.exceptions import CacheStorageError
@@ -14,6 +18,25 @@ from ..core.circuit_breaker import CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
+# Metadata journal layout: an 8-byte generation header followed by records of
+# (op, expiry, key length) plus the UTF-8 key
+_JOURNAL_HEADER = struct.Struct('<Q')
+_JOURNAL_RECORD = struct.Struct('<BdI')
+_OP_SET = 1
+_OP_DELETE = 2
+_OP_CLEAR = 3
+
+# Values are pickled with the newest protocol; any protocol reads back
+_SHELF_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+# Files a metadata shelve from earlier versions may occupy next to the
+# metadata path (dbm.dumb, or ndbm's .db / .pag + .dir); gdbm uses the path itself
+_LEGACY_METADATA_SUFFIXES = (".dat", ".dir", ".bak", ".db", ".pag")
+
+# The journal is compacted into a snapshot once it holds more than twice as
+# many records as there are live keys (and at least this many records)
+_MIN_COMPACTION_RECORDS = 1024
+
 class DiskLayer(BaseCacheLayer):
     """Disk-based cache layer implementation using Python's shelve.
     
@@ -21,7 +44,11 @@ class DiskLayer(BaseCacheLayer):
     """
     
     def __init__(self, namespace: str, ttl: int, cache_dir: str, cache_file: str,
-                 retry_attempts: int = 3, retry_delay: int = 2):
+                 retry_attempts: int = 3, retry_delay: int = 2,
+                 metadata_flush_interval: float = 0.2,
+                 write_behind: bool = False,
+                 write_behind_batch_size: int = 256,
+                 write_behind_max_pending: int = 1024):
         """Initialize the disk cache layer.
         
         Args:
@@ -31,6 +58,13 @@ class DiskLayer(BaseCacheLayer):
             cache_file: Name of the cache file
             retry_attempts: Number of retry attempts for disk operations
             retry_delay: Delay between retries in seconds
+            metadata_flush_interval: Seconds to coalesce metadata changes before
+                writing them to disk
+            write_behind: Whether set/set_many return before the value is written
+                to disk, leaving the write to a background task
+            write_behind_batch_size: Maximum entries written per background batch
+            write_behind_max_pending: Buffered entries above which writes fall
+                back to writing through
         """
         super().__init__(namespace, ttl)
         
@@ -41,14 +75,43 @@ class DiskLayer(BaseCacheLayer):
         # Create cache directory if it doesn't exist
         os.makedirs(cache_dir, exist_ok=True)
         
-        # For thread safety when updating metadata
+        # For thread safety when updating metadata and the shelf
         self._lock = RLock()
         
-        # Metadata file to track expiry times
+        # Metadata snapshot and append-only journal tracking expiry times
         self._metadata_path = f"{self.cache_path}_metadata"
+        self._journal_path = f"{self._metadata_path}.log"
         self._metadata: Dict[str, float] = {}
+        self._journal_id = 0
+        self._journal_records = 0
+        self._journal_buffer: List[bytes] = []
+        self._journal = None
         self._load_metadata()
         
+        # Metadata changes are coalesced and written by a delayed flush task
+        self._metadata_flush_interval = metadata_flush_interval
+        self._metadata_dirty = False
+        self._flush_lock = Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        
+        # Long-lived shelf, opened once and shared by all operations under
+        # self._lock; reopened only by clear() and released by close()
+        self._shelf = shelve.open(self.cache_path, flag='c', protocol=_SHELF_PROTOCOL)
+        
+        # All shelf work is serialized by self._lock, so it runs on a single
+        # dedicated thread rather than tying up workers of the loop's default pool
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"disk-cache-{namespace}"
+        )
+        
+        # Write-behind buffer of key -> (value, expiry) not yet on disk. Reads
+        # check it first; entries leave it only once written under self._lock
+        self._write_behind = write_behind
+        self._write_behind_batch_size = write_behind_batch_size
+        self._write_behind_max_pending = write_behind_max_pending
+        self._pending: Dict[str, Tuple[Any, float]] = {}
+        self._drain_task: Optional[asyncio.Task] = None
+        
         # Circuit breakers for disk operations
         self._shelve_get_breaker = CircuitBreaker(
             failure_threshold=retry_attempts,
@@ -63,48 +126,301 @@ class DiskLayer(BaseCacheLayer):
         )
     
     def _load_metadata(self) -> None:
-        """Load metadata from disk if it exists."""
+        """Load the metadata snapshot, replay the journal and open it for appending."""
         try:
             # Create parent directory for metadata file if it doesn't exist
             metadata_dir = os.path.dirname(self._metadata_path)
             os.makedirs(metadata_dir, exist_ok=True)
             
-            # Create empty metadata if file doesn't exist
-            if not os.path.exists(self._metadata_path):
-                with shelve.open(self._metadata_path, flag='c') as shelf:
-                    # Initialize empty shelf
-                    pass
-                self._metadata = {}
-                return
+            journal_id = 0
+            migrated = False
+            # whichdb names the dbm module for a shelve, and returns "" for
+            # a pickled snapshot and None when there is no metadata at all
+            if dbm.whichdb(self._metadata_path):
+                # Metadata written as a shelve by earlier versions
+                with shelve.open(self._metadata_path, flag='r') as shelf:
+                    metadata = dict(shelf)
+                migrated = True
+            elif os.path.exists(self._metadata_path):
+                with open(self._metadata_path, 'rb') as f:
+                    data = pickle.load(f)
+                if isinstance(data, tuple):
+                    journal_id, metadata = data
+                else:
+                    # Plain snapshot without a journal generation
+                    metadata = data
+            else:
+                metadata = {}
+            
+            records = self._replay_journal(metadata, journal_id)
+            
+            if migrated:
+                # Replaces a gdbm file in place; other formats leave files behind
+                self._write_snapshot(journal_id, metadata)
+                self._remove_legacy_metadata()
                 
-            # Load existing metadata
-            with shelve.open(self._metadata_path, flag='r') as shelf:
-                # Copy all items to our in-memory metadata
-                with self._lock:
-                    self._metadata = dict(shelf)
+            # Copy all items to our in-memory metadata
+            with self._lock:
+                self._metadata = metadata
+                self._journal_id = journal_id
+                self._journal_records = records
                     
         except Exception as e:
             logger.error(f"Failed to load cache metadata: {e}", 
                         extra={'correlation_id': self._correlation_id})
             # If we can't load, use empty metadata
             self._metadata = {}
+            self._journal_records = 0
+        
+        try:
+            if self._journal_records:
+                self._journal = open(self._journal_path, 'ab', buffering=0)
+            else:
+                self._start_journal(self._journal_id)
+        except Exception as e:
+            logger.error(f"Failed to open cache metadata journal: {e}", 
+                        extra={'correlation_id': self._correlation_id})
+    
+    def _remove_legacy_metadata(self) -> None:
+        """Delete the files of a metadata shelve migrated to a snapshot."""
+        for suffix in _LEGACY_METADATA_SUFFIXES:
+            path = f"{self._metadata_path}{suffix}"
+            if os.path.exists(path):
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    logger.warning(f"Failed to remove legacy metadata file {path}: {e}", 
+                                  extra={'correlation_id': self._correlation_id})
+    
+    def _write_snapshot(self, journal_id: int, snapshot: Dict[str, float]) -> None:
+        """Atomically replace the metadata snapshot.
+        
+        Args:
+            journal_id: Journal generation the snapshot covers
+            snapshot: Copy of the metadata to persist
+        """
+        tmp_path = f"{self._metadata_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((journal_id, snapshot), f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._metadata_path)
+    
+    def _replay_journal(self, metadata: Dict[str, float], journal_id: int) -> int:
+        """Apply journal records on top of a loaded snapshot.
+        
+        A journal from another generation is already covered by the snapshot
+        and is ignored. A truncated trailing record (from an interrupted
+        write) ends the replay and is cut off so new records append cleanly.
+        
+        Args:
+            metadata: Snapshot metadata, updated in place
+            journal_id: Generation of the loaded snapshot
+            
+        Returns:
+            int: Number of records applied
+        """
+        if not os.path.exists(self._journal_path):
+            return 0
+        with open(self._journal_path, 'rb') as f:
+            data = f.read()
+        if len(data) < _JOURNAL_HEADER.size or _JOURNAL_HEADER.unpack_from(data)[0] != journal_id:
+            return 0
+        
+        records = 0
+        offset = _JOURNAL_HEADER.size
+        record_size = _JOURNAL_RECORD.size
+        while offset + record_size <= len(data):
+            op, expiry, key_len = _JOURNAL_RECORD.unpack_from(data, offset)
+            end = offset + record_size + key_len
+            if end > len(data):
+                break
+            key = data[offset + record_size:end].decode('utf-8')
+            offset = end
+            if op == _OP_SET:
+                metadata[key] = expiry
+            elif op == _OP_DELETE:
+                metadata.pop(key, None)
+            elif op == _OP_CLEAR:
+                metadata.clear()
+            records += 1
+        
+        if offset < len(data):
+            os.truncate(self._journal_path, offset)
+        return records
+    
+    def _start_journal(self, journal_id: int) -> None:
+        """Atomically replace the journal with an empty one for a generation.
+        
+        Args:
+            journal_id: Generation written to the journal header
+        """
+        tmp_path = f"{self._journal_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_JOURNAL_HEADER.pack(journal_id))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._journal_path)
+        
+        if self._journal is not None:
+            self._journal.close()
+        self._journal = open(self._journal_path, 'ab', buffering=0)
+    
+    def _journal_append(self, op: int, key: str = "", expiry: float = 0.0) -> None:
+        """Queue a metadata change for the next flush. Caller must hold self._lock.
+        
+        Args:
+            op: One of the _OP_* journal operations
+            key: The cache key the change applies to
+            expiry: The expiry timestamp for set operations
+        """
+        key_bytes = key.encode('utf-8')
+        self._journal_buffer.append(_JOURNAL_RECORD.pack(op, expiry, len(key_bytes)) + key_bytes)
+        # Marked under the same lock so a concurrent flush never sees the
+        # record without the flag
+        self._metadata_dirty = True
     
     def _save_metadata(self) -> None:
-        """Save metadata to disk."""
+        """Mark metadata as changed and schedule a coalesced flush.
+        
+        Safe to call from executor threads; the flush is scheduled once the
+        calling coroutine is back on the event loop.
+        """
+        with self._lock:
+            self._metadata_dirty = True
+        self._schedule_flush()
+    
+    def _schedule_flush(self) -> None:
+        """Start a delayed metadata flush unless one is already pending."""
+        if not self._metadata_dirty:
+            return
+        if self._flush_task is not None and not self._flush_task.done():
+            return
         try:
-            # Ensure directory exists
-            metadata_dir = os.path.dirname(self._metadata_path)
-            os.makedirs(metadata_dir, exist_ok=True)
-            
-            with shelve.open(self._metadata_path, flag='n') as shelf:
-                # Save all items
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Not on the event loop (e.g. an executor thread)
+            return
+        self._flush_task = loop.create_task(self._delayed_flush())
+    
+    async def _delayed_flush(self) -> None:
+        """Wait for the flush interval, then write all pending metadata changes."""
+        await asyncio.sleep(self._metadata_flush_interval)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._flush_metadata)
+    
+    def _flush_metadata(self) -> None:
+        """Persist metadata changes made since the last flush.
+        
+        Pending records are appended to the journal with a single write and
+        fsync. When the journal has grown past twice the number of live keys,
+        it is compacted instead: a full snapshot is written to a temporary
+        file, fsynced and renamed over the old one, and a new journal
+        generation is started.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._metadata_dirty:
+                    return
+                records = self._journal_buffer
+                self._journal_buffer = []
+                self._metadata_dirty = False
+                total = self._journal_records + len(records)
+                compact = total > max(2 * len(self._metadata), _MIN_COMPACTION_RECORDS)
+                snapshot = dict(self._metadata) if compact else None
+            
+            try:
+                if compact:
+                    journal_id = self._journal_id + 1
+                    self._write_snapshot(journal_id, snapshot)
+                    self._start_journal(journal_id)
+                    self._journal_id = journal_id
+                    self._journal_records = 0
+                elif records:
+                    self._journal.write(b"".join(records))
+                    os.fsync(self._journal.fileno())
+                    self._journal_records = total
+            except Exception as e:
+                # Keep the changes queued so the next flush retries them
                 with self._lock:
-                    for key, value in self._metadata.items():
-                        shelf[key] = value
+                    self._journal_buffer[:0] = records
+                    self._metadata_dirty = True
+                logger.error(f"Failed to save cache metadata: {e}", 
+                            extra={'correlation_id': self._correlation_id})
+    
+    def _buffer_writes(self, key_values: Dict[str, Any], expiry_time: float) -> bool:
+        """Queue values for the background writer when write-behind is enabled.
+        
+        Args:
+            key_values: Dictionary mapping keys to values
+            expiry_time: The expiry timestamp
+            
+        Returns:
+            bool: True if the values were buffered, False if they must be written
+                through (write-behind disabled or the buffer is full)
+        """
+        if not self._write_behind or len(self._pending) >= self._write_behind_max_pending:
+            return False
+        with self._lock:
+            for key, value in key_values.items():
+                self._pending[key] = (value, expiry_time)
+        self._start_drain()
+        return True
+    
+    def _start_drain(self) -> None:
+        """Start the background writer unless it is already running or idle."""
+        if self._pending and (self._drain_task is None or self._drain_task.done()):
+            self._drain_task = asyncio.get_running_loop().create_task(self._drain_pending())
+    
+    def _get_pending(self, key: str) -> Tuple[bool, Any]:
+        """Look up a value that is buffered but not yet written to disk.
+        
+        Args:
+            key: The cache key
+            
+        Returns:
+            Tuple[bool, Any]: (found, value) tuple
+        """
+        entry = self._pending.get(key)
+        if entry is not None and time.time() <= entry[1]:
+            return True, entry[0]
+        return False, None
+    
+    async def _drain_pending(self) -> None:
+        """Write buffered values to disk in batches until the buffer is empty."""
+        loop = asyncio.get_running_loop()
+        try:
+            while self._pending:
+                await loop.run_in_executor(self._executor, self._sync_write_pending,
+                                           self._write_behind_batch_size)
+                self._schedule_flush()
         except Exception as e:
-            logger.error(f"Failed to save cache metadata: {e}", 
+            # Entries stay buffered; the next set or set_many restarts the drain
+            logger.error(f"Disk cache write-behind error: {e}", 
                         extra={'correlation_id': self._correlation_id})
     
+    def _sync_write_pending(self, limit: Optional[int] = None) -> None:
+        """Write up to limit buffered values to the shelf and metadata.
+        
+        Entries are selected and written under self._lock, so a concurrent
+        delete or clear that drops a buffered entry is never undone.
+        
+        Args:
+            limit: Maximum number of entries to write (all when None)
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            db = self._shelf
+            keys = list(self._pending)[:limit]
+            for key in keys:
+                value, expiry_time = self._pending[key]
+                db[key] = value
+                self._metadata[key] = expiry_time
+                self._journal_append(_OP_SET, key, expiry_time)
+                del self._pending[key]
+        self._save_metadata()
+    
     def _is_expired(self, key: str) -> bool:
         """Check if a key is expired based on metadata.
         
@@ -121,20 +437,32 @@ class DiskLayer(BaseCacheLayer):
             expiry_time = self._metadata[key]
             return time.time() > expiry_time
     
+    def _filter_valid(self, keys: List[str]) -> List[str]:
+        """Return the keys that are present and unexpired, checked under one lock.
+        
+        Args:
+            keys: The cache keys to check
+            
+        Returns:
+            List[str]: The live keys, in their original order
+        """
+        now = time.time()
+        with self._lock:
+            metadata = self._metadata
+            return [k for k in keys if metadata.get(k, 0.0) >= now]
+    
     def _clean_expired_keys(self) -> None:
         """Remove expired keys from metadata and optionally from the cache."""
         now = time.time()
-        to_remove = []
         
-        # Find expired keys
+        # Find expired keys in a single pass over the metadata
         with self._lock:
-            for key, expiry_time in self._metadata.items():
-                if now > expiry_time:
-                    to_remove.append(key)
+            to_remove = [key for key, expiry_time in self._metadata.items() if now > expiry_time]
             
             # Remove from metadata
             for key in to_remove:
                 del self._metadata[key]
+                self._journal_append(_OP_DELETE, key)
         
         # Save updated metadata
         if to_remove:
@@ -142,6 +470,43 @@ class DiskLayer(BaseCacheLayer):
             logger.debug(f"Removed {len(to_remove)} expired keys from disk cache metadata", 
                         extra={'correlation_id': self._correlation_id})
     
+    async def run_maintenance(self, func: Callable[[shelve.Shelf], List[str]]) -> List[str]:
+        """Run an external maintenance task against this layer's shelf.
+        
+        The shelf is kept open for the layer's lifetime, so other code must not
+        open the same file with its own handle: that handle's changes would be
+        overwritten when this one is closed. func runs on the layer's disk
+        thread under self._lock and returns the keys it deleted, whose
+        metadata is then dropped as well.
+        
+        Args:
+            func: Callable taking the open shelf and returning deleted keys
+            
+        Returns:
+            List[str]: The keys deleted by func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._sync_run_maintenance, func)
+    
+    def _sync_run_maintenance(self, func: Callable[[shelve.Shelf], List[str]]) -> List[str]:
+        """Synchronous implementation of run_maintenance.
+        
+        Args:
+            func: Callable taking the open shelf and returning deleted keys
+            
+        Returns:
+            List[str]: The keys deleted by func
+        """
+        with self._lock:
+            removed = func(self._shelf)
+            metadata = self._metadata
+            for key in removed:
+                if metadata.pop(key, None) is not None:
+                    self._journal_append(_OP_DELETE, key)
+        if removed:
+            self._save_metadata()
+        return removed
+    
     async def get(self, key: str) -> Tuple[bool, Any]:
         """Get a value from the disk cache.
         
@@ -151,6 +516,11 @@ class DiskLayer(BaseCacheLayer):
         Returns:
             Tuple[bool, Any]: (found, value) tuple
         """
+        if self._pending:
+            found, value = self._get_pending(key)
+            if found:
+                return True, value
+        
         # Check if key is expired first, to avoid disk access
         if self._is_expired(key):
             return False, None
@@ -158,9 +528,9 @@ class DiskLayer(BaseCacheLayer):
         try:
             @self._shelve_get_breaker
             async def _shelve_get(k: str):
-                # Use thread pool for blocking IO
+                # Use the layer's disk thread for blocking IO
                 loop = asyncio.get_running_loop()
-                return await loop.run_in_executor(None, self._sync_get, k)
+                return await loop.run_in_executor(self._executor, self._sync_get, k)
                 
             value = await _shelve_get(key)
             if value is not None:
@@ -181,13 +551,19 @@ class DiskLayer(BaseCacheLayer):
             Any: The cached value or None if not found
         """
         try:
-            # Check again if expired (could have changed while waiting)
-            if self._is_expired(key):
-                return None
+            with self._lock:
+                # Check again if expired (could have changed while waiting);
+                # a plain dict lookup under the lock already held for the read
+                expiry_time = self._metadata.get(key)
+                if expiry_time is None or time.time() > expiry_time:
+                    return None
                 
-            with shelve.open(self.cache_path, flag='r') as db:
-                if key in db:
-                    return db[key]
+                # One dbm probe: a missing key raises instead of a separate
+                # containment check
+                try:
+                    return self._shelf[key]
+                except KeyError:
+                    return None
         except Exception as e:
             logger.error(f"Error reading from disk cache: {e}", 
                         extra={'correlation_id': self._correlation_id})
@@ -210,13 +586,20 @@ class DiskLayer(BaseCacheLayer):
             expiry_seconds = ttl if ttl is not None else self.ttl
             expiry_time = time.time() + expiry_seconds
             
+            if self._buffer_writes({key: value}, expiry_time):
+                return True
+            
             @self._shelve_set_breaker
             async def _shelve_set(k: str, v: Any, t: float):
-                # Use thread pool for blocking IO
+                # Use the layer's disk thread for blocking IO
                 loop = asyncio.get_running_loop()
-                return await loop.run_in_executor(None, self._sync_set, k, v, t)
+                return await loop.run_in_executor(self._executor, self._sync_set, k, v, t)
             
             success = await _shelve_set(key, value, expiry_time)
+            # Metadata was marked dirty in the executor thread
+            self._schedule_flush()
+            # The buffer may be full with no buffered write left to drain it
+            self._start_drain()
             return success
             
         except Exception as e:
@@ -236,13 +619,13 @@ class DiskLayer(BaseCacheLayer):
             bool: True if set successfully
         """
         try:
-            # Set the value in the shelve
-            with shelve.open(self.cache_path, flag='c') as db:
-                db[key] = value
-                
-            # Update metadata
+            # Set the value in the shelve and update metadata; a buffered
+            # older value is dropped so neither reads nor the drain revive it
             with self._lock:
+                self._pending.pop(key, None)
+                self._shelf[key] = value
                 self._metadata[key] = expiry_time
+                self._journal_append(_OP_SET, key, expiry_time)
             
             self._save_metadata()
             return True
@@ -263,19 +646,21 @@ class DiskLayer(BaseCacheLayer):
             bool: True if deleted successfully
         """
         try:
-            # Check if key exists in metadata
+            # Check if key exists in metadata (or is still buffered)
             with self._lock:
+                buffered = self._pending.pop(key, None) is not None
                 exists = key in self._metadata
                 if exists:
                     del self._metadata[key]
+                    self._journal_append(_OP_DELETE, key)
                     self._save_metadata()
             
             if not exists:
-                return False
+                return buffered
                 
             # Delete from shelve
             loop = asyncio.get_running_loop()
-            return await loop.run_in_executor(None, self._sync_delete, key)
+            return await loop.run_in_executor(self._executor, self._sync_delete, key)
             
         except Exception as e:
             logger.error(f"Disk cache delete error: {e}", 
@@ -292,7 +677,8 @@ class DiskLayer(BaseCacheLayer):
             bool: True if deleted successfully
         """
         try:
-            with shelve.open(self.cache_path, flag='w') as db:
+            with self._lock:
+                db = self._shelf
                 if key in db:
                     del db[key]
                     return True
@@ -315,20 +701,29 @@ class DiskLayer(BaseCacheLayer):
             return {}
             
         result = {}
+        if self._pending:
+            # Serve buffered writes first; only the rest go to disk
+            for key in keys:
+                found, value = self._get_pending(key)
+                if found:
+                    result[key] = value
+            if result:
+                keys = [k for k in keys if k not in result]
+        
         # Filter out expired keys
-        valid_keys = [k for k in keys if not self._is_expired(k)]
+        valid_keys = self._filter_valid(keys)
         
         if not valid_keys:
-            return {}
+            return result
             
         try:
             @self._shelve_get_breaker
             async def _shelve_get_many(ks: List[str]) -> Dict[str, Any]:
-                # Use thread pool for blocking IO
+                # Use the layer's disk thread for blocking IO
                 loop = asyncio.get_running_loop()
-                return await loop.run_in_executor(None, self._sync_get_many, ks)
+                return await loop.run_in_executor(self._executor, self._sync_get_many, ks)
                 
-            result = await _shelve_get_many(valid_keys)
+            result.update(await _shelve_get_many(valid_keys))
             
         except Exception as e:
             logger.error(f"Disk cache get_many error: {e}", 
@@ -347,10 +742,13 @@ class DiskLayer(BaseCacheLayer):
         """
         result = {}
         try:
-            with shelve.open(self.cache_path, flag='r') as db:
+            with self._lock:
+                db = self._shelf
                 for key in keys:
-                    if key in db:
+                    try:
                         result[key] = db[key]
+                    except KeyError:
+                        pass
         except Exception as e:
             logger.error(f"Error reading multiple keys from disk cache: {e}", 
                         extra={'correlation_id': self._correlation_id})
@@ -375,13 +773,20 @@ class DiskLayer(BaseCacheLayer):
             expiry_seconds = ttl if ttl is not None else self.ttl
             expiry_time = time.time() + expiry_seconds
             
+            if self._buffer_writes(key_values, expiry_time):
+                return True
+            
             @self._shelve_set_breaker
             async def _shelve_set_many(kv_dict: Dict[str, Any], t: float):
-                # Use thread pool for blocking IO
+                # Use the layer's disk thread for blocking IO
                 loop = asyncio.get_running_loop()
-                return await loop.run_in_executor(None, self._sync_set_many, kv_dict, t)
+                return await loop.run_in_executor(self._executor, self._sync_set_many, kv_dict, t)
             
             success = await _shelve_set_many(key_values, expiry_time)
+            # Metadata was marked dirty in the executor thread
+            self._schedule_flush()
+            # The buffer may be full with no buffered write left to drain it
+            self._start_drain()
             return success
             
         except Exception as e:
@@ -400,15 +805,16 @@ class DiskLayer(BaseCacheLayer):
             bool: True if all values were set successfully
         """
         try:
-            # Set the values in the shelve
-            with shelve.open(self.cache_path, flag='c') as db:
+            # Set the values in the shelve and update metadata, dropping any
+            # older buffered values for the same keys
+            with self._lock:
+                db = self._shelf
+                pending = self._pending
                 for key, value in key_values.items():
+                    pending.pop(key, None)
                     db[key] = value
-                    
-            # Update metadata
-            with self._lock:
-                for key in key_values.keys():
                     self._metadata[key] = expiry_time
+                    self._journal_append(_OP_SET, key, expiry_time)
             
             self._save_metadata()
             return True
@@ -428,14 +834,17 @@ class DiskLayer(BaseCacheLayer):
             bool: True if cleared successfully
         """
         try:
-            # Clear all metadata
+            # Clear all metadata and any buffered writes
             with self._lock:
+                self._pending.clear()
                 self._metadata.clear()
+                self._journal_buffer.clear()
+                self._journal_append(_OP_CLEAR)
                 self._save_metadata()
             
             # Delete and recreate the shelve file
             loop = asyncio.get_running_loop()
-            success = await loop.run_in_executor(None, self._sync_clear)
+            success = await loop.run_in_executor(self._executor, self._sync_clear)
             
             logger.info(f"Cleared disk cache at {self.cache_path}", 
                        extra={'correlation_id': self._correlation_id})
@@ -453,21 +862,22 @@ class DiskLayer(BaseCacheLayer):
             bool: True if cleared successfully
         """
         try:
-            # Try to safely close and delete the shelve file
-            db_extensions = [".bak", ".dat", ".dir"]
-            
-            for ext in db_extensions:
-                path = f"{self.cache_path}{ext}"
-                if os.path.exists(path):
-                    try:
-                        os.remove(path)
-                    except Exception as e:
-                        logger.warning(f"Failed to remove cache file {path}: {e}", 
-                                      extra={'correlation_id': self._correlation_id})
-            
-            # Create a fresh empty shelve
-            with shelve.open(self.cache_path, flag='n'):
-                pass
+            with self._lock:
+                # Close the shelf before deleting its files
+                self._shelf.close()
+                db_extensions = [".bak", ".dat", ".dir"]
+                
+                for ext in db_extensions:
+                    path = f"{self.cache_path}{ext}"
+                    if os.path.exists(path):
+                        try:
+                            os.remove(path)
+                        except Exception as e:
+                            logger.warning(f"Failed to remove cache file {path}: {e}", 
+                                          extra={'correlation_id': self._correlation_id})
+                
+                # Reopen as a fresh empty shelve
+                self._shelf = shelve.open(self.cache_path, flag='n', protocol=_SHELF_PROTOCOL)
                 
             return True
         except Exception as e:
@@ -480,5 +890,31 @@ class DiskLayer(BaseCacheLayer):
         
         This should be called when the cache is no longer needed.
         """
-        # Save metadata one final time
-        self._save_metadata() 
\ No newline at end of file
+        # Write any buffered values before the final metadata flush
+        if self._drain_task is not None and not self._drain_task.done():
+            self._drain_task.cancel()
+        self._drain_task = None
+        try:
+            self._sync_write_pending()
+        except Exception as e:
+            logger.error(f"Error writing buffered disk cache values: {e}", 
+                        extra={'correlation_id': self._correlation_id})
+        
+        # Cancel any pending delayed flush and write metadata one final time
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._flush_task = None
+        self._flush_metadata()
+        
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        
+        with self._lock:
+            try:
+                self._shelf.close()
+            except Exception as e:
+                logger.error(f"Error closing disk cache: {e}", 
+                            extra={'correlation_id': self._correlation_id})
+        
+        self._executor.shutdown(wait=False)
\ No newline at end of file
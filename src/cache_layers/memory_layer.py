@@ -1,16 +1,20 @@
 """In-memory cache layer implementation."""
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
-from threading import RLock
+import time
+from threading import Lock
 from typing import Any, Dict, List, Optional, Tuple
 from collections import OrderedDict
 
 from .base_layer import BaseCacheLayer
-from ..cache_config import EvictionPolicy
+from ..cache_enums import EvictionPolicy
 
 logger = logging.getLogger(__name__)
 
+# Sentinel distinguishing a missing key from a cached None
+_MISSING = object()
+
 class MemoryLayer(BaseCacheLayer):
     """In-memory cache layer implementation.
     
@@ -32,25 +36,221 @@ class MemoryLayer(BaseCacheLayer):
         self.max_size = max_size
         self.eviction_policy = eviction_policy
         
-        # Cache storage
+        # Cache storage; expiry deadlines are time.monotonic() values
         self._cache: Dict[str, Any] = {}
-        self._timestamps: Dict[str, datetime] = {}
+        self._timestamps: Dict[str, float] = {}
+        
+        # For eviction policy tracking; not re-entrant, so helpers that run
+        # with it held come in *_locked variants
+        self._keys_lock = Lock()
         
-        # For eviction policy tracking
-        self._keys_lock = RLock()
+        # Keys in insertion (FIFO/LFU) or access (LRU) order. The OrderedDict
+        # is only ever cleared, never replaced, so its move_to_end can be
+        # bound once for the LRU hot path.
+        self._cached_keys = OrderedDict()
+        self._move_to_end = self._cached_keys.move_to_end
         
-        # Use appropriate data structures based on eviction policy
+        # The policy is fixed for the layer's lifetime, so its tracking hooks
+        # are bound once here instead of being chosen on every operation
         if self.eviction_policy == EvictionPolicy.LRU:
-            # For LRU, we use OrderedDict to track access order
-            self._cached_keys = OrderedDict()
+            # For LRU, hits and inserts move the key to the end of the OrderedDict
+            self._on_hit = self._on_hit_lru
+            self._on_insert = self._on_insert_lru
+            self._on_remove = self._untracked
+            self._pop_victim = self._pop_oldest
         elif self.eviction_policy == EvictionPolicy.FIFO:
-            # For FIFO, we use OrderedDict without reordering on access
-            self._cached_keys = OrderedDict()
+            # For FIFO, the OrderedDict keeps insertion order and hits are ignored
+            self._on_hit = self._untracked
+            self._on_insert = self._on_insert_fifo
+            self._on_remove = self._untracked
+            self._pop_victim = self._pop_oldest
         elif self.eviction_policy == EvictionPolicy.LFU:
-            # For LFU, we use OrderedDict for consistent iteration and Counter for frequencies
-            from collections import Counter
-            self._cached_keys = OrderedDict()
-            self._access_frequencies = Counter()
+            # For LFU, keys are grouped into per-frequency buckets so the least
+            # frequently used key is found without scanning the whole cache
+            self._access_frequencies: Dict[str, int] = {}
+            self._freq_buckets: Dict[int, OrderedDict] = {}
+            self._min_freq = 0
+            self._on_hit = self._on_hit_lfu
+            self._on_insert = self._on_insert_lfu
+            self._on_remove = self._lfu_forget
+            self._pop_victim = self._pop_lfu
+        elif self.eviction_policy == EvictionPolicy.CLOCK:
+            # For CLOCK, hits only flag the key as referenced; the OrderedDict is
+            # the clock face and eviction gives flagged keys a second chance
+            self._referenced: set = set()
+            self._on_hit = self._referenced.add
+            self._on_insert = self._on_insert_clock
+            self._on_remove = self._referenced.discard
+            self._pop_victim = self._pop_clock
+    
+    def _untracked(self, key: str) -> None:
+        """Policy hook for events the eviction policy does not track.
+        
+        Args:
+            key: The cache key
+        """
+    
+    def _on_hit_lru(self, key: str) -> None:
+        """Mark a key as most recently used after a cache hit.
+        
+        A single OrderedDict operation is atomic under the GIL, so no lock
+        is taken.
+        
+        Args:
+            key: The cache key that was read
+        """
+        try:
+            self._move_to_end(key)
+        except KeyError:
+            # Evicted by another thread since the lookup
+            pass
+    
+    def _on_hit_lfu(self, key: str) -> None:
+        """Bump a key's access frequency after a cache hit.
+        
+        Args:
+            key: The cache key that was read
+        """
+        with self._keys_lock:
+            if key in self._cached_keys:
+                self._lfu_touch(key)
+    
+    def _on_insert_lru(self, key: str) -> None:
+        """Track a stored key as most recently used. Caller must hold self._keys_lock.
+        
+        Args:
+            key: The cache key that was stored
+        """
+        self._cached_keys[key] = True
+        self._move_to_end(key)
+    
+    def _on_insert_fifo(self, key: str) -> None:
+        """Track a stored key, keeping its original position if already present.
+        
+        Caller must hold self._keys_lock.
+        
+        Args:
+            key: The cache key that was stored
+        """
+        self._cached_keys[key] = True
+    
+    def _on_insert_lfu(self, key: str) -> None:
+        """Track a stored key and bump its access frequency. Caller must hold self._keys_lock.
+        
+        Args:
+            key: The cache key that was stored
+        """
+        self._cached_keys[key] = True
+        self._lfu_touch(key)
+    
+    def _on_insert_clock(self, key: str) -> None:
+        """Track a stored key; overwriting a tracked key counts as a reference.
+        
+        Caller must hold self._keys_lock.
+        
+        Args:
+            key: The cache key that was stored
+        """
+        if key in self._cached_keys:
+            self._referenced.add(key)
+        else:
+            self._cached_keys[key] = True
+    
+    def _pop_clock(self) -> str:
+        """Advance the clock hand to the first unreferenced key and remove it.
+        
+        Referenced keys passed by the hand lose their flag and move behind it.
+        Caller must hold self._keys_lock.
+        
+        Returns:
+            str: The evicted key
+        """
+        cached_keys = self._cached_keys
+        referenced = self._referenced
+        while True:
+            old_key, _ = cached_keys.popitem(last=False)
+            if old_key not in referenced:
+                return old_key
+            referenced.discard(old_key)
+            cached_keys[old_key] = True
+    
+    def _pop_oldest(self) -> str:
+        """Remove and return the first tracked key. Caller must hold self._keys_lock.
+        
+        Returns:
+            str: The evicted key
+        """
+        old_key, _ = self._cached_keys.popitem(last=False)
+        return old_key
+    
+    def _pop_lfu(self) -> str:
+        """Remove and return the least frequently used key. Caller must hold self._keys_lock.
+        
+        Returns:
+            str: The evicted key
+        """
+        if not self._freq_buckets:
+            # Fallback if frequencies are somehow empty
+            return self._pop_oldest()
+        old_key = self._lfu_pop()
+        del self._cached_keys[old_key]
+        return old_key
+    
+    def _lfu_touch(self, key: str) -> None:
+        """Increment a key's access frequency. Caller must hold self._keys_lock.
+        
+        Args:
+            key: The cache key that was set or accessed
+        """
+        freq = self._access_frequencies.get(key, 0)
+        if freq:
+            bucket = self._freq_buckets[freq]
+            del bucket[key]
+            if not bucket:
+                del self._freq_buckets[freq]
+                if self._min_freq == freq:
+                    self._min_freq = freq + 1
+        else:
+            self._min_freq = 1
+        
+        self._access_frequencies[key] = freq + 1
+        bucket = self._freq_buckets.get(freq + 1)
+        if bucket is None:
+            bucket = self._freq_buckets[freq + 1] = OrderedDict()
+        bucket[key] = None
+    
+    def _lfu_forget(self, key: str) -> None:
+        """Drop a key from LFU tracking. Caller must hold self._keys_lock.
+        
+        Args:
+            key: The cache key being removed
+        """
+        freq = self._access_frequencies.pop(key, 0)
+        if freq:
+            bucket = self._freq_buckets[freq]
+            del bucket[key]
+            if not bucket:
+                del self._freq_buckets[freq]
+    
+    def _lfu_pop(self) -> str:
+        """Remove and return the least frequently used key. Caller must hold self._keys_lock.
+        
+        Ties are broken by evicting the key that reached that frequency first.
+        
+        Returns:
+            str: The evicted key
+        """
+        bucket = self._freq_buckets.get(self._min_freq)
+        if bucket is None:
+            # The minimum bucket was emptied by a removal; find the next one
+            self._min_freq = min(self._freq_buckets)
+            bucket = self._freq_buckets[self._min_freq]
+        
+        old_key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self._freq_buckets[self._min_freq]
+        del self._access_frequencies[old_key]
+        return old_key
     
     def _evict_if_needed(self) -> None:
         """Evict the least valuable cached key if the cache exceeds the maximum size.
@@ -59,42 +259,24 @@ class MemoryLayer(BaseCacheLayer):
         The eviction strategy depends on the configured policy.
         """
         with self._keys_lock:
-            if len(self._cached_keys) > self.max_size:
-                # Remove keys until we're within limit
-                evicted_keys = []
-                
-                while len(self._cached_keys) > self.max_size:
-                    # Choose which key to evict based on the policy
-                    if self.eviction_policy == EvictionPolicy.LRU:
-                        # LRU - remove least recently used (first item in OrderedDict)
-                        old_key, _ = self._cached_keys.popitem(last=False)
-                    elif self.eviction_policy == EvictionPolicy.FIFO:
-                        # FIFO - also remove first item (oldest added)
-                        old_key, _ = self._cached_keys.popitem(last=False)
-                    elif self.eviction_policy == EvictionPolicy.LFU:
-                        # LFU - remove least frequently used
-                        # Find key with minimum access frequency
-                        if self._access_frequencies:
-                            old_key = min(self._cached_keys.keys(), 
-                                          key=lambda k: self._access_frequencies[k])
-                            del self._cached_keys[old_key]
-                            del self._access_frequencies[old_key]
-                        else:
-                            # Fallback if frequencies are somehow empty
-                            old_key, _ = self._cached_keys.popitem(last=False)
-                    
-                    evicted_keys.append(old_key)
+            self._evict_if_needed_locked()
+    
+    def _evict_if_needed_locked(self) -> None:
+        """Evict keys until the cache is within its maximum size. Caller must hold self._keys_lock."""
+        if len(self._cached_keys) > self.max_size:
+            debug = logger.isEnabledFor(logging.DEBUG)
+            
+            # Remove keys until we're within limit, dropping each from the
+            # cache as soon as the policy picks it
+            while len(self._cached_keys) > self.max_size:
+                old_key = self._pop_victim()
+                self._cache.pop(old_key, None)
+                self._timestamps.pop(old_key, None)
+                if debug:
                     logger.debug(
                         f"Evicting key: {old_key} from memory cache using {self.eviction_policy} policy", 
                         extra={'correlation_id': self._correlation_id}
                     )
-                
-                # Remove the keys from the cache
-                for key in evicted_keys:
-                    if key in self._cache:
-                        del self._cache[key]
-                    if key in self._timestamps:
-                        del self._timestamps[key]
     
     def _is_expired(self, key: str) -> bool:
         """Check if a key is expired.
@@ -109,23 +291,56 @@ class MemoryLayer(BaseCacheLayer):
             return True
             
         timestamp = self._timestamps[key]
-        return datetime.now() > timestamp
+        return time.monotonic() > timestamp
 
     def _clean_expired(self) -> None:
         """Remove expired items from the cache."""
-        now = datetime.now()
-        expired_keys = []
+        now = time.monotonic()
+        
+        # Collect and remove expired keys under one lock acquisition
+        with self._keys_lock:
+            expired_keys = [key for key, timestamp in self._timestamps.items() if now > timestamp]
+            for key in expired_keys:
+                self._remove_key_locked(key)
+    
+    async def sweep_expired(self, batch_size: int = 1024) -> int:
+        """Remove expired entries in bounded batches, yielding between them.
         
-        for key, timestamp in self._timestamps.items():
-            if now > timestamp:
-                expired_keys.append(key)
+        Unlike _clean_expired, the lock is only held for one batch at a time
+        so a large sweep never stalls concurrent callers for long.
         
-        for key in expired_keys:
-            self._remove_key(key)
+        Args:
+            batch_size: Maximum number of entries checked per lock acquisition
+            
+        Returns:
+            int: Number of entries removed
+        """
+        now = time.monotonic()
+        candidates = [key for key, timestamp in list(self._timestamps.items()) if now > timestamp]
+        removed = 0
+        for start in range(0, len(candidates), batch_size):
+            with self._keys_lock:
+                for key in candidates[start:start + batch_size]:
+                    # The key may have been refreshed since the snapshot
+                    timestamp = self._timestamps.get(key)
+                    if timestamp is not None and now > timestamp:
+                        self._remove_key_locked(key)
+                        removed += 1
+            await asyncio.sleep(0)
+        return removed
     
     def _remove_key(self, key: str) -> None:
         """Remove a key from all internal data structures.
         
+        Args:
+            key: The cache key to remove
+        """
+        with self._keys_lock:
+            self._remove_key_locked(key)
+    
+    def _remove_key_locked(self, key: str) -> None:
+        """Remove a key from all internal data structures. Caller must hold self._keys_lock.
+        
         Args:
             key: The cache key to remove
         """
@@ -136,11 +351,33 @@ class MemoryLayer(BaseCacheLayer):
             del self._timestamps[key]
             
         # Remove from eviction tracking
-        with self._keys_lock:
-            if key in self._cached_keys:
-                del self._cached_keys[key]
-            if self.eviction_policy == EvictionPolicy.LFU and key in self._access_frequencies:
-                del self._access_frequencies[key]
+        if key in self._cached_keys:
+            del self._cached_keys[key]
+        self._on_remove(key)
+    
+    def _lookup(self, key: str) -> Any:
+        """Look up a key, dropping it if expired and recording the hit otherwise.
+        
+        Args:
+            key: The cache key
+            
+        Returns:
+            Any: The cached value, or _MISSING if absent or expired
+        """
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            return _MISSING
+        
+        if self._is_expired(key):
+            # Expired, remove it
+            self._remove_key(key)
+            return _MISSING
+        
+        # Update access tracking based on policy. Only LFU takes the lock
+        # here; LRU's single move_to_end is atomic and FIFO tracks nothing.
+        self._on_hit(key)
+        
+        return value
     
     async def get(self, key: str) -> Tuple[bool, Any]:
         """Get a value from the memory cache.
@@ -151,25 +388,10 @@ class MemoryLayer(BaseCacheLayer):
         Returns:
             Tuple[bool, Any]: (found, value) tuple
         """
-        if key in self._cache:
-            # Check expiration
-            if not self._is_expired(key):
-                # Update access tracking based on policy
-                with self._keys_lock:
-                    if self.eviction_policy == EvictionPolicy.LRU:
-                        # Move to end of OrderedDict to mark as recently used
-                        if key in self._cached_keys:
-                            self._cached_keys.move_to_end(key)
-                    elif self.eviction_policy == EvictionPolicy.LFU:
-                        # Increment access frequency
-                        self._access_frequencies[key] += 1
-                
-                return True, self._cache[key]
-            else:
-                # Expired, remove it
-                self._remove_key(key)
-        
-        return False, None
+        value = self._lookup(key)
+        if value is _MISSING:
+            return False, None
+        return True, value
         
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """Set a value in the memory cache.
@@ -188,22 +410,14 @@ class MemoryLayer(BaseCacheLayer):
             
             # Calculate expiry time
             expiry_seconds = ttl if ttl is not None else self.ttl
-            self._timestamps[key] = datetime.now() + timedelta(seconds=expiry_seconds)
+            self._timestamps[key] = time.monotonic() + expiry_seconds
             
             # Update eviction tracking
             with self._keys_lock:
-                self._cached_keys[key] = True
-                
-                # Handle different eviction policies
-                if self.eviction_policy == EvictionPolicy.LRU:
-                    # For LRU, move to end to mark as recently used
-                    self._cached_keys.move_to_end(key)
-                elif self.eviction_policy == EvictionPolicy.LFU:
-                    # For LFU, initialize or increment access counter
-                    self._access_frequencies[key] += 1
+                self._on_insert(key)
                 
                 # Check if we need to evict keys
-                self._evict_if_needed()
+                self._evict_if_needed_locked()
             
             return True
         except Exception as e:
@@ -235,9 +449,12 @@ class MemoryLayer(BaseCacheLayer):
         """
         result = {}
         
+        # Plain synchronous loop; awaiting get() per key would add a
+        # coroutine round-trip for every key with no I/O to wait on
+        lookup = self._lookup
         for key in keys:
-            found, value = await self.get(key)
-            if found:
+            value = lookup(key)
+            if value is not _MISSING:
                 result[key] = value
         
         return result
@@ -252,12 +469,24 @@ class MemoryLayer(BaseCacheLayer):
         Returns:
             bool: True if all values were set successfully
         """
-        success = True
-        
-        for key, value in key_values.items():
-            success = await self.set(key, value, ttl) and success
-        
-        return success
+        try:
+            expiry_seconds = ttl if ttl is not None else self.ttl
+            expiry_time = time.monotonic() + expiry_seconds
+            
+            # Store every entry under one lock, then evict once for the batch
+            on_insert = self._on_insert
+            with self._keys_lock:
+                for key, value in key_values.items():
+                    self._cache[key] = value
+                    self._timestamps[key] = expiry_time
+                    on_insert(key)
+                
+                self._evict_if_needed_locked()
+            
+            return True
+        except Exception as e:
+            logger.error(f"Memory layer set_many error: {e}", extra={'correlation_id': self._correlation_id})
+            return False
     
     async def clear(self) -> bool:
         """Clear all values in the memory cache.
@@ -273,6 +502,10 @@ class MemoryLayer(BaseCacheLayer):
                 self._cached_keys.clear()
                 if self.eviction_policy == EvictionPolicy.LFU:
                     self._access_frequencies.clear()
+                    self._freq_buckets.clear()
+                    self._min_freq = 0
+                elif self.eviction_policy == EvictionPolicy.CLOCK:
+                    self._referenced.clear()
             
             return True
         except Exception as e:
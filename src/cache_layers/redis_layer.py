@@ -1,11 +1,17 @@
 """Redis cache layer implementation."""
 
+import asyncio
+import functools
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+import math
+import random
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from ..core.exceptions import CacheSerializationError
 from ..core.circuit_breaker import CircuitBreaker
-from ..utils.serialization import serialize, deserialize
+from ..utils.serialization import (
+    serialize, serialize_uncompressed, deserialize, make_batch_serializer
+)
 from .base_layer import BaseCacheLayer
 
 logger = logging.getLogger(__name__)
@@ -13,13 +19,40 @@ logger = logging.getLogger(__name__)
 # Try to import the async redis client
 try:
     import redis.asyncio as redis
+    from redis.exceptions import ConnectionError as RedisConnectionError
+    from redis.exceptions import TimeoutError as RedisTimeoutError
+    from redis.utils import HIREDIS_AVAILABLE
     HAS_REDIS = True
+    _TRANSIENT_ERRORS = (RedisConnectionError, RedisTimeoutError, ConnectionError, TimeoutError)
 except ImportError:
     redis = None
+    HIREDIS_AVAILABLE = False
     HAS_REDIS = False
+    _TRANSIENT_ERRORS = (ConnectionError, TimeoutError)
     logger.warning("redis-py not installed or doesn't have async support",
                   extra={'correlation_id': 'INIT'})
 
+# Upper bound on keys per MGET / set_many script call, keeping request and
+# reply buffers (and the time a script holds the server) bounded
+_BATCH_SIZE = 512
+
+# Payload size above which values and batches are encoded or decoded in a
+# worker thread
+_OFFLOAD_BYTES = 64 * 1024
+
+# Sets every key in KEYS to the matching ARGV value with one shared TTL
+# (ARGV[1]) in a single server round-trip
+_SET_MANY_SCRIPT = """
+local ttl = ARGV[1]
+for i, key in ipairs(KEYS) do
+    redis.call('SET', key, ARGV[i + 1], 'EX', ttl)
+end
+return #KEYS
+"""
+
+# Keys examined per SCAN step in clear(); each step is one short server call
+_CLEAR_SCAN_COUNT = 5000
+
 class RedisLayer(BaseCacheLayer):
     """Redis cache layer implementation.
     
@@ -31,7 +64,10 @@ class RedisLayer(BaseCacheLayer):
                  retry_attempts: int = 3, retry_delay: int = 2,
                  enable_compression: bool = False,
                  compression_min_size: int = 1024,
-                 compression_level: int = 6):
+                 compression_level: int = 1,
+                 compression_dict: Optional[bytes] = None,
+                 max_connections: int = 32,
+                 bulkhead_capacity: Optional[int] = None):
         """Initialize the Redis cache layer.
         
         Args:
@@ -42,7 +78,19 @@ class RedisLayer(BaseCacheLayer):
             retry_delay: Delay between retries in seconds
             enable_compression: Whether to enable compression
             compression_min_size: Minimum size for compression to be applied
-            compression_level: Compression level (1-9) for zlib
+            compression_level: Compression level (1-9) for zlib. Levels 1-3 suit
+                cache values: higher levels cost several times the CPU per set
+                for a few percent smaller payloads
+            compression_dict: Optional preset dictionary built with
+                build_compression_dict() from sample values. It makes small
+                values compressible, so compression_min_size can drop to about
+                256 bytes. Every process sharing the namespace needs the same one.
+                Not exposed through CacheConfig; pass it when constructing the
+                layer directly
+            max_connections: Upper bound on pooled connections; concurrent
+                requests (e.g. chunked get_many/set_many) each hold one
+            bulkhead_capacity: Maximum Redis commands in flight at once for this
+                layer; extra callers wait their turn. Defaults to max_connections
         """
         super().__init__(namespace, ttl)
         
@@ -50,14 +98,39 @@ class RedisLayer(BaseCacheLayer):
             raise ImportError("Redis support requires redis-py with async support. "
                               "Install with 'pip install redis[hiredis]'")
             
+        if not HIREDIS_AVAILABLE:
+            # redis-py picks the hiredis parser automatically when installed;
+            # without it replies are parsed in pure Python
+            logger.warning("hiredis not installed; Redis replies will be parsed in pure Python. "
+                           "Install with 'pip install redis[hiredis]'",
+                           extra={'correlation_id': self._correlation_id})
+        
         self.redis_url = redis_url
+        # Only a real namespace can be cleared without touching other data
+        self._clear_pattern = f"{namespace}:*" if namespace != "default" else None
+        self.retry_attempts = retry_attempts
+        self.retry_delay = retry_delay
+        self.max_connections = max_connections
         self.enable_compression = enable_compression
         self.compression_min_size = compression_min_size
         self.compression_level = compression_level
+        self.compression_dict = compression_dict
+        
+        # Bound once so reads don't rebuild it per value
+        self._decode = (functools.partial(deserialize, compression_dict=compression_dict)
+                        if compression_dict else deserialize)
         
         # Redis client instances
         self._redis_client = None
         self._connection_pool = None
+        self._set_many_script = None
+        
+        # Bulkhead capping concurrent commands so bursts queue here instead of
+        # piling up on the pool and its reply buffers
+        self._bulkhead = asyncio.Semaphore(bulkhead_capacity or max_connections)
+        
+        # In-flight set_many(wait=False) writes
+        self._background_writes: Set[asyncio.Task] = set()
         
         # Circuit breakers for Redis operations
         self._redis_get_breaker = CircuitBreaker(
@@ -71,6 +144,12 @@ class RedisLayer(BaseCacheLayer):
             reset_timeout=retry_delay * 5,
             operation_name="redis_set"
         )
+        
+        # Breaker-wrapped operations, built once instead of on every call
+        self._breakered_get = self._redis_get_breaker(self._raw_get)
+        self._breakered_mget = self._redis_get_breaker(self._raw_mget)
+        self._breakered_set = self._redis_set_breaker(self._raw_set)
+        self._breakered_set_many = self._redis_set_breaker(self._raw_set_many)
     
     def _get_redis_client(self):
         """Get or create a Redis client using connection pooling.
@@ -83,12 +162,133 @@ class RedisLayer(BaseCacheLayer):
                         extra={'correlation_id': self._correlation_id})
             # Create and use a connection pool
             if self._connection_pool is None:
-                self._connection_pool = redis.ConnectionPool.from_url(self.redis_url)
-                logger.debug(f"Created Redis connection pool to {self.redis_url}", 
-                            extra={'correlation_id': self._correlation_id})
+                self._connection_pool = redis.ConnectionPool.from_url(
+                    self.redis_url, max_connections=self.max_connections
+                )
+                logger.debug("Created Redis connection pool to %s (max %d connections)",
+                             self.redis_url, self.max_connections,
+                             extra={'correlation_id': self._correlation_id})
             self._redis_client = redis.Redis(connection_pool=self._connection_pool)
+            # Registering only hashes the script locally; it is loaded on first use
+            self._set_many_script = self._redis_client.register_script(_SET_MANY_SCRIPT)
         return self._redis_client
     
+    async def warm_up(self, connections: int = 4) -> int:
+        """Open pooled connections ahead of the first requests.
+        
+        Issues concurrent PINGs so the pool connects several sockets up front
+        instead of paying connect latency on the first concurrent requests.
+        
+        Args:
+            connections: Number of connections to open, capped at max_connections
+            
+        Returns:
+            int: Number of connections that answered
+        """
+        count = min(connections, self.max_connections)
+        try:
+            redis_client = self._get_redis_client()
+            results = await asyncio.gather(
+                *(redis_client.ping() for _ in range(count)), return_exceptions=True
+            )
+        except Exception as e:
+            logger.error("Redis warm-up error: %s", e, 
+                        extra={'correlation_id': self._correlation_id})
+            return 0
+        
+        opened = sum(1 for result in results if result is True)
+        logger.debug("Warmed up %s/%s Redis connections", opened, count, 
+                    extra={'correlation_id': self._correlation_id})
+        return opened
+    
+    async def _with_retry(self, operation: Callable[[], Awaitable[Any]],
+                          breaker: CircuitBreaker) -> Any:
+        """Run an operation, retrying transient errors with full-jitter backoff.
+        
+        Each retry sleeps a random time between 0 and retry_delay * 2**attempt
+        (capped at 60 * retry_delay), so processes that failed together don't
+        retry in lockstep. Stops early once the breaker opens.
+        
+        Args:
+            operation: Factory returning a fresh awaitable for each attempt
+            breaker: Circuit breaker guarding the operation
+            
+        Returns:
+            Any: The operation's result, or None if the breaker is open
+            
+        Raises:
+            Exception: The last transient error once attempts are exhausted,
+                or any non-transient error immediately
+        """
+        cap = self.retry_delay * 60
+        attempts = max(1, self.retry_attempts)
+        for attempt in range(attempts):
+            if not breaker.allow_request():
+                return None
+            try:
+                return await operation()
+            except _TRANSIENT_ERRORS as e:
+                if attempt >= attempts - 1:
+                    raise
+                delay = random.uniform(0, min(cap, self.retry_delay * (2 ** attempt)))
+                logger.debug("Transient Redis error (%s), retrying in %.2fs", e, delay, 
+                            extra={'correlation_id': self._correlation_id})
+                await asyncio.sleep(delay)
+        return None
+    
+    def _encoder(self) -> Callable[[Any], bytes]:
+        """Return a serializer bound to the current compression settings.
+        
+        Returns:
+            Callable[[Any], bytes]: Function serializing a single value
+        """
+        if not self.enable_compression:
+            return serialize_uncompressed
+        return functools.partial(
+            serialize,
+            enable_compression=True,
+            compression_min_size=self.compression_min_size,
+            compression_level=self.compression_level,
+            compression_dict=self.compression_dict
+        )
+    
+    async def _raw_get(self, key: str) -> Optional[bytes]:
+        """GET a single key. Call through self._breakered_get."""
+        async with self._bulkhead:
+            return await self._redis_client.get(key)
+    
+    async def _raw_mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        """MGET a list of keys. Call through self._breakered_mget."""
+        async with self._bulkhead:
+            return await self._redis_client.mget(*keys)
+    
+    async def _raw_set(self, key: str, value: bytes, ex: int) -> Any:
+        """SET a single key with a TTL. Call through self._breakered_set."""
+        async with self._bulkhead:
+            return await self._redis_client.set(key, value, ex=ex)
+    
+    async def _raw_set_many(self, kv_dict: Dict[str, bytes], ex: int) -> int:
+        """Set multiple keys with one TTL in a single scripted round-trip.
+        
+        Call through self._breakered_set_many.
+        """
+        async with self._bulkhead:
+            return await self._set_many_script(keys=list(kv_dict), args=[ex, *kv_dict.values()])
+    
+    def _expiry_seconds(self, ttl: Optional[float]) -> int:
+        """Convert a TTL to the whole seconds EX accepts.
+        
+        Fractional TTLs are rounded up, so a sub-second TTL becomes EX 1
+        rather than an EX 0 that Redis rejects.
+        
+        Args:
+            ttl: Time to live in seconds (defaults to layer ttl)
+            
+        Returns:
+            int: The expiry in seconds, at least 1
+        """
+        return max(1, math.ceil(ttl if ttl is not None else self.ttl))
+    
     async def get(self, key: str) -> Tuple[bool, Any]:
         """Get a value from the Redis cache.
         
@@ -98,6 +298,10 @@ class RedisLayer(BaseCacheLayer):
         Returns:
             Tuple[bool, Any]: (found, value) tuple
         """
+        # Fail fast while the circuit is open instead of attempting I/O
+        if not self._redis_get_breaker.allow_request():
+            return False, None
+        
         try:
             redis_client = self._get_redis_client()
             if not redis_client:
@@ -105,21 +309,22 @@ class RedisLayer(BaseCacheLayer):
                               extra={'correlation_id': self._correlation_id})
                 return False, None
                 
-            @self._redis_get_breaker
-            async def _redis_get(k: str):
-                return await redis_client.get(k)
-            
-            data = await _redis_get(key)
+            data = await self._with_retry(lambda: self._breakered_get(key),
+                                         self._redis_get_breaker)
             if data:
                 try:
-                    value = deserialize(data)
+                    # Large payloads are decoded off the event loop
+                    if len(data) > _OFFLOAD_BYTES:
+                        value = await asyncio.to_thread(self._decode, data)
+                    else:
+                        value = self._decode(data)
                     return True, value
                 except CacheSerializationError as e:
-                    logger.error(f"Error deserializing Redis data: {e}", 
+                    logger.error("Error deserializing Redis data: %s", e, 
                                 extra={'correlation_id': self._correlation_id})
                     return False, None
         except Exception as e:
-            logger.error(f"Redis get error: {e}", 
+            logger.error("Redis get error: %s", e, 
                         extra={'correlation_id': self._correlation_id})
             return False, None
         
@@ -136,6 +341,9 @@ class RedisLayer(BaseCacheLayer):
         Returns:
             bool: True if set successfully
         """
+        if not self._redis_set_breaker.allow_request():
+            return False
+        
         try:
             redis_client = self._get_redis_client()
             if not redis_client:
@@ -143,29 +351,27 @@ class RedisLayer(BaseCacheLayer):
                               extra={'correlation_id': self._correlation_id})
                 return False
                 
-            # Serialize the value before storing
+            # Serialize the value before storing; large strings and bytes are
+            # encoded (and compressed) off the event loop
+            encode = self._encoder()
             try:
-                serialized_value = serialize(
-                    value, 
-                    self.enable_compression, 
-                    self.compression_min_size, 
-                    self.compression_level
-                )
+                if isinstance(value, (bytes, bytearray, str)) and len(value) > _OFFLOAD_BYTES:
+                    serialized_value = await asyncio.to_thread(encode, value)
+                else:
+                    serialized_value = encode(value)
             except CacheSerializationError as e:
-                logger.error(f"Error serializing value: {e}", 
+                logger.error("Error serializing value: %s", e, 
                             extra={'correlation_id': self._correlation_id})
                 return False
             
-            expiry = ttl if ttl is not None else self.ttl
-            
-            @self._redis_set_breaker
-            async def _redis_set(k: str, v: bytes, ex: int):
-                return await redis_client.set(k, v, ex=ex)
-                
-            result = await _redis_set(key, serialized_value, expiry)
+            expiry = self._expiry_seconds(ttl)
+            result = await self._with_retry(
+                lambda: self._breakered_set(key, serialized_value, expiry),
+                self._redis_set_breaker
+            )
             return bool(result)
         except Exception as e:
-            logger.error(f"Redis set error: {e}", 
+            logger.error("Redis set error: %s", e, 
                         extra={'correlation_id': self._correlation_id})
             return False
     
@@ -178,6 +384,9 @@ class RedisLayer(BaseCacheLayer):
         Returns:
             bool: True if deleted successfully
         """
+        if not self._redis_set_breaker.allow_request():
+            return False
+        
         try:
             redis_client = self._get_redis_client()
             if not redis_client:
@@ -185,13 +394,40 @@ class RedisLayer(BaseCacheLayer):
                               extra={'correlation_id': self._correlation_id})
                 return False
                 
-            result = await redis_client.delete(key)
+            async with self._bulkhead:
+                result = await redis_client.delete(key)
             return result > 0
         except Exception as e:
-            logger.error(f"Redis delete error: {e}", 
+            logger.error("Redis delete error: %s", e, 
                         extra={'correlation_id': self._correlation_id})
             return False
     
+    async def delete_many(self, keys: List[str]) -> int:
+        """Delete multiple values from the Redis cache with a single DEL.
+        
+        Args:
+            keys: List of cache keys
+            
+        Returns:
+            int: Number of keys that were deleted
+        """
+        if not keys or not self._redis_set_breaker.allow_request():
+            return 0
+        
+        try:
+            redis_client = self._get_redis_client()
+            if not redis_client:
+                logger.warning("Redis client unavailable", 
+                              extra={'correlation_id': self._correlation_id})
+                return 0
+                
+            async with self._bulkhead:
+                return await redis_client.delete(*keys)
+        except Exception as e:
+            logger.error("Redis delete_many error: %s", e, 
+                        extra={'correlation_id': self._correlation_id})
+            return 0
+    
     async def get_many(self, keys: List[str]) -> Dict[str, Any]:
         """Get multiple values from the Redis cache.
         
@@ -204,6 +440,9 @@ class RedisLayer(BaseCacheLayer):
         if not keys:
             return {}
             
+        if not self._redis_get_breaker.allow_request():
+            return {}
+        
         try:
             redis_client = self._get_redis_client()
             if not redis_client:
@@ -211,44 +450,192 @@ class RedisLayer(BaseCacheLayer):
                               extra={'correlation_id': self._correlation_id})
                 return {}
                 
-            @self._redis_get_breaker
-            async def _redis_mget(ks: List[str]):
-                return await redis_client.mget(*ks)
-                
-            values = await _redis_mget(keys)
-            
-            # Process results
             result = {}
-            for i, value in enumerate(values):
-                if value is not None:
-                    try:
-                        key = keys[i]
-                        deserialized = deserialize(value)
-                        result[key] = deserialized
-                    except Exception as e:
-                        logger.error(f"Error deserializing value for key {keys[i]}: {e}", 
-                                   extra={'correlation_id': self._correlation_id})
+            if len(keys) <= _BATCH_SIZE:
+                values = await self._breakered_mget(keys)
+                # None means the circuit opened before the call; treat as misses
+                if values is None:
+                    return {}
+                await self._decode_batch(keys, values, result)
+                return result
+            
+            # Fetch fixed-size chunks concurrently and decode each one as soon
+            # as it arrives, overlapping deserialization with network I/O
+            async def _fetch(chunk: List[str]):
+                return chunk, await self._breakered_mget(chunk)
+            
+            tasks = [
+                asyncio.ensure_future(_fetch(keys[i:i + _BATCH_SIZE]))
+                for i in range(0, len(keys), _BATCH_SIZE)
+            ]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    chunk, values = await next_done
+                    if values is None:
                         continue
+                    await self._decode_batch(chunk, values, result)
+            finally:
+                for task in tasks:
+                    task.cancel()
                         
             return result
         except Exception as e:
-            logger.error(f"Redis mget error: {e}", 
+            logger.error("Redis mget error: %s", e, 
                         extra={'correlation_id': self._correlation_id})
             return {}
     
-    async def set_many(self, key_values: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+    async def _decode_batch(self, keys: List[str], values: List[Optional[bytes]],
+                            result: Dict[str, Any]) -> None:
+        """Decode MGET replies, off the event loop when the batch is large.
+        
+        Batches above _OFFLOAD_BYTES are decoded in a worker thread so
+        decompression doesn't stall other coroutines; smaller ones stay inline
+        where the thread hand-off would cost more than it saves.
+        
+        Args:
+            keys: The keys that were requested
+            values: The raw replies, aligned with keys
+            result: Dictionary to add the decoded values to
+        """
+        if sum(len(value) for value in values if value) > _OFFLOAD_BYTES:
+            await asyncio.to_thread(self._decode_values, keys, values, result)
+        else:
+            self._decode_values(keys, values, result)
+    
+    def _decode_values(self, keys: List[str], values: List[Optional[bytes]],
+                       result: Dict[str, Any]) -> None:
+        """Deserialize MGET replies into result, skipping misses and bad values.
+        
+        Args:
+            keys: The keys that were requested
+            values: The raw replies, aligned with keys
+            result: Dictionary to add the decoded values to
+        """
+        decode = self._decode
+        try:
+            # Fast path: a single comprehension with no per-item exception handling
+            result.update({key: decode(value) for key, value in zip(keys, values)
+                           if value is not None})
+            return
+        except Exception:
+            pass
+        
+        # Some value failed to decode; redo the batch item by item to drop only it
+        for key, value in zip(keys, values):
+            if value is not None:
+                try:
+                    result[key] = decode(value)
+                except Exception as e:
+                    logger.error("Error deserializing value for key %s: %s", key, e, 
+                               extra={'correlation_id': self._correlation_id})
+    
+    async def iget_many(self, keys: List[str]) -> AsyncIterator[Tuple[str, Any]]:
+        """Get multiple values, yielding each chunk as soon as it is decoded.
+        
+        Lets callers start processing results while later chunks are still
+        in flight. Misses and values that fail to deserialize are skipped.
+        
+        Args:
+            keys: List of cache keys
+            
+        Yields:
+            Tuple[str, Any]: (key, value) pairs in chunk completion order
+        """
+        if not keys:
+            return
+        
+        if not self._redis_get_breaker.allow_request():
+            return
+        
+        try:
+            redis_client = self._get_redis_client()
+        except Exception as e:
+            logger.error("Redis mget error: %s", e, 
+                        extra={'correlation_id': self._correlation_id})
+            return
+        if not redis_client:
+            logger.warning("Redis client unavailable", 
+                          extra={'correlation_id': self._correlation_id})
+            return
+        
+        async def _fetch(chunk: List[str]):
+            return chunk, await self._breakered_mget(chunk)
+        
+        tasks = [
+            asyncio.ensure_future(_fetch(keys[i:i + _BATCH_SIZE]))
+            for i in range(0, len(keys), _BATCH_SIZE)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    chunk, values = await next_done
+                    if values is None:
+                        continue
+                    decoded: Dict[str, Any] = {}
+                    await self._decode_batch(chunk, values, decoded)
+                except Exception as e:
+                    logger.error("Redis mget error: %s", e, 
+                                extra={'correlation_id': self._correlation_id})
+                    continue
+                for item in decoded.items():
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _write_serialized(self, serialized_dict: Dict[str, bytes], expiry: int) -> int:
+        """Write already-serialized values, chunking large batches.
+        
+        Args:
+            serialized_dict: Dictionary mapping keys to serialized values
+            expiry: Time to live in seconds
+            
+        Returns:
+            int: Number of keys the server reported as set
+        """
+        if len(serialized_dict) <= _BATCH_SIZE:
+            return await self._breakered_set_many(serialized_dict, expiry)
+        
+        # One script call per fixed-size chunk, sent concurrently
+        items = list(serialized_dict.items())
+        counts = await asyncio.gather(*(
+            self._breakered_set_many(dict(items[i:i + _BATCH_SIZE]), expiry)
+            for i in range(0, len(items), _BATCH_SIZE)
+        ))
+        return sum(counts)
+    
+    def _on_background_write_done(self, task: "asyncio.Task[int]") -> None:
+        """Forget a finished fire-and-forget write and log its failure, if any."""
+        self._background_writes.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.error("Redis background set_many error: %s", error, 
+                        extra={'correlation_id': self._correlation_id})
+    
+    async def set_many(self, key_values: Dict[str, Any], ttl: Optional[int] = None,
+                       wait: bool = True) -> bool:
         """Set multiple values in the Redis cache.
         
         Args:
             key_values: Dictionary mapping keys to values
             ttl: Time to live in seconds (defaults to layer ttl)
+            wait: Whether to wait for the server to confirm the writes. When
+                False the write is sent in the background and failures are
+                only logged; use for best-effort cache fills
             
         Returns:
-            bool: True if all values were set successfully
+            bool: True if all values were set successfully (or, with
+                wait=False, if the write was scheduled)
         """
         if not key_values:
             return True
             
+        # Don't serialize a batch that the open circuit would drop anyway
+        if not self._redis_set_breaker.allow_request():
+            return False
+        
         try:
             redis_client = self._get_redis_client()
             if not redis_client:
@@ -259,16 +646,19 @@ class RedisLayer(BaseCacheLayer):
             # Serialize all values before storing
             try:
                 serialized_dict = {}
+                # Compression settings and one msgpack Packer are bound once for
+                # the whole batch
+                encode = make_batch_serializer(
+                    enable_compression=self.enable_compression,
+                    compression_min_size=self.compression_min_size,
+                    compression_level=self.compression_level,
+                    compression_dict=self.compression_dict
+                )
                 for key, value in key_values.items():
                     try:
-                        serialized_dict[key] = serialize(
-                            value, 
-                            self.enable_compression, 
-                            self.compression_min_size, 
-                            self.compression_level
-                        )
+                        serialized_dict[key] = encode(value)
                     except Exception as e:
-                        logger.error(f"Error serializing value for key '{key}': {e}", 
+                        logger.error("Error serializing value for key '%s': %s", key, e, 
                                     extra={'correlation_id': self._correlation_id})
                         # Skip this key and continue with others
                         continue
@@ -276,25 +666,26 @@ class RedisLayer(BaseCacheLayer):
                 if not serialized_dict:
                     return False
                 
-                @self._redis_set_breaker
-                async def _redis_pipeline_set(kv_dict: Dict[str, bytes], ex: int):
-                    """Set multiple keys using a Redis pipeline for efficiency."""
-                    pipe = redis_client.pipeline()
-                    for k, v in kv_dict.items():
-                        pipe.set(k, v, ex=ex)
-                    return await pipe.execute()
+                expiry = self._expiry_seconds(ttl)
+                if not wait:
+                    # Keep a reference so the task isn't garbage collected mid-write
+                    task = asyncio.get_running_loop().create_task(
+                        self._write_serialized(serialized_dict, expiry)
+                    )
+                    self._background_writes.add(task)
+                    task.add_done_callback(self._on_background_write_done)
+                    return True
                 
-                expiry = ttl if ttl is not None else self.ttl
-                results = await _redis_pipeline_set(serialized_dict, expiry)
+                written = await self._write_serialized(serialized_dict, expiry)
                 
-                # Check if all operations succeeded
-                return all(bool(result) for result in results)
+                # The script reports how many keys it set
+                return written == len(serialized_dict)
             except Exception as e:
-                logger.error(f"Redis set_many error: {e}", 
+                logger.error("Redis set_many error: %s", e, 
                            extra={'correlation_id': self._correlation_id})
                 return False
         except Exception as e:
-            logger.error(f"Redis set_many outer error: {e}", 
+            logger.error("Redis set_many outer error: %s", e, 
                         extra={'correlation_id': self._correlation_id})
             return False
     
@@ -306,6 +697,9 @@ class RedisLayer(BaseCacheLayer):
         Returns:
             bool: True if cleared successfully
         """
+        if not self._redis_set_breaker.allow_request():
+            return False
+        
         try:
             redis_client = self._get_redis_client()
             if not redis_client:
@@ -314,21 +708,23 @@ class RedisLayer(BaseCacheLayer):
                 return False
                 
             # Only clear keys used by this instance with namespace
-            if self.namespace != "default":
-                pattern = f"{self.namespace}:*"
-                # Scan for keys with this pattern
+            if self._clear_pattern is not None:
+                pattern = self._clear_pattern
+                # Walk the keyspace one SCAN step at a time so other clients
+                # are served in between; UNLINK frees values in the background
                 cursor = 0
                 deleted_count = 0
-                
                 while True:
-                    cursor, keys = await redis_client.scan(cursor, match=pattern, count=100)
-                    if keys:
-                        await redis_client.delete(*keys)
-                        deleted_count += len(keys)
+                    async with self._bulkhead:
+                        cursor, keys = await redis_client.scan(
+                            cursor, match=pattern, count=_CLEAR_SCAN_COUNT
+                        )
+                        if keys:
+                            deleted_count += await redis_client.unlink(*keys)
                     if cursor == 0:
                         break
                 
-                logger.info(f"Cleared {deleted_count} keys with pattern {pattern}", 
+                logger.info("Cleared %s keys with pattern %s", deleted_count, pattern, 
                            extra={'correlation_id': self._correlation_id})
                 return True
             else:
@@ -341,25 +737,29 @@ class RedisLayer(BaseCacheLayer):
                 )
                 return False
         except Exception as e:
-            logger.error(f"Error clearing Redis cache: {e}", 
+            logger.error("Error clearing Redis cache: %s", e, 
                         extra={'correlation_id': self._correlation_id})
             return False
     
     async def close(self) -> None:
         """Close the Redis client and release resources."""
+        # Let fire-and-forget writes finish before the connections go away
+        if self._background_writes:
+            await asyncio.gather(*self._background_writes, return_exceptions=True)
+        
         if self._redis_client:
             try:
                 await self._redis_client.aclose()
                 self._redis_client = None
             except Exception as e:
-                logger.error(f"Error closing Redis client: {e}", 
+                logger.error("Error closing Redis client: %s", e, 
                            extra={'correlation_id': self._correlation_id})
         
         # Clean up connection pool
         if self._connection_pool:
             try:
-                self._connection_pool.disconnect()
+                await self._connection_pool.disconnect()
                 self._connection_pool = None
             except Exception as e:
-                logger.error(f"Error disconnecting Redis connection pool: {e}", 
+                logger.error("Error disconnecting Redis connection pool: %s", e, 
                            extra={'correlation_id': self._correlation_id}) 
\ No newline at end of file
@@ -8,17 +8,18 @@ import shutil
 import time
 import json
 import redis.asyncio as redis
-from collections import OrderedDict, Counter
-from threading import RLock
-from datetime import datetime, timedelta
-from tenacity import retry, stop_after_attempt, wait_fixed
-from typing import Any, Dict, List, Optional, TypeVar, Callable, cast, TYPE_CHECKING
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock, RLock
+from typing import Any, Awaitable, Dict, Iterator, List, Optional, Tuple, TypeVar, Callable, cast, TYPE_CHECKING
 if TYPE_CHECKING: from redis.asyncio import Redis  # noqa: E701
 
-from .cache_config import CacheConfig, EvictionPolicy, CacheLayerType
+from .cache_config import CacheConfig, EvictionPolicy, CacheLayerType, get_cache_config
 from .cache_layers import MemoryLayer, RedisLayer, DiskLayer
 from .core.logging_setup import setup_logging, CorrelationIdFilter
-from .core.exceptions import CacheSerializationError, CacheKeyError
+from .core.exceptions import CacheConnectionError, CacheSerializationError, CacheKeyError
 from .core.telemetry import timed_operation
 from .core.security import require_permission
 from .core.invalidation import InvalidationEvent
@@ -26,7 +27,7 @@ from .core.exceptions import CacheError
 from .utils.serialization import Serializer
 from .utils.compression import compress_data, decompress_data
 from .utils.namespacing import NamespaceManager
-from .utils.disk_cache import DiskCacheManager
+from .utils.disk_cache import DiskCacheManager, ensure_dir
 from .utils.initialization import CacheInitializer
 
 # Default logger for imports and module initialization
@@ -34,11 +35,11 @@ logger = logging.getLogger(__name__)
 logger.addFilter(CorrelationIdFilter())
 
 # Initialize with a basic default config
-default_config = CacheConfig()
+default_config = get_cache_config()
 
 # Create log directory if it doesn't exist
 if default_config.log_to_file:
-    os.makedirs(default_config.log_dir, exist_ok=True)
+    ensure_dir(default_config.log_dir)
 
 logger = setup_logging(default_config)
 
@@ -46,13 +47,99 @@ logger = setup_logging(default_config)
 T = TypeVar('T')
 F = TypeVar('F', bound=Callable[..., Any])
 
+# Sentinel for front-tier misses, so cached None values are still hits
+_MISSING = object()
+
+# Set inside CacheManager.bypass_local_cache() so the current task always
+# reads from the cache layers
+_bypass_l0: ContextVar[bool] = ContextVar("cache_bypass_l0", default=False)
+
+# Redis connection pools shared by CacheManager instances with the same
+# connection settings on the same event loop. Each entry is
+# [pool, reference count, validated by a ping].
+_POOLS: Dict[tuple, list] = {}
+_POOLS_LOCK = Lock()
+
+# Seconds a pooled connection may sit idle before it is health-checked
+_REDIS_HEALTH_CHECK_INTERVAL = 30
+
+# Errors get retries: backend failures may clear on the next attempt, while
+# a bad key or an undecodable value never will
+_PERMANENT_ERRORS = (CacheKeyError, CacheSerializationError)
+_TRANSIENT_ERRORS = (CacheError, RedisConnectionError, RedisTimeoutError,
+                     ConnectionError, TimeoutError)
+
+def _retry_transient(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Retry a CacheManager coroutine method on transient backend errors.
+    
+    Uses the instance's own retry policy (``_retry_attempts``/``_retry_delay``),
+    the same one get applies inline, rather than one bound at import time.
+    
+    Args:
+        func: The coroutine method to wrap
+        
+    Returns:
+        Callable: The wrapped method
+    """
+    @functools.wraps(func)
+    async def wrapper(self: "CacheManager", *args: Any, **kwargs: Any) -> T:
+        attempt = 1
+        while True:
+            try:
+                return await func(self, *args, **kwargs)
+            except _PERMANENT_ERRORS:
+                raise
+            except _TRANSIENT_ERRORS as e:
+                if attempt >= self._retry_attempts:
+                    raise
+                logger.debug("Retrying %s after: %s", func.__name__, e,
+                             extra={'correlation_id': self._correlation_id})
+                await asyncio.sleep(self._retry_delay)
+                attempt += 1
+    return wrapper
+
+class _Stats:
+    """Hit, miss and write counters for a CacheManager.
+    
+    Kept in slots so the increments on every cache operation are plain
+    attribute updates rather than dictionary lookups.
+    """
+    __slots__ = ("hits", "misses", "sets", "errors", "layer_hits", "layer_sets",
+                 "layer_deletes", "evictions", "disk_usage")
+    
+    def __init__(self):
+        """Initialize all counters to zero."""
+        self.layer_hits: Dict[str, int] = {}  # Populated with string layer types as needed
+        self.reset()
+    
+    def reset(self) -> None:
+        """Zero every counter, keeping the known layer_hits keys."""
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.errors = 0
+        self.layer_sets = 0
+        self.layer_deletes = 0
+        self.evictions = 0
+        self.disk_usage = 0
+        for layer in self.layer_hits:
+            self.layer_hits[layer] = 0
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Export the counters as a dictionary.
+        
+        Returns:
+            Dict[str, Any]: Counter values keyed by name
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
 class CacheManager:
     """Manages caching operations with support for multiple backends.
     
     Features:
     - Multiple backend support (in-memory, Redis, shelve)
     - TTL (Time-To-Live) for cached items
-    - Serialization via msgpack (falls back to pickle)
+    - Serialization via msgpack (or msgspec / pickle, see serialization_codec)
     - Thread-safe eviction policies (LRU, FIFO, LFU)
     - Namespacing to prevent key collisions
     - Circuit breaker pattern to handle backend failures
@@ -62,58 +149,48 @@ class CacheManager:
     - Function decorator for easy caching
     - Compression support for large values
     """
-    def __init__(self, config: CacheConfig = CacheConfig()):
+    def __init__(self, config: Optional[CacheConfig] = None):
         """Initialize the cache manager with the given configuration.
         
         Args:
-            config: Cache configuration
+            config: Cache configuration (defaults to the shared get_cache_config())
         """
         # Generate a correlation ID for this instance
         self._correlation_id = f"CM-{uuid.uuid4().hex[:8]}"
         self._instance_id = uuid.uuid4().hex
         
         # Store configuration
-        self._config = config
+        self._config = config if config is not None else get_cache_config()
         
         # Set up logging
         self._logger = setup_logging(self._config)
         self._logger.debug("Initializing CacheManager", extra={'correlation_id': self._correlation_id})
         
-        # Create cache directory
-        os.makedirs(self._config.cache_dir, exist_ok=True)
-        
         # Initialize namespace manager
-        self._namespace_manager = NamespaceManager(config.namespace)
+        self._namespace_manager = NamespaceManager(self._config.namespace)
+        # The namespace is fixed, so hot paths add its prefix directly
+        self._ns_prefix = self._namespace_manager.prefix
         
         # Initialize disk cache manager
         self._disk_cache_manager = DiskCacheManager(
             cache_dir=self._config.cache_dir,
             cache_file=self._config.cache_file,
             namespace=self._config.namespace,
-            correlation_id=self._correlation_id
+            correlation_id=self._correlation_id,
+            create_dir=self._config.disk_cache_enabled
         )
         
         # Initialize shelve file path
         self.shelve_file = self._disk_cache_manager.shelve_file
         
         # Initialize stats counters
-        self._stats = {
-            "hits": 0,
-            "misses": 0, 
-            "sets": 0,
-            "errors": 0,
-            "layer_hits": {},  # Will be populated with string keys as needed
-            "layer_sets": 0,
-            "layer_deletes": 0,
-            "evictions": 0,
-            "disk_usage": 0
-        }
+        self._stats = _Stats()
         
         # Initialize layer hit counters if layered cache is enabled
         if self._config.use_layered_cache:
             for layer in self._config.cache_layers:
                 if layer.enabled:
-                    self._stats["layer_hits"][str(layer.type)] = 0
+                    self._stats.layer_hits[str(layer.type)] = 0
         
         # Set up Redis and other configurations
         self._use_redis = self._config.use_redis and redis is not None
@@ -122,13 +199,39 @@ class CacheManager:
         if self._config.eviction_policy == EvictionPolicy.LRU:
             # For LRU, we use OrderedDict to track access order
             self.cached_keys = OrderedDict()
-        elif self._config.eviction_policy == EvictionPolicy.FIFO:
-            # For FIFO, we use OrderedDict without reordering on access
+        elif self._config.eviction_policy in (EvictionPolicy.FIFO, EvictionPolicy.CLOCK):
+            # For FIFO and CLOCK, we use OrderedDict without reordering on access
             self.cached_keys = OrderedDict()
         elif self._config.eviction_policy == EvictionPolicy.LFU:
-            # For LFU, we use OrderedDict for consistent iteration and Counter for frequencies
+            # For LFU, keys are grouped into per-frequency buckets (oldest first)
+            # so the least frequently used key is found without a scan
             self.cached_keys = OrderedDict()
-            self.access_frequencies = Counter()
+            self.access_frequencies: Dict[str, int] = {}
+            self._freq_buckets: Dict[int, OrderedDict] = {}
+            self._min_freq = 0
+        
+        # Victim selection is fixed by the policy, so pick it once here;
+        # LRU and FIFO (and CLOCK, untracked here) both evict the oldest key
+        self._evict_one: Callable[[], str] = (
+            self._evict_lfu if self._config.eviction_policy == EvictionPolicy.LFU
+            else self._evict_oldest
+        )
+        
+        # Retry policy for transient backend errors, read once from this
+        # instance's config; the first attempt is not a retry
+        self._retry_attempts = self._config.retry_attempts + 1
+        self._retry_delay = self._config.retry_delay
+        
+        # Memory TTL as a float for cheap expiry comparisons
+        self._memory_ttl = float(self._config.memory_cache_ttl)
+        
+        # Tier-0 cache of recently read or written values, consulted before
+        # any layer is awaited. Entries are (value, monotonic deadline). Values
+        # are held by reference, not copied: mutating an object after set or
+        # get changes what later gets return while its entry is live
+        self._l0: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
+        self._l0_max = self._config.l0_cache_size
+        self._l0_ttl = float(self._config.l0_cache_ttl)
         
         # Locks for thread safety
         self._keys_lock = RLock()
@@ -137,6 +240,7 @@ class CacheManager:
         
         # Redis client is lazily initialized
         self._redis = None
+        self._pool_key: Optional[tuple] = None
         
         # Circuit breakers for different operations
         self._breakers = {}
@@ -144,11 +248,13 @@ class CacheManager:
         # Initialize tasks tracking
         self._tasks = set()
         self._disk_monitor_task = None
+        self._ttl_sweeper_task = None
         self._warmup_task = None
         self._telemetry_task = None
         
-        # Use initializer for cache layers and core components
-        initializer = CacheInitializer(self._config, self._correlation_id)
+        # Use initializer for cache layers and core components; it is kept
+        # for the Redis-dependent components added once the client is ready
+        initializer = self._initializer = CacheInitializer(self._config, self._correlation_id)
         
         # Setup cache layers
         layers_info = initializer.setup_cache_layers()
@@ -157,6 +263,10 @@ class CacheManager:
         self._primary_layer_type = layers_info["primary_layer_type"]
         self._layer_order = layers_info["layer_order"]
         
+        # The disk layer keeps the shelve open, so cleanup must use its handle
+        if CacheLayerType.DISK in self._cache_layers:
+            self._disk_cache_manager.attach_layer(self._cache_layers[CacheLayerType.DISK])
+        
         self._logger.debug(
             f"CacheManager initialized with config: "
             f"redis={self._use_redis}, "
@@ -172,6 +282,10 @@ class CacheManager:
         if self._config.disk_usage_monitoring:
             self._setup_disk_monitoring()
         
+        # Start the background TTL sweeper if enabled
+        if self._config.enable_ttl_sweeper:
+            self._ttl_sweeper_task = self._create_task(self._ttl_sweeper())
+        
         # Initialize core components after Redis client is available
         core_components = initializer.setup_core_components()
         
@@ -183,6 +297,22 @@ class CacheManager:
         self._data_signer = core_components.get("data_signer")
         self._access_control = core_components.get("access_control")
         
+        # Serializer shared by _serialize/_deserialize; everything it depends
+        # on is fixed once the components above are set up
+        self._serializer = Serializer(
+            enable_compression=self._config.enable_compression,
+            compression_min_size=self._config.compression_min_size,
+            compression_level=self._config.compression_level,
+            encryptor=self._encryptor,
+            data_signer=self._data_signer,
+            stats=self._stats,
+            correlation_id=self._correlation_id,
+            codec=self._config.serialization_codec
+        )
+        
+        # Layer lookup for get, specialized to the layers and features above
+        self._recompile_get()
+        
         # Default user
         self._current_user = {'id': 'system', 'roles': ['admin']}
         
@@ -202,8 +332,7 @@ class CacheManager:
             redis_client = await self._get_redis_client()
             
             # Initialize core components that require Redis
-            initializer = CacheInitializer(self._config, self._correlation_id)
-            distributed_components = initializer.setup_core_components(redis_client)
+            distributed_components = self._initializer.setup_distributed_components(redis_client)
             
             # Set distributed components
             self._invalidation_manager = distributed_components.get("invalidation_manager")
@@ -226,16 +355,13 @@ class CacheManager:
                 """Handle invalidation for a specific key."""
                 key = data.get('key')
                 if key:
-                    # Delete from all cache layers
-                    for layer in self._cache_layers.values():
-                        await layer.delete(self._namespace_key(key))
+                    await self._invalidate_keys([key])
             
-            async def handle_pattern_invalidation(data: Dict[str, Any]) -> None:
-                """Handle invalidation for a pattern (multiple keys)."""
-                pattern = data.get('pattern')
-                if pattern:
-                    # Placeholder for pattern invalidation
-                    pass
+            async def handle_keys_invalidation(data: Dict[str, Any]) -> None:
+                """Handle invalidation for a batch of keys."""
+                keys = data.get('keys')
+                if keys:
+                    await self._invalidate_keys(keys)
             
             async def handle_namespace_invalidation(data: Dict[str, Any]) -> None:
                 """Handle invalidation for an entire namespace."""
@@ -244,8 +370,10 @@ class CacheManager:
                     # Clear all cache layers for this namespace
                     await self.clear()
             
+            # Pattern invalidation is not supported yet (it needs a way to list
+            # matching keys), so no no-op handler is registered for it
             self._invalidation_manager.add_callback(InvalidationEvent.KEY, handle_key_invalidation)
-            self._invalidation_manager.add_callback(InvalidationEvent.PATTERN, handle_pattern_invalidation)
+            self._invalidation_manager.add_callback(InvalidationEvent.KEYS, handle_keys_invalidation)
             self._invalidation_manager.add_callback(InvalidationEvent.NAMESPACE, handle_namespace_invalidation)
             
             self._logger.debug("Invalidation manager started", 
@@ -254,6 +382,33 @@ class CacheManager:
             self._logger.error(f"Failed to start invalidation manager: {e}", 
                                extra={"correlation_id": self._correlation_id})
 
+    async def _invalidate_keys(self, keys: List[str]) -> None:
+        """Drop keys invalidated by another node from every cache layer.
+        
+        Layers are cleared concurrently, so the latency is that of the
+        slowest layer rather than the sum; batches go through each layer's
+        delete_many (a single DEL for Redis).
+        
+        Args:
+            keys: The invalidated cache keys, without namespace; like get and
+                delete, they are passed to the layers as is
+        """
+        l0 = self._l0
+        for key in keys:
+            l0.pop(key, None)
+        
+        layers = self._cache_layers.values()
+        if len(keys) == 1:
+            key = keys[0]
+            deletes = [layer.delete(key) for layer in layers]
+        else:
+            deletes = [layer.delete_many(keys) for layer in layers]
+        
+        for result in await asyncio.gather(*deletes, return_exceptions=True):
+            if isinstance(result, Exception):
+                self._logger.error(f"Error invalidating keys: {result}", 
+                                   extra={"correlation_id": self._correlation_id})
+    
     def _create_task(self, coro) -> asyncio.Task:
         """Create and track an asyncio task.
         
@@ -308,8 +463,11 @@ class CacheManager:
                 namespace=self._config.namespace,
                 ttl=self._config.disk_cache_ttl,
                 cache_dir=self._config.cache_dir,
-                cache_file=cache_file
+                cache_file=cache_file,
+                write_behind=self._config.disk_write_behind
             )
+            # The layer keeps the shelve open, so cleanup must use its handle
+            self._disk_cache_manager.attach_layer(self._cache_layers[CacheLayerType.DISK])
             
             # Use disk as primary layer if memory is disabled
             if not self._primary_layer:
@@ -365,17 +523,23 @@ class CacheManager:
             f"primary={self._primary_layer_type}",
             extra={"correlation_id": self._correlation_id}
         )
+        
+        # get walks a chain built from the previous layers
+        self._recompile_get()
 
     def _namespace_key(self, key: str) -> str:
         """Add namespace prefix to a key.
         
+        Meant for single keys; loops over many keys bind self._ns_prefix to
+        a local and concatenate directly instead.
+        
         Args:
             key: The original key
             
         Returns:
             str: The namespaced key
         """
-        return self._namespace_manager.namespace_key(key)
+        return self._ns_prefix + key
     
     def _remove_namespace(self, namespaced_key: str) -> str:
         """Remove namespace prefix from a key.
@@ -386,7 +550,10 @@ class CacheManager:
         Returns:
             str: The original key without namespace
         """
-        return self._namespace_manager.remove_namespace(namespaced_key)
+        prefix = self._ns_prefix
+        if prefix and namespaced_key.startswith(prefix):
+            return namespaced_key[len(prefix):]
+        return namespaced_key
     
     def _namespace_keys_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Add namespace prefix to all keys in a dictionary.
@@ -397,7 +564,8 @@ class CacheManager:
         Returns:
             Dict[str, Any]: Dictionary with namespaced keys
         """
-        return self._namespace_manager.namespace_keys_dict(data)
+        prefix = self._ns_prefix
+        return {prefix + key: value for key, value in data.items()}
     
     def _remove_namespace_from_keys_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Remove namespace prefix from all keys in a dictionary.
@@ -408,7 +576,12 @@ class CacheManager:
         Returns:
             Dict[str, Any]: Dictionary with original keys
         """
-        return self._namespace_manager.remove_namespace_from_keys_dict(data)
+        prefix = self._ns_prefix
+        if not prefix:
+            return dict(data)
+        plen = len(prefix)
+        return {(key[plen:] if key.startswith(prefix) else key): value
+                for key, value in data.items()}
 
     async def _get_redis_client(self) -> 'Redis':
         """Get or create a Redis client connection pool.
@@ -428,27 +601,22 @@ class CacheManager:
         try:
             import redis.asyncio as aioredis
             
-            # Use the full Redis URL with all settings
-            self._redis = aioredis.from_url(
-                self._config.full_redis_url,
-                socket_timeout=self._config.redis_connection_timeout,
-                socket_connect_timeout=self._config.redis_connection_timeout,
-                ssl=self._config.redis_ssl,
-                ssl_cert_reqs=self._config.redis_ssl_cert_reqs,
-                ssl_ca_certs=self._config.redis_ssl_ca_certs,
-                max_connections=self._config.redis_max_connections
-            )
+            pool_entry = self._acquire_pool(aioredis)
+            self._redis = aioredis.Redis(connection_pool=pool_entry[0])
             
-            # Test the connection
-            try:
-                await self._redis.ping()
-                self._logger.debug(
-                    "Redis connection established", 
-                    extra={"correlation_id": self._correlation_id}
-                )
-            except Exception as e:
-                self._redis = None
-                raise CacheError(f"Redis connection test failed: {e}") from e
+            # Test the connection once per shared pool
+            if not pool_entry[2]:
+                try:
+                    await self._redis.ping()
+                    pool_entry[2] = True
+                    self._logger.debug(
+                        "Redis connection established", 
+                        extra={"correlation_id": self._correlation_id}
+                    )
+                except Exception as e:
+                    self._redis = None
+                    await self._release_pool()
+                    raise CacheError(f"Redis connection test failed: {e}") from e
                 
             return self._redis
             
@@ -465,60 +633,221 @@ class CacheManager:
             )
             raise CacheError(f"Failed to initialize Redis client: {e}") from e
 
+    def _acquire_pool(self, aioredis: Any) -> list:
+        """Take a reference to the shared connection pool for this configuration.
+        
+        Pools are bound to the event loop their connections were made on, so
+        the running loop is part of the sharing key.
+        
+        Args:
+            aioredis: The redis.asyncio module
+            
+        Returns:
+            list: The [pool, reference count, validated] entry in _POOLS
+        """
+        config = self._config
+        key = (
+            config.full_redis_url, config.redis_ssl, config.redis_ssl_cert_reqs,
+            config.redis_ssl_ca_certs, config.redis_connection_timeout,
+            config.redis_max_connections, asyncio.get_running_loop()
+        )
+        with _POOLS_LOCK:
+            entry = _POOLS.get(key)
+            if entry is None:
+                pool = aioredis.ConnectionPool.from_url(
+                    config.full_redis_url,
+                    socket_timeout=config.redis_connection_timeout,
+                    socket_connect_timeout=config.redis_connection_timeout,
+                    ssl=config.redis_ssl,
+                    ssl_cert_reqs=config.redis_ssl_cert_reqs,
+                    ssl_ca_certs=config.redis_ssl_ca_certs,
+                    max_connections=config.redis_max_connections,
+                    health_check_interval=_REDIS_HEALTH_CHECK_INTERVAL
+                )
+                entry = _POOLS[key] = [pool, 0, False]
+            entry[1] += 1
+        self._pool_key = key
+        return entry
+    
+    async def _release_pool(self) -> None:
+        """Drop this instance's pool reference, disconnecting the pool when it was the last."""
+        key, self._pool_key = self._pool_key, None
+        if key is None:
+            return
+        with _POOLS_LOCK:
+            entry = _POOLS.get(key)
+            if entry is None:
+                return
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+            del _POOLS[key]
+        await entry[0].disconnect()
+    
+    def _lfu_touch(self, key: str) -> None:
+        """Record a set or access of a key for LFU eviction.
+        
+        Moves the key from its frequency bucket to the next one in O(1).
+        Caller must hold self._keys_lock.
+        
+        Args:
+            key: The cache key that was set or accessed
+        """
+        freq = self.access_frequencies.get(key, 0)
+        if freq:
+            bucket = self._freq_buckets[freq]
+            del bucket[key]
+            if not bucket:
+                del self._freq_buckets[freq]
+                if self._min_freq == freq:
+                    self._min_freq = freq + 1
+        else:
+            self._min_freq = 1
+        
+        self.access_frequencies[key] = freq + 1
+        bucket = self._freq_buckets.get(freq + 1)
+        if bucket is None:
+            bucket = self._freq_buckets[freq + 1] = OrderedDict()
+        bucket[key] = None
+    
+    def _lfu_pop(self) -> str:
+        """Remove and return the least frequently used key.
+        
+        Ties are broken by evicting the key that reached the frequency first.
+        Keys must be registered with _lfu_touch when added to cached_keys;
+        if none are tracked, the oldest cached key is chosen instead.
+        Caller must hold self._keys_lock.
+        
+        Returns:
+            str: The evicted key
+        """
+        if not self._freq_buckets:
+            return next(iter(self.cached_keys))
+        
+        bucket = self._freq_buckets.get(self._min_freq)
+        if bucket is None:
+            # The minimum bucket was emptied by a removal; find the next one
+            self._min_freq = min(self._freq_buckets)
+            bucket = self._freq_buckets[self._min_freq]
+        
+        old_key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self._freq_buckets[self._min_freq]
+        del self.access_frequencies[old_key]
+        return old_key
+    
+    def _evict_oldest(self) -> str:
+        """Evict the key at the front of cached_keys (LRU, FIFO and default policies).
+        
+        Returns:
+            str: The evicted key
+        """
+        old_key, _ = self.cached_keys.popitem(last=False)
+        return old_key
+    
+    def _evict_lfu(self) -> str:
+        """Evict the least frequently used key.
+        
+        Returns:
+            str: The evicted key
+        """
+        old_key = self._lfu_pop()
+        self.cached_keys.pop(old_key, None)
+        return old_key
+    
     def _evict_if_needed(self) -> None:
         """Evict cache entries if max size has been reached.
         
-        Applies the configured eviction policy to remove entries.
+        Applies the configured eviction policy, bound to self._evict_one at
+        construction, to remove entries.
         """
         with self._keys_lock:
+            max_size = self._config.cache_max_size
             # Check if cache is full
-            if len(self.cached_keys) > self._config.cache_max_size:
+            if len(self.cached_keys) > max_size:
                 self._logger.debug("Cache is full, evicting items")
+                evict_one = self._evict_one
+                debug = self._logger.isEnabledFor(logging.DEBUG)
                 
                 # Evict items until we're under the limit
-                while len(self.cached_keys) > self._config.cache_max_size:
-                    # Choose eviction strategy
-                    if self._config.eviction_policy == EvictionPolicy.LRU:
-                        # LRU - Evict the least recently used item
-                        old_key, _ = self.cached_keys.popitem(last=False)
-                    elif self._config.eviction_policy == EvictionPolicy.FIFO:
-                        # FIFO - Evict the first item that was added
-                        old_key, _ = self.cached_keys.popitem(last=False)
-                    elif self._config.eviction_policy == EvictionPolicy.LFU:
-                        # LFU - Evict the least frequently used item
-                        # Find key with lowest access count
-                        access_counts = self.access_frequencies
-                        old_key = min(self.cached_keys.keys(), key=lambda k: access_counts.get(k, 0))
-                        # Remove it from cached_keys and access_counts
-                        del self.cached_keys[old_key]
-                        if old_key in access_counts:
-                            del access_counts[old_key]
-                    else:
-                        # Default to LRU
-                        old_key, _ = self.cached_keys.popitem(last=False)
-                    
-                    self._logger.debug(
-                        f"Evicting key: {old_key} from cache using {self._config.eviction_policy} policy",
-                        extra={"correlation_id": self._correlation_id}
-                    )
-                    self._stats["evictions"] += 1
+                while len(self.cached_keys) > max_size:
+                    old_key = evict_one()
+                    if debug:
+                        self._logger.debug(
+                            "Evicting key: %s from cache using %s policy", old_key, self._config.eviction_policy,
+                            extra={"correlation_id": self._correlation_id}
+                        )
+                    self._stats.evictions += 1
 
     def _check_ttl(self, key: str, timestamp: float) -> bool:
-        """Check if a cache entry is still valid based on TTL.
+        """Check whether a cache entry has outlived the memory cache TTL.
         
         Args:
             key: Cache key to check
-            timestamp: Timestamp when the entry was stored
+            timestamp: time.monotonic() reading taken when the entry was stored
             
         Returns:
-            bool: True if entry is still valid, False if expired
+            bool: True if the entry has expired, False if it is still valid
         """
-        now = datetime.now()
-        if now > timestamp + timedelta(seconds=self._config.memory_cache_ttl):
-            self._logger.debug(f"Key {key} has expired", extra={"correlation_id": self._correlation_id})
+        if time.monotonic() - timestamp > self._memory_ttl:
+            self._logger.debug("Key %s has expired", key, extra={"correlation_id": self._correlation_id})
             return True
         return False
 
+    def _l0_lookup(self, key: str) -> Any:
+        """Look up a key in the front-tier cache.
+        
+        Args:
+            key: The cache key
+            
+        Returns:
+            Any: The cached value, or _MISSING if absent, stale or bypassed
+        """
+        if not self._l0_max or _bypass_l0.get():
+            return _MISSING
+        entry = self._l0.get(key)
+        if entry is None:
+            return _MISSING
+        if time.monotonic() > entry[1]:
+            self._l0.pop(key, None)
+            return _MISSING
+        self._l0.move_to_end(key)
+        return entry[0]
+    
+    def _l0_store(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Remember a value in the front-tier cache, evicting the least recently used entry.
+        
+        Args:
+            key: The cache key
+            value: The value as returned by get, stored by reference
+            ttl: The value's own TTL when known (from set), capping the
+                entry's lifetime. Layer hits don't report their remaining TTL,
+                so those entries live the full l0_cache_ttl and may be served
+                up to that long after the layer entry expired
+        """
+        if not self._l0_max or _bypass_l0.get():
+            return
+        lifetime = self._l0_ttl if ttl is None else min(ttl, self._l0_ttl)
+        l0 = self._l0
+        l0[key] = (value, time.monotonic() + lifetime)
+        l0.move_to_end(key)
+        if len(l0) > self._l0_max:
+            l0.popitem(last=False)
+    
+    @contextmanager
+    def bypass_local_cache(self) -> Iterator[None]:
+        """Skip the front-tier cache for operations in the current context.
+        
+        Example:
+            with cache.bypass_local_cache():
+                value = await cache.get("key")  # always read from the layers
+        """
+        token = _bypass_l0.set(True)
+        try:
+            yield
+        finally:
+            _bypass_l0.reset(token)
+    
     def _setup_disk_monitoring(self) -> None:
         """Set up disk usage monitoring if enabled in config."""
         if self._config.disk_usage_monitoring:
@@ -541,7 +870,7 @@ class CacheManager:
                 percent_used = disk_usage
                 
                 self._logger.debug(
-                    f"Disk usage: {percent_used:.1f}%", 
+                    "Disk usage: %.1f%%", percent_used,
                     extra={"correlation_id": self._correlation_id}
                 )
                 
@@ -572,6 +901,43 @@ class CacheManager:
             self._logger.info("Disk usage monitoring stopped", extra={"correlation_id": self._correlation_id})
             raise
 
+    async def _ttl_sweeper(self) -> None:
+        """Periodically remove expired entries from layers that support sweeping.
+        
+        This is a background task that runs every ttl_sweep_interval seconds,
+        so reads don't have to find and drop expired entries one at a time.
+        """
+        try:
+            while True:
+                await asyncio.sleep(self._config.ttl_sweep_interval)
+                
+                # Skip this round if another cleanup is already running
+                if self._cleanup_in_progress:
+                    continue
+                
+                self._cleanup_in_progress = True
+                try:
+                    for layer_type, layer in self._cache_layers.items():
+                        sweep = getattr(layer, "sweep_expired", None)
+                        if sweep is None:
+                            continue
+                        removed = await sweep()
+                        if removed:
+                            self._logger.debug(
+                                "TTL sweep removed %d expired entries from %s", removed, layer_type,
+                                extra={"correlation_id": self._correlation_id}
+                            )
+                except Exception as e:
+                    self._logger.error(
+                        f"Error during TTL sweep: {e}",
+                        extra={"correlation_id": self._correlation_id}
+                    )
+                finally:
+                    self._cleanup_in_progress = False
+        except asyncio.CancelledError:
+            self._logger.debug("TTL sweeper stopped", extra={"correlation_id": self._correlation_id})
+            raise
+
     async def _cleanup_disk_cache(self, aggressive: bool = False) -> int:
         """Clean up the disk cache by removing oldest entries.
         
@@ -607,7 +973,8 @@ class CacheManager:
     def _serialize(self, value: Any) -> bytes:
         """Serialize a value for storage.
         
-        Serializes the value with msgpack, and optionally compresses, encrypts, and signs it.
+        Serializes the value with the configured codec, and optionally compresses,
+        encrypts, and signs it.
         
         Args:
             value: The value to serialize
@@ -618,19 +985,8 @@ class CacheManager:
         Raises:
             CacheSerializationError: If serialization fails
         """
-        # Create a serializer with the current configuration
-        serializer = Serializer(
-            enable_compression=getattr(self._config, 'enable_compression', False),
-            compression_min_size=getattr(self._config, 'compression_min_size', 1024),
-            compression_level=getattr(self._config, 'compression_level', 6),
-            encryptor=getattr(self, '_encryptor', None),
-            data_signer=getattr(self, '_data_signer', None),
-            stats=self._stats,
-            correlation_id=self._correlation_id
-        )
-        
         try:
-            return serializer.serialize(value)
+            return self._serializer.serialize(value)
         except CacheSerializationError:
             # Re-raise the exception which is already properly formatted
             raise
@@ -639,7 +995,7 @@ class CacheManager:
                 f"Failed to serialize value: {e}", 
                 extra={"correlation_id": self._correlation_id}
             )
-            self._stats["errors"] += 1
+            self._stats.errors += 1
             raise CacheSerializationError(f"Failed to serialize value: {e}") from e
 
     def _deserialize(self, data: bytes) -> Any:
@@ -656,19 +1012,8 @@ class CacheManager:
         Raises:
             CacheSerializationError: If deserialization fails
         """
-        # Create a serializer with the current configuration
-        serializer = Serializer(
-            enable_compression=getattr(self._config, 'enable_compression', False),
-            compression_min_size=getattr(self._config, 'compression_min_size', 1024),
-            compression_level=getattr(self._config, 'compression_level', 6),
-            encryptor=getattr(self, '_encryptor', None),
-            data_signer=getattr(self, '_data_signer', None),
-            stats=self._stats,
-            correlation_id=self._correlation_id
-        )
-        
         try:
-            return serializer.deserialize(data)
+            return self._serializer.deserialize(data)
         except CacheSerializationError:
             # Re-raise the exception which is already properly formatted
             raise
@@ -677,7 +1022,7 @@ class CacheManager:
                 f"Failed to deserialize data: {e}", 
                 extra={"correlation_id": self._correlation_id}
             )
-            self._stats["errors"] += 1
+            self._stats.errors += 1
             raise CacheSerializationError(f"Failed to deserialize data: {e}") from e
 
     def _decode_complex_types(self, code: str, data: Any) -> Any:
@@ -693,8 +1038,88 @@ class CacheManager:
         # Currently we don't have custom types, but this allows for future extension
         return data
 
-    @retry(stop=stop_after_attempt(CacheConfig().retry_attempts), 
-           wait=wait_fixed(CacheConfig().retry_delay))
+    def _recompile_get(self) -> None:
+        """Rebuild get's specialized lookup after the layers or their settings change."""
+        self._get_revision = self._config.revision
+        adaptive_ttl = self._adaptive_ttl
+        self._record_access = (adaptive_ttl.record_access
+                               if adaptive_ttl and adaptive_ttl.enabled else None)
+        self._get_fast = self._compile_get()
+    
+    def _compile_get(self) -> Callable[[str], Awaitable[Any]]:
+        """Build the layer lookup used by get, specialized to this instance.
+        
+        The enabled layers, read-through, compression and telemetry settings
+        are resolved once here, so the returned coroutine function only walks
+        the resulting layer chain. get rebuilds it when a config field has
+        been assigned since (see CacheConfig.revision), and _setup_cache_layers
+        rebuilds it with the layers.
+        
+        Returns:
+            Callable[[str], Awaitable[Any]]: Coroutine function returning the
+                value for a key, or None on a miss
+        """
+        config = self._config
+        stats = self._stats
+        layer_hits = stats.layer_hits
+        
+        # Each entry is (layer type, layer, layer_hits key or None, read-through)
+        if getattr(config, 'use_layered_cache', False):
+            first_type = config.cache_layers[0].type
+            read_through = getattr(config, 'read_through', False)
+            chain = tuple(
+                (layer_type, self._cache_layers[layer_type],
+                 str(layer_type) if str(layer_type) in layer_hits else None,
+                 read_through and layer_type != first_type)
+                for layer_type in config.enabled_layer_types
+                if layer_type in self._cache_layers
+            )
+        else:
+            # For backward compatibility: try every available layer in turn
+            chain = tuple(
+                (getattr(layer, 'type', 'UNKNOWN'), layer, None, False)
+                for layer in self._cache_layers.values()
+            )
+        
+        telemetry = self._telemetry
+        counters = telemetry._counters if telemetry and telemetry.enabled else None
+        decompress = getattr(config, 'enable_compression', False)
+        propagate = self._propagate_to_higher_layers
+        l0_store = self._l0_store
+        log_extra = {'correlation_id': self._correlation_id}
+        
+        async def lookup(key: str) -> Any:
+            for layer_type, layer, hit_key, read_through in chain:
+                found, value = await layer.get(key)
+                if not found:
+                    continue
+                
+                stats.hits += 1
+                if hit_key is not None:
+                    layer_hits[hit_key] += 1
+                if counters is not None:
+                    counters['cache.hit'] += 1
+                logger.debug("Cache hit for key: %s in layer: %s", key, layer_type, extra=log_extra)
+                
+                # Found below the first layer: populate the higher-priority layers
+                if read_through:
+                    await propagate(key, value, layer_type)
+                
+                if decompress:
+                    value = decompress_data(value, config)
+                
+                l0_store(key, value)
+                return value
+            
+            # Not found in any layer
+            stats.misses += 1
+            if counters is not None:
+                counters['cache.miss'] += 1
+            logger.debug("Cache miss for key: %s", key, extra=log_extra)
+            return None
+        
+        return lookup
+    
     @timed_operation("get")
     @require_permission("read")
     async def get(self, key: str) -> Any:
@@ -709,119 +1134,57 @@ class CacheManager:
         Raises:
             CacheError: If there's an error accessing the cache
         """
+        # Pick up config changes made since the lookup was specialized
+        if self._config.revision != self._get_revision:
+            self._recompile_get()
+        
         # Record access for adaptive TTL
-        if hasattr(self, '_adaptive_ttl') and self._adaptive_ttl.enabled:
-            self._adaptive_ttl.record_access(key)
+        if self._record_access is not None:
+            self._record_access(key)
         
         if not key:
             raise CacheKeyError("Cache key cannot be empty")
+        
+        # Hot keys are answered from the front tier without awaiting a layer
+        value = self._l0_lookup(key)
+        if value is not _MISSING:
+            self._stats.hits += 1
+            if self._telemetry and self._telemetry.enabled:
+                self._telemetry._counters['cache.hit'] += 1
+            return value
             
         log_extra = {'correlation_id': self._correlation_id}
-        logger.debug(f"Getting key: {key}", extra=log_extra)
+        logger.debug("Getting key: %s", key, extra=log_extra)
         
-        try:
-            if getattr(self._config, 'use_layered_cache', False):
-                # Try each cache layer in order
-                for layer_config in self._config.cache_layers:
-                    if not layer_config.enabled:
-                        continue
-                        
-                    layer_type = layer_config.type
-                    if layer_type not in self._cache_layers:
-                        continue
-                        
-                    layer = self._cache_layers[layer_type]
-                    found, value = await layer.get(key)
-                    
-                    if found:
-                        self._stats["hits"] += 1
-                        layer_type_str = str(layer_type)
-                        if layer_type_str in self._stats["layer_hits"]:
-                            self._stats["layer_hits"][layer_type_str] += 1
-                        
-                        # Record hit in telemetry
-                        if self._telemetry and self._telemetry.enabled:
-                            self._telemetry._counters['cache.hit'] += 1
-                            
-                        logger.debug(
-                            f"Cache hit for key: {key} in layer: {layer_type}", 
-                            extra=log_extra
-                        )
-                        
-                        # If found in any layer except the first, and read-through is enabled,
-                        # populate previous layers
-                        if (getattr(self._config, 'read_through', False) and 
-                                layer_type != self._config.cache_layers[0].type):
-                            # Propagate to higher-priority layers
-                            await self._propagate_to_higher_layers(key, value, layer_type)
-                        
-                        # Decompress value if compression is enabled
-                        if getattr(self._config, 'enable_compression', False):
-                            value = decompress_data(value, self._config)
-                            
-                        return value
-                
-                # Not found in any layer
-                self._stats["misses"] += 1
-                
-                # Record miss in telemetry
+        for attempt in range(self._retry_attempts):
+            try:
+                return await self._get_fast(key)
+            except _PERMANENT_ERRORS:
                 if self._telemetry and self._telemetry.enabled:
-                    self._telemetry._counters['cache.miss'] += 1
-                    
-                logger.debug(f"Cache miss for key: {key}", extra=log_extra)
-                return None
-            else:
-                # For backward compatibility: use the first available layer
-                for layer in self._cache_layers.values():
-                    # Get the layer type for this layer
-                    layer_type = getattr(layer, 'type', 'UNKNOWN')
-                    found, value = await layer.get(key)
-                    if found:
-                        self._stats["hits"] += 1
-                        
-                        # Record hit in telemetry
-                        if self._telemetry and self._telemetry.enabled:
-                            self._telemetry._counters['cache.hit'] += 1
-                            
-                        logger.debug(f"Cache hit for key: {key} in layer: {layer_type}", extra=log_extra)
-                        
-                        # Update the recent keys tracker for LRU/access tracking
-                        if hasattr(self, '_recent_keys'):
-                            self._recent_keys[key] = time.time()
-                            
-                        # Decompress value if compression is enabled
-                        if getattr(self._config, 'enable_compression', False):
-                            value = decompress_data(value, self._config)
-                            
-                        return value
-                
-                self._stats["misses"] += 1
+                    self._telemetry._counters['cache.error'] += 1
+                raise
+            except _TRANSIENT_ERRORS as e:
+                if attempt + 1 < self._retry_attempts:
+                    logger.debug("Retrying get for key %s after: %s", key, e, extra=log_extra)
+                    await asyncio.sleep(self._retry_delay)
+                    continue
+                if self._telemetry and self._telemetry.enabled:
+                    self._telemetry._counters['cache.error'] += 1
+                if isinstance(e, CacheError):
+                    raise
+                raise CacheConnectionError(f"Error getting key {key}: {e}") from e
+            except Exception as e:
+                logger.error(f"Error getting key {key}: {str(e)}")
                 
-                # Record miss in telemetry
+                # Record error in telemetry
                 if self._telemetry and self._telemetry.enabled:
-                    self._telemetry._counters['cache.miss'] += 1
+                    self._telemetry._counters['cache.error'] += 1
                     
-                logger.debug(f"Cache miss for key: {key}", extra=log_extra)
-                return None
-        except CacheError:
-            # Record error in telemetry
-            if self._telemetry and self._telemetry.enabled:
-                self._telemetry._counters['cache.error'] += 1
-            # Re-raise CacheError to allow the retry decorator to catch it
-            raise
-        except Exception as e:
-            logger.error(f"Error getting key {key}: {str(e)}")
-            
-            # Record error in telemetry
-            if self._telemetry and self._telemetry.enabled:
-                self._telemetry._counters['cache.error'] += 1
-                
-            # Convert to CacheError and re-raise for retry
-            cache_error = CacheError(f"Error getting key {key}: {str(e)}")
-            raise cache_error from e
+                # Convert to CacheError
+                cache_error = CacheError(f"Error getting key {key}: {str(e)}")
+                raise cache_error from e
 
-    @retry(stop=stop_after_attempt(CacheConfig().retry_attempts), 
-           wait=wait_fixed(CacheConfig().retry_delay))
+    @_retry_transient
     @timed_operation("set")
     @require_permission("write")
     async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
@@ -842,10 +1205,10 @@ class CacheManager:
             logger.error("Cache key cannot be empty")
             return False
             
-        logger.debug(f"Setting key: {key}")
+        logger.debug("Setting key: %s", key)
         
         # Record statistics
-        self._stats["sets"] += 1
+        self._stats.sets += 1
         
         # Check access control if enabled
         if self._access_control and not self._access_control.check_access(self._current_user, key, "write"):
@@ -863,6 +1226,9 @@ class CacheManager:
             self._adaptive_ttl.record_access(key)
         
         success = False
+        # Drop any front-tier copy first; it is replaced once the write succeeds
+        self._l0.pop(key, None)
+        l0_value = value
         
         try:
             # Compress value if compression is enabled
@@ -883,7 +1249,7 @@ class CacheManager:
                     layer_success = await self._set_in_layer(layer, key, value, ttl)
                     if layer_type == self._primary_layer_type:
                         success = layer_success
-                    self._stats["layer_sets"] += 1
+                    self._stats.layer_sets += 1
             else:
                 # Just use the primary layer
                 success = await self._set_in_layer(self._primary_layer, key, value, ttl)
@@ -897,6 +1263,9 @@ class CacheManager:
             # Publish invalidation if cross-node invalidation is enabled
             if getattr(self._config, 'cross_node_invalidation', False) and self._redis_client:
                 await self._publish_invalidation(key)
+            
+            if success:
+                self._l0_store(key, l0_value, ttl)
                 
         except CacheError:
             # Record error in telemetry
@@ -914,8 +1283,7 @@ class CacheManager:
                 
         return success
 
-    @retry(stop=stop_after_attempt(CacheConfig().retry_attempts), 
-           wait=wait_fixed(CacheConfig().retry_delay))
+    @_retry_transient
     async def delete(self, key: str) -> bool:
         """Delete a value from the cache.
         
@@ -933,9 +1301,10 @@ class CacheManager:
             raise CacheKeyError("Cache key cannot be empty")
             
         log_extra = {'correlation_id': self._correlation_id}
-        logger.debug(f"Deleting key: {key}", extra=log_extra)
+        logger.debug("Deleting key: %s", key, extra=log_extra)
         
         deleted = False
+        self._l0.pop(key, None)
         
         # Delete from all layers
         for layer in self._cache_layers.values():
@@ -952,22 +1321,18 @@ class CacheManager:
         """
         log_extra = {'correlation_id': self._correlation_id}
         logger.debug("Clearing all cache keys", extra=log_extra)
+        self._l0.clear()
         
         # Clear each layer
         for layer_type, layer in self._cache_layers.items():
             try:
                 await layer.clear()
-                logger.debug(f"Cleared {layer_type} layer", extra=log_extra)
+                logger.debug("Cleared %s layer", layer_type, extra=log_extra)
             except Exception as e:
                 logger.error(f"Error clearing {layer_type} layer: {e}", extra=log_extra)
         
         # Reset statistics
-        for key in self._stats:
-            if isinstance(self._stats[key], dict):
-                for subkey in self._stats[key]:
-                    self._stats[key][subkey] = 0
-            else:
-                self._stats[key] = 0
+        self._stats.reset()
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
@@ -975,7 +1340,7 @@ class CacheManager:
         Returns:
             Dict[str, Any]: Dictionary with cache statistics
         """
-        stats = self._stats.copy()
+        stats = self._stats.as_dict()
         
         # Calculate hit rate
         total_requests = stats["hits"] + stats["misses"]
@@ -1094,8 +1459,29 @@ class CacheManager:
             
             raise AttributeError("Function is not decorated with @cached")
 
-    @retry(stop=stop_after_attempt(CacheConfig().retry_attempts), 
-           wait=wait_fixed(CacheConfig().retry_delay))
+    def _record_layer_hits(self, layer_results: Dict[str, Any], result: Dict[str, Any],
+                           remaining_keys: set, layer_type: Any) -> None:
+        """Merge one layer's get_many results and update hit statistics.
+        
+        Statistics are updated once per layer rather than once per key.
+        
+        Args:
+            layer_results: Values returned by the layer
+            result: Accumulated results to update
+            remaining_keys: Keys still to look up; found keys are removed
+            layer_type: Type of the layer the results came from
+        """
+        if not layer_results:
+            return
+        found = len(layer_results)
+        result.update(layer_results)
+        remaining_keys.difference_update(layer_results)
+        self._stats.hits += found
+        layer_type_str = str(layer_type)
+        if layer_type_str in self._stats.layer_hits:
+            self._stats.layer_hits[layer_type_str] += found
+
+    @_retry_transient
     async def get_many(self, keys: List[str]) -> Dict[str, Any]:
         """Get multiple values from the cache at once.
         
@@ -1113,7 +1499,7 @@ class CacheManager:
             return {}
             
         log_extra = {'correlation_id': self._correlation_id}
-        logger.debug(f"Getting {len(keys)} keys with get_many", extra=log_extra)
+        logger.debug("Getting %d keys with get_many", len(keys), extra=log_extra)
         
         result = {}
         
@@ -1121,11 +1507,10 @@ class CacheManager:
             # Get from each layer, filling in missing keys
             remaining_keys = set(keys)
             
-            for layer_config in self._config.cache_layers:
-                if not layer_config.enabled or not remaining_keys:
-                    continue
+            for layer_type in self._config.enabled_layer_types:
+                if not remaining_keys:
+                    break
                     
-                layer_type = layer_config.type
                 if layer_type not in self._cache_layers:
                     continue
                     
@@ -1133,24 +1518,14 @@ class CacheManager:
                 layer_results = await layer.get_many(list(remaining_keys))
                 
                 # Add to result and track which keys were found
-                for key, value in layer_results.items():
-                    result[key] = value
-                    remaining_keys.remove(key)
-                    self._stats["hits"] += 1
-                    layer_type_str = str(layer_type)
-                    if layer_type_str in self._stats["layer_hits"]:
-                        self._stats["layer_hits"][layer_type_str] += 1
+                self._record_layer_hits(layer_results, result, remaining_keys, layer_type)
                 
                 # If read-through is enabled, populate previous layers with found values
                 if (self._config.read_through and 
                         layer_results and 
                         layer_type != self._config.cache_layers[0].type):
                     # For each key found in this layer, populate previous layers
-                    for prev_layer_config in self._config.cache_layers:
-                        if not prev_layer_config.enabled:
-                            continue
-                            
-                        prev_layer_type = prev_layer_config.type
+                    for prev_layer_type in self._config.enabled_layer_types:
                         if prev_layer_type == layer_type:
                             break
                             
@@ -1159,7 +1534,7 @@ class CacheManager:
                             await prev_layer.set_many(layer_results)
             
             # Count misses
-            self._stats["misses"] += len(remaining_keys)
+            self._stats.misses += len(remaining_keys)
                 
         else:
             # For backward compatibility, try each layer in order
@@ -1172,23 +1547,16 @@ class CacheManager:
                 layer_results = await layer.get_many(list(remaining_keys))
                 
                 # Add to result and track which keys were found
-                for key, value in layer_results.items():
-                    result[key] = value
-                    remaining_keys.remove(key)
-                    self._stats["hits"] += 1
-                    # Get layer type for this layer
-                    current_layer_type = getattr(layer, 'type', 'UNKNOWN')
-                    layer_type_str = str(current_layer_type)
-                    if layer_type_str in self._stats["layer_hits"]:
-                        self._stats["layer_hits"][layer_type_str] += 1
+                self._record_layer_hits(
+                    layer_results, result, remaining_keys, getattr(layer, 'type', 'UNKNOWN')
+                )
             
             # Count misses
-            self._stats["misses"] += len(remaining_keys)
+            self._stats.misses += len(remaining_keys)
         
         return result
 
-    @retry(stop=stop_after_attempt(CacheConfig().retry_attempts), 
-           wait=wait_fixed(CacheConfig().retry_delay))
+    @_retry_transient
     async def set_many(self, key_values: Dict[str, Any], expiration: Optional[int] = None):
         """Set multiple values in the cache at once.
         
@@ -1204,9 +1572,14 @@ class CacheManager:
             return
             
         log_extra = {'correlation_id': self._correlation_id}
-        logger.debug(f"Setting {len(key_values)} keys with set_many", extra=log_extra)
+        logger.debug("Setting %d keys with set_many", len(key_values), extra=log_extra)
         
-        self._stats["sets"] += len(key_values)
+        self._stats.sets += len(key_values)
+        
+        # Stale front-tier copies would shadow the new values
+        l0 = self._l0
+        for key in key_values:
+            l0.pop(key, None)
         
         if self._config.use_layered_cache:
             # Set in each layer as configured
@@ -1256,20 +1629,21 @@ class CacheManager:
         # Specifically handle main background tasks
         for task_name, task in [
             ("disk_monitor_task", self._disk_monitor_task),
+            ("ttl_sweeper_task", self._ttl_sweeper_task),
             ("warmup_task", self._warmup_task),
             ("telemetry_task", self._telemetry_task)
         ]:
             if task and not task.done():
-                self._logger.debug(f"Cancelling {task_name}", extra={"correlation_id": self._correlation_id})
+                self._logger.debug("Cancelling %s", task_name, extra={"correlation_id": self._correlation_id})
                 task.cancel()
                 try:
                     await asyncio.shield(asyncio.wait_for(asyncio.gather(task, return_exceptions=True), timeout=2))
                 except (asyncio.CancelledError, asyncio.TimeoutError) as e:
-                    self._logger.debug(f"{task_name} cancellation: {str(e)}", extra={"correlation_id": self._correlation_id})
+                    self._logger.debug("%s cancellation: %s", task_name, e, extra={"correlation_id": self._correlation_id})
         
         # Wait for all tasks to complete
         if self._tasks:
-            self._logger.debug(f"Waiting for {len(self._tasks)} tasks to complete", extra={"correlation_id": self._correlation_id})
+            self._logger.debug("Waiting for %d tasks to complete", len(self._tasks), extra={"correlation_id": self._correlation_id})
             try:
                 await asyncio.wait_for(asyncio.gather(*self._tasks, return_exceptions=True), timeout=5)
             except asyncio.TimeoutError:
@@ -1277,6 +1651,7 @@ class CacheManager:
         
         # Ensure all tasks are cleared
         self._disk_monitor_task = None
+        self._ttl_sweeper_task = None
         self._warmup_task = None
         self._telemetry_task = None
         self._tasks.clear()
@@ -1284,7 +1659,7 @@ class CacheManager:
         # Close all cache layers
         for layer_type, layer in self._cache_layers.items():
             try:
-                self._logger.debug(f"Closing {layer_type} layer", extra={"correlation_id": self._correlation_id})
+                self._logger.debug("Closing %s layer", layer_type, extra={"correlation_id": self._correlation_id})
                 await layer.close()
             except Exception as e:
                 self._logger.error(f"Error closing {layer_type} layer: {e}", extra={"correlation_id": self._correlation_id})
@@ -1295,6 +1670,8 @@ class CacheManager:
                 self._logger.debug("Closing Redis client", extra={"correlation_id": self._correlation_id})
                 await self._redis.aclose()  # Use aclose() instead of close()
                 self._redis = None
+                # The pool itself is shared; only the last user disconnects it
+                await self._release_pool()
             except Exception as e:
                 self._logger.error(f"Error closing Redis client: {e}", extra={"correlation_id": self._correlation_id})
         
@@ -1316,17 +1693,13 @@ class CacheManager:
                     """Handle invalidation for a specific key."""
                     key = data.get('key')
                     if key:
-                        # Delete from all cache layers
-                        for layer in self._cache_layers.values():
-                            await layer.delete(self._namespace_key(key))
+                        await self._invalidate_keys([key])
                 
-                async def handle_pattern_invalidation(data: Dict[str, Any]) -> None:
-                    """Handle invalidation for a pattern (multiple keys)."""
-                    pattern = data.get('pattern')
-                    if pattern:
-                        # We'd need a way to list keys matching a pattern
-                        # For now, this is a placeholder
-                        pass
+                async def handle_keys_invalidation(data: Dict[str, Any]) -> None:
+                    """Handle invalidation for a batch of keys."""
+                    keys = data.get('keys')
+                    if keys:
+                        await self._invalidate_keys(keys)
                 
                 async def handle_namespace_invalidation(data: Dict[str, Any]) -> None:
                     """Handle invalidation for an entire namespace."""
@@ -1335,8 +1708,10 @@ class CacheManager:
                         # Clear all cache layers for this namespace
                         await self.clear()
                 
+                # Pattern invalidation is not supported yet (it needs a way to list
+                # matching keys), so no no-op handler is registered for it
                 self._invalidation_manager.add_callback(InvalidationEvent.KEY, handle_key_invalidation)
-                self._invalidation_manager.add_callback(InvalidationEvent.PATTERN, handle_pattern_invalidation)
+                self._invalidation_manager.add_callback(InvalidationEvent.KEYS, handle_keys_invalidation)
                 self._invalidation_manager.add_callback(InvalidationEvent.NAMESPACE, handle_namespace_invalidation)
             
             # Perform cache warmup if enabled
@@ -1358,7 +1733,8 @@ class CacheManager:
             
         try:
             # Find the index of the source layer in the layer order
-            layer_types = [layer.type for layer in self._config.cache_layers if layer.enabled]
+            layer_types = self._config.enabled_layer_types
+            layer_ttls = self._config.enabled_layer_ttls
             if source_layer not in layer_types:
                 return
                 
@@ -1370,11 +1746,9 @@ class CacheManager:
                 if target_layer_type in self._cache_layers:
                     target_layer = self._cache_layers[target_layer_type]
                     # Use the TTL configured for this layer
-                    ttl = next((layer.ttl for layer in self._config.cache_layers 
-                               if layer.type == target_layer_type), None)
-                    await target_layer.set(key, value, ttl)
+                    await target_layer.set(key, value, layer_ttls[i])
                     self._logger.debug(
-                        f"Propagated key {key} from {source_layer} to {target_layer_type}",
+                        "Propagated key %s from %s to %s", key, source_layer, target_layer_type,
                         extra={"correlation_id": self._correlation_id}
                     )
         except Exception as e:
@@ -1457,23 +1831,12 @@ class CacheManager:
             # Publish to the invalidation channel
             channel = f"{self._config.namespace}:invalidation"
             await self._redis_client.publish(channel, message)
-            logger.debug(f"Published invalidation for key: {key}")
+            logger.debug("Published invalidation for key: %s", key)
             return True
         except Exception as e:
             logger.error(f"Error publishing invalidation for key {key}: {str(e)}")
             return False
 
-    async def _cleanup_disk_cache(self, aggressive: bool = False) -> int:
-        """Alias for _clean_disk_cache to maintain backward compatibility.
-        
-        Args:
-            aggressive: If True, perform more aggressive cleanup
-            
-        Returns:
-            int: Number of items removed from cache
-        """
-        return await self._clean_disk_cache(aggressive=aggressive)
-
     def _compress_data(self, value: Any) -> Any:
         """Compress data if it's large enough.
         
@@ -26,6 +26,7 @@ class InvalidationError(CacheError):
 class InvalidationEvent(str, Enum):
     """Types of cache invalidation events."""
     KEY = "key"  # Invalidate a specific key
+    KEYS = "keys"  # Invalidate a batch of keys
     PATTERN = "pattern"  # Invalidate keys matching a pattern
     NAMESPACE = "namespace"  # Invalidate an entire namespace
     ALL = "all"  # Invalidate all cached data
@@ -249,6 +250,35 @@ class InvalidationManager:
             logger.error(f"Failed to publish key invalidation: {e}")
             raise InvalidationError(f"Failed to publish key invalidation: {e}") from e
     
+    async def invalidate_keys(self, keys: List[str], reason: Optional[str] = None) -> None:
+        """Invalidate a batch of cache keys across all nodes with a single event.
+        
+        Args:
+            keys: Cache keys to invalidate
+            reason: Optional reason for invalidation
+            
+        Raises:
+            InvalidationError: If there's an error publishing the event
+        """
+        if not self.enabled or self._redis is None or not keys:
+            return
+            
+        event = {
+            'type': InvalidationEvent.KEYS.value,
+            'keys': list(keys),
+            'timestamp': datetime.now().isoformat(),
+            'node_id': self._node_id,
+            'reason': reason
+        }
+        
+        try:
+            # Publish the invalidation event
+            await self._redis.publish(self._channel, json.dumps(event))
+            logger.debug(f"Published invalidation for {len(keys)} keys")
+        except RedisError as e:
+            logger.error(f"Failed to publish keys invalidation: {e}")
+            raise InvalidationError(f"Failed to publish keys invalidation: {e}") from e
+    
     async def invalidate_pattern(self, pattern: str, reason: Optional[str] = None) -> None:
         """Invalidate all cache keys matching a pattern.
         
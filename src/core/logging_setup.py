@@ -4,8 +4,12 @@ import os
 import logging
 import logging.handlers
 from datetime import datetime
+from typing import TYPE_CHECKING
 
-from ..cache_config import CacheConfig, LogLevel
+from ..cache_enums import LogLevel
+
+if TYPE_CHECKING:
+    from ..cache_config import CacheConfig
 
 class CorrelationIdFilter(logging.Filter):
     """Add correlation_id to all log records.
@@ -25,7 +29,16 @@ class CorrelationIdFilter(logging.Filter):
             record.correlation_id = 'N/A'
         return True
 
-def setup_logging(config: CacheConfig) -> logging.Logger:
+# Map LogLevel enum to logging module levels
+_LOG_LEVEL_MAP = {
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+    LogLevel.CRITICAL: logging.CRITICAL
+}
+
+def setup_logging(config: "CacheConfig") -> logging.Logger:
     """Set up logging configuration based on CacheConfig.
     
     Args:
@@ -34,16 +47,7 @@ def setup_logging(config: CacheConfig) -> logging.Logger:
     Returns:
         logging.Logger: Configured logger instance
     """
-    # Map LogLevel enum to logging module levels
-    log_level_map = {
-        LogLevel.DEBUG: logging.DEBUG,
-        LogLevel.INFO: logging.INFO,
-        LogLevel.WARNING: logging.WARNING,
-        LogLevel.ERROR: logging.ERROR,
-        LogLevel.CRITICAL: logging.CRITICAL
-    }
-    
-    log_level = log_level_map.get(config.log_level, logging.INFO)
+    log_level = _LOG_LEVEL_MAP.get(config.log_level, logging.INFO)
     logger = logging.getLogger(__name__.split('.')[0])  # Get the top-level package name
     
     # Remove any existing handlers
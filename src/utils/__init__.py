@@ -1,7 +1,7 @@
 """Utility modules for CacheManager."""
 
 from .namespacing import NamespaceManager
-from .serialization import Serializer
+from .serialization import Serializer, build_compression_dict
 from .disk_cache import DiskCacheManager
 from .initialization import CacheInitializer
 from .compression import compress_data, decompress_data
@@ -9,6 +9,7 @@ from .compression import compress_data, decompress_data
 __all__ = [
     'NamespaceManager',
     'Serializer',
+    'build_compression_dict',
     'DiskCacheManager',
     'CacheInitializer',
     'compress_data',
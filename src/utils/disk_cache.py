@@ -5,10 +5,25 @@ import shelve
 import time
 import logging
 import shutil
-from typing import Optional
+from functools import partial
+from typing import Any, List, MutableMapping, Optional, Set
 
 logger = logging.getLogger(__name__)
 
+# Directories already created (or found) by this process
+_created_dirs: Set[str] = set()
+
+def ensure_dir(path: str) -> None:
+    """Create a directory if needed, touching the filesystem once per path per process.
+    
+    Args:
+        path: The directory to create
+    """
+    if path in _created_dirs:
+        return
+    os.makedirs(path, exist_ok=True)
+    _created_dirs.add(path)
+
 class DiskCacheManager:
     """Manages disk-based cache operations.
     
@@ -19,7 +34,8 @@ class DiskCacheManager:
                  cache_dir: str,
                  cache_file: str,
                  namespace: str = "default",
-                 correlation_id: Optional[str] = None):
+                 correlation_id: Optional[str] = None,
+                 create_dir: bool = True):
         """Initialize the disk cache manager.
         
         Args:
@@ -27,6 +43,8 @@ class DiskCacheManager:
             cache_file: Base filename for disk cache
             namespace: Cache namespace
             correlation_id: Correlation ID for logging
+            create_dir: Whether to create cache_dir (skipped when nothing is
+                stored on disk)
         """
         self.cache_dir = cache_dir
         self.cache_file = cache_file
@@ -34,7 +52,8 @@ class DiskCacheManager:
         self.correlation_id = correlation_id or "DCM"
         
         # Ensure cache directory exists
-        os.makedirs(self.cache_dir, exist_ok=True)
+        if create_dir:
+            ensure_dir(self.cache_dir)
         
         # Initialize shelve file path with namespace
         namespace_suffix = f"_{namespace}" if namespace != "default" else ""
@@ -42,6 +61,18 @@ class DiskCacheManager:
             self.cache_dir, 
             f"{os.path.splitext(self.cache_file)[0]}{namespace_suffix}.db"
         )
+        
+        # Disk layer holding shelve_file open, if any; cleanup then goes
+        # through its handle instead of opening a second one
+        self._disk_layer = None
+    
+    def attach_layer(self, disk_layer: Any) -> None:
+        """Route cleanup through the disk layer that keeps the shelve file open.
+        
+        Args:
+            disk_layer: The DiskLayer storing its entries in shelve_file
+        """
+        self._disk_layer = disk_layer
     
     def get_disk_usage(self) -> float:
         """Get current disk cache usage as percentage.
@@ -115,64 +146,20 @@ class DiskCacheManager:
         Returns:
             int: Number of items removed
         """
-        removed_count = 0
-        
         try:
-            # Target percentage to remove in aggressive mode
-            aggressive_percent = 50  # Remove up to 50% of items in aggressive mode
-            
-            # Open shelve file for reading/writing
-            with shelve.open(self.shelve_file, writeback=True) as db:
-                # Get all keys and their expiration info
-                cache_items = []
-                for key in list(db.keys()):
-                    # Skip metadata keys
-                    if key.endswith('__expires'):
-                        continue
-                        
-                    # Get expire time
-                    expire_key = f"{key}__expires"
-                    expire_time = db.get(expire_key, 0.0)
-                    
-                    # Add to collection for sorting
-                    cache_items.append((key, expire_time))
-                
-                # Sort by expiration time (oldest first)
-                cache_items.sort(key=lambda x: x[1])
-                
-                # Determine how many items to remove
-                target_removal = 0
-                
-                if aggressive:
-                    # In aggressive mode, remove a percentage of items
-                    target_removal = int(len(cache_items) * (aggressive_percent / 100))
-                    target_removal = max(target_removal, 10)  # At least 10 items
-                else:
-                    # In normal mode, just remove expired items
-                    target_removal = sum(1 for _, expire_time in cache_items 
-                                     if expire_time < retention_threshold)
-                
-                # Remove items (up to target)
-                for i, (key, _) in enumerate(cache_items):
-                    if i >= target_removal:
-                        break
-                        
-                    # Remove both the value and expiration keys
-                    expire_key = f"{key}__expires"
-                    if key in db:
-                        del db[key]
-                    if expire_key in db:
-                        del db[expire_key]
-                        
-                    removed_count += 1
-                    
-                    # Debug log
-                    logger.debug(
-                        f"Removed old cache item: {key}", 
-                        extra={"correlation_id": self.correlation_id}
-                    )
-            
-            return removed_count
+            remove = partial(self._remove_oldest_from,
+                             retention_threshold=retention_threshold,
+                             aggressive=aggressive)
+            
+            if self._disk_layer is not None:
+                # The layer's open handle would undo deletes made through another
+                removed = await self._disk_layer.run_maintenance(remove)
+            else:
+                # Open shelve file for reading/writing
+                with shelve.open(self.shelve_file, writeback=True) as db:
+                    removed = remove(db)
+            
+            return len(removed)
             
         except Exception as e:
             logger.error(
@@ -181,6 +168,72 @@ class DiskCacheManager:
             )
             return 0
             
+    def _remove_oldest_from(self,
+                            db: MutableMapping[str, Any],
+                            retention_threshold: float,
+                            aggressive: bool = False) -> List[str]:
+        """Remove oldest items from an open shelve.
+        
+        Args:
+            db: The open shelve
+            retention_threshold: Timestamp threshold for retention
+            aggressive: If True, remove more aggressively
+            
+        Returns:
+            List[str]: The keys that were removed
+        """
+        # Target percentage to remove in aggressive mode
+        aggressive_percent = 50  # Remove up to 50% of items in aggressive mode
+        
+        # Get all keys and their expiration info
+        cache_items = []
+        for key in list(db.keys()):
+            # Skip metadata keys
+            if key.endswith('__expires'):
+                continue
+                
+            # Get expire time
+            expire_key = f"{key}__expires"
+            expire_time = db.get(expire_key, 0.0)
+            
+            # Add to collection for sorting
+            cache_items.append((key, expire_time))
+        
+        # Sort by expiration time (oldest first)
+        cache_items.sort(key=lambda x: x[1])
+        
+        # Determine how many items to remove
+        target_removal = 0
+        
+        if aggressive:
+            # In aggressive mode, remove a percentage of items
+            target_removal = int(len(cache_items) * (aggressive_percent / 100))
+            target_removal = max(target_removal, 10)  # At least 10 items
+        else:
+            # In normal mode, just remove expired items
+            target_removal = sum(1 for _, expire_time in cache_items 
+                             if expire_time < retention_threshold)
+        
+        # Remove items (up to target)
+        removed = []
+        for key, _ in cache_items[:target_removal]:
+            # Remove both the value and expiration keys
+            expire_key = f"{key}__expires"
+            if key in db:
+                del db[key]
+            if expire_key in db:
+                del db[expire_key]
+                
+            removed.append(key)
+            
+            # Debug log
+            logger.debug(
+                f"Removed old cache item: {key}", 
+                extra={"correlation_id": self.correlation_id}
+            )
+        
+        return removed
+            
     async def compact_cache(self) -> bool:
         """Compact the disk cache to reclaim space.
         
@@ -2,9 +2,12 @@
 
 import os
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, TYPE_CHECKING
 
-from ..cache_config import CacheConfig, CacheLayerType
+from ..cache_enums import CacheLayerType
+
+if TYPE_CHECKING:
+    from ..cache_config import CacheConfig
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +18,7 @@ class CacheInitializer:
     of the CacheManager, like cache layers, telemetry, encryption, etc.
     """
     
-    def __init__(self, config: CacheConfig, correlation_id: str):
+    def __init__(self, config: "CacheConfig", correlation_id: str):
         """Initialize the CacheInitializer.
         
         Args:
@@ -32,7 +35,7 @@ class CacheInitializer:
             Dictionary containing cache layer instances and related components
         """
         # Import cache layers here to avoid circular import
-        from ..cache_layers import MemoryLayer, RedisLayer, DiskLayer
+        from ..cache_layers import MemoryLayer, DiskLayer
         
         cache_layers = {}
         primary_layer = None
@@ -71,7 +74,8 @@ class CacheInitializer:
                 namespace=self.config.namespace,
                 ttl=self.config.disk_cache_ttl,
                 cache_dir=self.config.cache_dir,
-                cache_file=cache_file
+                cache_file=cache_file,
+                write_behind=self.config.disk_write_behind
             )
             
             # Use disk as primary layer if memory is disabled
@@ -83,6 +87,7 @@ class CacheInitializer:
         if self.config.use_redis:
             # Try to initialize Redis
             try:
+                from ..cache_layers import RedisLayer
                 redis_layer = RedisLayer(
                     namespace=self.config.namespace,
                     ttl=self.config.redis_ttl,
@@ -150,8 +155,6 @@ class CacheInitializer:
         from ..core.adaptive_ttl import AdaptiveTTLManager
         from ..core.cache_warmup import CacheWarmup
         from ..core.security import CacheEncryptor, DataSigner, AccessControl
-        from ..core.invalidation import InvalidationManager
-        from ..core.sharding import ShardManager, HashRingShardingStrategy, ModuloShardingStrategy
         
         components = {}
         
@@ -195,26 +198,50 @@ class CacheInitializer:
         )
         
         # Initialize distributed features if Redis is provided
-        if redis_client and self.config.use_redis:
-            # Initialize invalidation manager
-            components["invalidation_manager"] = InvalidationManager(
-                redis_client=redis_client,
-                channel=self.config.invalidation_channel,
-                enabled=self.config.enable_invalidation,
-                node_id=f"node-{self.correlation_id}"
+        if redis_client:
+            components.update(self.setup_distributed_components(redis_client))
+        
+        return components
+    
+    def setup_distributed_components(self, redis_client) -> Dict[str, Any]:
+        """Set up the components that need a Redis client.
+        
+        Kept apart from setup_core_components so a CacheManager can add them
+        once its Redis client is ready without rebuilding the others.
+        
+        Args:
+            redis_client: Redis client shared by the distributed components
+            
+        Returns:
+            Dictionary containing distributed component instances
+        """
+        # Import core components here to avoid circular import
+        from ..core.invalidation import InvalidationManager
+        from ..core.sharding import ShardManager, HashRingShardingStrategy, ModuloShardingStrategy
+        
+        components = {}
+        if not self.config.use_redis:
+            return components
+        
+        # Initialize invalidation manager
+        components["invalidation_manager"] = InvalidationManager(
+            redis_client=redis_client,
+            channel=self.config.invalidation_channel,
+            enabled=self.config.enable_invalidation,
+            node_id=f"node-{self.correlation_id}"
+        )
+        
+        # Initialize shard manager
+        if self.config.enable_sharding:
+            strategy = (
+                HashRingShardingStrategy() 
+                if self.config.sharding_algorithm == "consistent_hash"
+                else ModuloShardingStrategy()
             )
             
-            # Initialize shard manager
-            if self.config.enable_sharding:
-                strategy = (
-                    HashRingShardingStrategy() 
-                    if self.config.sharding_algorithm == "consistent_hash"
-                    else ModuloShardingStrategy()
-                )
-                
-                components["shard_manager"] = ShardManager(
-                    num_shards=self.config.num_shards,
-                    strategy=strategy
-                )
+            components["shard_manager"] = ShardManager(
+                num_shards=self.config.num_shards,
+                strategy=strategy
+            )
         
-        return components 
\ No newline at end of file
+        return components
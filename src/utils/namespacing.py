@@ -15,6 +15,8 @@ class NamespaceManager:
             namespace: The namespace to use for keys
         """
         self.namespace = namespace
+        # Prefix added to every key; the default namespace leaves keys untouched
+        self.prefix = "" if namespace == "default" else f"{namespace}:"
     
     def namespace_key(self, key: str) -> str:
         """Add namespace prefix to a key.
@@ -25,9 +27,7 @@ class NamespaceManager:
         Returns:
             str: The namespaced key
         """
-        if self.namespace == "default":
-            return key
-        return f"{self.namespace}:{key}"
+        return self.prefix + key
     
     def remove_namespace(self, namespaced_key: str) -> str:
         """Remove namespace prefix from a key.
@@ -38,10 +38,10 @@ class NamespaceManager:
         Returns:
             str: The original key without namespace
         """
-        if self.namespace == "default" or ":" not in namespaced_key:
-            return namespaced_key
-        _, key = namespaced_key.split(":", 1)
-        return key
+        prefix = self.prefix
+        if prefix and namespaced_key.startswith(prefix):
+            return namespaced_key[len(prefix):]
+        return namespaced_key
     
     def namespace_keys_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Add namespace prefix to all keys in a dictionary.
@@ -52,7 +52,8 @@ class NamespaceManager:
         Returns:
             Dict[str, Any]: Dictionary with namespaced keys
         """
-        return {self.namespace_key(key): value for key, value in data.items()}
+        prefix = self.prefix
+        return {prefix + key: value for key, value in data.items()}
     
     def remove_namespace_from_keys_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Remove namespace prefix from all keys in a dictionary.
@@ -63,4 +64,9 @@ class NamespaceManager:
         Returns:
             Dict[str, Any]: Dictionary with original keys
         """
-        return {self.remove_namespace(key): value for key, value in data.items()} 
\ No newline at end of file
+        prefix = self.prefix
+        if not prefix:
+            return dict(data)
+        plen = len(prefix)
+        return {(key[plen:] if key.startswith(prefix) else key): value
+                for key, value in data.items()} 
\ No newline at end of file
@@ -4,17 +4,81 @@ import pickle
 import zlib
 import logging
 import msgpack
-from typing import Any, Optional, Dict
+from collections import Counter
+from functools import partial
+from typing import Any, Callable, Optional, Dict, Iterable
 
+from ..cache_enums import SerializationCodec
 from ..core.exceptions import CacheSerializationError
 
 logger = logging.getLogger(__name__)
 
+# LZ4 is optional; serialize() falls back to zlib without it
+try:
+    import lz4.frame
+    HAS_LZ4 = True
+except ImportError:
+    lz4 = None
+    HAS_LZ4 = False
+
+# msgspec is optional; its msgpack output is read by msgpack and vice versa
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    msgspec = None
+    HAS_MSGSPEC = False
+
+# Protocol 5 writes bytes-like payloads without intermediate copies
+_PICKLE_PROTOCOL = 5
+
+# Size of the prefix compressed to estimate how well a payload compresses
+_PROBE_SIZE = 4096
+# Compressed/original ratio above which a payload is stored uncompressed
+_MAX_PROBE_RATIO = 0.8
+# zlib only references the last 32 KB of a preset dictionary
+_MAX_DICT_SIZE = 32 * 1024
+
+def _compress_if_worthwhile(data: bytes, compression_level: int,
+                            use_lz4: bool = False) -> Optional[bytes]:
+    """Compress data unless a probe shows it is not worth the CPU.
+    
+    Compresses the first _PROBE_SIZE bytes at level 1 and gives up when the
+    probe does not shrink by at least 20%, which catches payloads that are
+    already compressed or random without walking the whole buffer.
+    
+    Args:
+        data: The serialized payload
+        compression_level: Zlib compression level for the full payload
+        use_lz4: Compress the full payload with LZ4 instead of zlib
+        
+    Returns:
+        Optional[bytes]: The marker-prefixed compressed payload, or None to
+            store it as is
+    """
+    probe = data[:_PROBE_SIZE]
+    probe_compressed = zlib.compress(probe, level=1)
+    if len(probe_compressed) > len(probe) * _MAX_PROBE_RATIO:
+        return None
+    
+    if use_lz4:
+        return b'L' + lz4.frame.compress(data, compression_level=0)
+    
+    # The probe already covers small payloads at the default level
+    if len(probe) == len(data) and compression_level == 1:
+        return b'C' + probe_compressed
+    return b'C' + zlib.compress(data, level=compression_level)
+
 class Serializer:
     """Handles data serialization and deserialization for cache values.
     
     This class provides methods to serialize and deserialize values with msgpack,
     with optional compression, encryption, and signing.
+    
+    Values are framed with a one-byte marker: 'U' (msgpack), 'C' (zlib-compressed
+    msgpack), and with the pickle codec 'P' (pickle) or 'Q' (zlib-compressed
+    pickle). The msgpack and msgspec codecs share a wire format, so switching
+    between them does not invalidate cached data.
     """
     
     def __init__(self, 
@@ -23,8 +87,9 @@ class Serializer:
                  compression_level: int = 6,
                  encryptor = None,
                  data_signer = None,
-                 stats: Optional[Dict[str, int]] = None,
-                 correlation_id: str = None):
+                 stats: Optional[Any] = None,
+                 correlation_id: str = None,
+                 codec: SerializationCodec = SerializationCodec.MSGPACK):
         """Initialize the serializer.
         
         Args:
@@ -33,8 +98,10 @@ class Serializer:
             compression_level: Zlib compression level (0-9)
             encryptor: Optional encryptor instance for encryption
             data_signer: Optional data signer instance for signing
-            stats: Optional dictionary for tracking error statistics
+            stats: Optional stats object with an errors counter (or a
+                dictionary with an "errors" key) for tracking error statistics
             correlation_id: Correlation ID for logging
+            codec: Codec used to encode values (see SerializationCodec)
         """
         self.enable_compression = enable_compression
         self.compression_min_size = compression_min_size
@@ -43,12 +110,32 @@ class Serializer:
         self.data_signer = data_signer
         self.stats = stats
         self.correlation_id = correlation_id
+        
+        self.codec = SerializationCodec(codec)
+        if self.codec == SerializationCodec.MSGSPEC and not HAS_MSGSPEC:
+            logger.warning(
+                "msgspec is not installed; falling back to the msgpack codec",
+                extra={"correlation_id": correlation_id}
+            )
+            self.codec = SerializationCodec.MSGPACK
+        self._allow_pickle = self.codec == SerializationCodec.PICKLE
+        
+        # Encoder and decoder bound once so serialize/deserialize don't
+        # re-check the codec per value
+        if self.codec == SerializationCodec.MSGSPEC:
+            self._pack = msgspec.msgpack.Encoder().encode
+            self._unpack = msgspec.msgpack.Decoder().decode
+        else:
+            self._pack = partial(msgpack.packb, use_bin_type=True)
+            self._unpack = partial(msgpack.unpackb, raw=False,
+                                   ext_hook=self._decode_complex_types)
 
     def serialize(self, value: Any) -> bytes:
         """Serialize a value for storage.
         
-        Serializes the value with msgpack (or pickle if msgpack not available),
-        and optionally compresses, encrypts, and signs it.
+        Serializes the value with the configured codec (with the pickle codec,
+        values msgpack cannot encode are pickled), and optionally compresses,
+        encrypts, and signs it.
         
         Args:
             value: The value to serialize
@@ -60,16 +147,27 @@ class Serializer:
             CacheSerializationError: If serialization fails
         """
         try:
-            # Serialize with msgpack
-            serialized = msgpack.packb(value, use_bin_type=True)
+            # Serialize with msgpack, falling back to pickle if allowed
+            try:
+                serialized = self._pack(value)
+                pickled = False
+            except TypeError:
+                if not self._allow_pickle:
+                    raise
+                serialized = pickle.dumps(value, protocol=_PICKLE_PROTOCOL)
+                pickled = True
             
-            # Compress if enabled and the value is large enough
+            # Compress if enabled, the value is large enough and it compresses well
+            compressed = None
             if (self.enable_compression and 
                 len(serialized) >= self.compression_min_size):
-                compressed = zlib.compress(serialized, level=self.compression_level)
-                serialized = b'C' + compressed  # Prefix with 'C' to indicate compression
+                # Prefixed with 'C' to indicate compression
+                compressed = _compress_if_worthwhile(serialized, self.compression_level)
+            if compressed is not None:
+                serialized = b'Q' + memoryview(compressed)[1:] if pickled else compressed
             else:
-                serialized = b'U' + serialized  # Prefix with 'U' to indicate uncompressed
+                # Prefix with 'U' (or 'P' for pickle) to indicate uncompressed
+                serialized = (b'P' if pickled else b'U') + serialized
             
             # Encrypt if enabled
             if self.encryptor and self.encryptor.enabled:
@@ -85,10 +183,19 @@ class Serializer:
                 f"Failed to serialize value: {e}", 
                 extra={"correlation_id": self.correlation_id}
             )
-            if self.stats:
-                self.stats["errors"] = self.stats.get("errors", 0) + 1
+            self._count_error()
             raise CacheSerializationError(f"Failed to serialize value: {e}") from e
 
+    def _count_error(self) -> None:
+        """Increment the error counter of the attached stats, if any."""
+        stats = self.stats
+        if stats is None:
+            return
+        if isinstance(stats, dict):
+            stats["errors"] = stats.get("errors", 0) + 1
+        else:
+            stats.errors += 1
+
     def deserialize(self, data: bytes) -> Any:
         """Deserialize a value from storage.
         
@@ -113,21 +220,25 @@ class Serializer:
                 data = self.encryptor.decrypt(data)
             
             # Check for compression flag
-            if data.startswith(b'C'):  # Compressed
-                decompressed = zlib.decompress(data[1:])
-                return msgpack.unpackb(decompressed, raw=False, ext_hook=self._decode_complex_types)
-            elif data.startswith(b'U'):  # Uncompressed
-                return msgpack.unpackb(data[1:], raw=False, ext_hook=self._decode_complex_types)
+            marker = data[0:1]
+            if marker == b'C':  # Compressed
+                return self._unpack(zlib.decompress(memoryview(data)[1:]))
+            elif marker == b'U':  # Uncompressed
+                return self._unpack(memoryview(data)[1:])
+            elif self._allow_pickle and marker in (b'P', b'Q'):  # Pickled
+                payload = memoryview(data)[1:]
+                if marker == b'Q':
+                    payload = zlib.decompress(payload)
+                return pickle.loads(payload)
             else:
                 # Legacy data without compression flag
-                return msgpack.unpackb(data, raw=False, ext_hook=self._decode_complex_types)
+                return self._unpack(data)
         except Exception as e:
             logger.error(
                 f"Failed to deserialize data: {e}", 
                 extra={"correlation_id": self.correlation_id}
             )
-            if self.stats:
-                self.stats["errors"] = self.stats.get("errors", 0) + 1
+            self._count_error()
             raise CacheSerializationError(f"Failed to deserialize data: {e}") from e
 
     def _decode_complex_types(self, code: str, data: Any) -> Any:
@@ -143,16 +254,71 @@ class Serializer:
         # Currently we don't have custom types, but this allows for future extension
         return data
 
+def _compress_with_dict(data: bytes, compression_level: int,
+                        compression_dict: bytes) -> Optional[bytes]:
+    """Compress data against a preset dictionary.
+    
+    The probe is skipped because small payloads only compress well once the
+    dictionary is taken into account.
+    
+    Args:
+        data: The serialized payload
+        compression_level: Zlib compression level
+        compression_dict: Preset dictionary shared by writers and readers
+        
+    Returns:
+        Optional[bytes]: The 'D'-prefixed compressed payload, or None if it is
+            not smaller than the original
+    """
+    compressor = zlib.compressobj(level=compression_level, zdict=compression_dict)
+    compressed = compressor.compress(data) + compressor.flush()
+    if len(compressed) >= len(data):
+        return None
+    return b'D' + compressed
+
+def build_compression_dict(samples: Iterable[bytes], size: int = _MAX_DICT_SIZE) -> bytes:
+    """Build a preset compression dictionary from sample payloads.
+    
+    Samples are typically serialized values from one namespace, which share
+    keys and structure. The most frequent samples are placed at the end of
+    the dictionary, where zlib can reference them most cheaply.
+    
+    Args:
+        samples: Serialized sample payloads, e.g. from serialize_uncompressed()
+        size: Maximum dictionary size in bytes; zlib uses at most 32 KB
+        
+    Returns:
+        bytes: The dictionary, to pass as compression_dict to serialize() and
+            deserialize() (or RedisLayer)
+            
+    Raises:
+        ValueError: If size is not positive
+    """
+    if size <= 0:
+        raise ValueError("Dictionary size must be positive")
+    counts = Counter(samples)
+    ordered = sorted(counts, key=counts.__getitem__)
+    joined = b''.join(ordered)
+    return joined[max(0, len(joined) - min(size, _MAX_DICT_SIZE)):]
+
 def serialize(value: Any, enable_compression: bool = False, 
              compression_min_size: int = 1024,
-             compression_level: int = 6) -> bytes:
+             compression_level: int = 1,
+             compression_dict: Optional[bytes] = None) -> bytes:
     """Serialize a value using msgpack if available, otherwise pickle.
     
     Args:
         value: The value to serialize
         enable_compression: Whether to enable compression for large values
-        compression_min_size: Minimum size in bytes for compression to be applied
-        compression_level: Compression level (1-9) for zlib
+        compression_min_size: Minimum size in bytes for compression to be applied;
+            smaller payloads skip zlib entirely, and larger ones are stored
+            uncompressed when a 4 KB probe shrinks by less than 20%
+        compression_level: Compression level (1-9) for zlib; 1-3 is recommended
+            for cache values. Ignored when LZ4 is installed, which is used at
+            its fastest setting instead
+        compression_dict: Optional preset dictionary (see build_compression_dict);
+            lets small payloads compress well, so compression_min_size can be
+            lowered to a few hundred bytes. Readers must pass the same dictionary
         
     Returns:
         bytes: The serialized value
@@ -162,23 +328,95 @@ def serialize(value: Any, enable_compression: bool = False,
     """
     try:
         data = msgpack.packb(value, use_bin_type=True)
+        if not enable_compression:
+            return b'U' + data
+        return _frame_packed(data, compression_min_size, compression_level, compression_dict)
+    except Exception as e:
+        raise CacheSerializationError(f"Failed to serialize data: {e}")
+
+def _frame_packed(data: bytes, compression_min_size: int, compression_level: int,
+                  compression_dict: Optional[bytes]) -> bytes:
+    """Compress msgpack output when worthwhile and prefix the codec marker.
+    
+    Args:
+        data: The msgpack-encoded value
+        compression_min_size: Minimum size in bytes for compression to be applied
+        compression_level: Zlib compression level
+        compression_dict: Optional preset dictionary
         
-        # Apply compression if enabled and the data size meets the minimum
-        if enable_compression and len(data) >= compression_min_size:
-            compressed = zlib.compress(data, level=compression_level)
-            # Prepend a simple marker to identify compressed data
-            return b'C' + compressed
-        
-        # If not compressed, use a different marker
+    Returns:
+        bytes: The marker-prefixed payload
+    """
+    if len(data) < compression_min_size:
         return b'U' + data
+    
+    if compression_dict:
+        compressed = _compress_with_dict(data, compression_level, compression_dict)
+    else:
+        # Only compress when a probe shows the payload actually compresses
+        compressed = _compress_if_worthwhile(data, compression_level, use_lz4=HAS_LZ4)
+    
+    # If not compressed, use a different marker
+    return compressed if compressed is not None else b'U' + data
+
+def make_batch_serializer(enable_compression: bool = False,
+                          compression_min_size: int = 1024,
+                          compression_level: int = 1,
+                          compression_dict: Optional[bytes] = None) -> Callable[[Any], bytes]:
+    """Build a serialize() equivalent that reuses one msgpack Packer.
+    
+    msgpack.packb() constructs a new Packer on every call, which costs more
+    than packing a small value. The returned function keeps a single Packer,
+    so it is not thread-safe; create one per batch rather than sharing it.
+    
+    Args:
+        enable_compression: Whether to enable compression for large values
+        compression_min_size: Minimum size in bytes for compression to be applied
+        compression_level: Compression level (1-9) for zlib
+        compression_dict: Optional preset dictionary (see build_compression_dict)
+        
+    Returns:
+        Callable[[Any], bytes]: Function producing the same output as serialize()
+    """
+    pack = msgpack.Packer(use_bin_type=True).pack
+    
+    def encode(value: Any) -> bytes:
+        try:
+            data = pack(value)
+            if not enable_compression:
+                return b'U' + data
+            return _frame_packed(data, compression_min_size, compression_level, compression_dict)
+        except Exception as e:
+            raise CacheSerializationError(f"Failed to serialize data: {e}")
+    
+    return encode
+
+def serialize_uncompressed(value: Any) -> bytes:
+    """Serialize a value without compression.
+    
+    Produces the same output as serialize() with compression disabled, but
+    skips the compression checks; useful when encoding many values in a loop.
+    
+    Args:
+        value: The value to serialize
+        
+    Returns:
+        bytes: The serialized value
+        
+    Raises:
+        CacheSerializationError: If serialization fails
+    """
+    try:
+        return b'U' + msgpack.packb(value, use_bin_type=True)
     except Exception as e:
         raise CacheSerializationError(f"Failed to serialize data: {e}")
 
-def deserialize(data: bytes) -> Any:
+def deserialize(data: bytes, compression_dict: Optional[bytes] = None) -> Any:
     """Deserialize a value using msgpack if available, otherwise pickle.
     
     Args:
         data: The serialized data
+        compression_dict: Preset dictionary the data was compressed with, if any
         
     Returns:
         Any: The deserialized value
@@ -190,12 +428,25 @@ def deserialize(data: bytes) -> Any:
         return None
     
     try:
-        # Check the marker to determine if data is compressed
-        marker, payload = data[0:1], data[1:]
+        # Check the marker to determine if data is compressed. The payload is
+        # a view so large values aren't copied just to drop the marker byte
+        marker, payload = data[0:1], memoryview(data)[1:]
         
         # Decompress if necessary
         if marker == b'C':
             payload = zlib.decompress(payload)
+        elif marker == b'L':
+            if not HAS_LZ4:
+                raise CacheSerializationError(
+                    "Data was compressed with LZ4 but the lz4 package is not installed"
+                )
+            payload = lz4.frame.decompress(payload)
+        elif marker == b'D':
+            if not compression_dict:
+                raise CacheSerializationError(
+                    "Data was compressed with a preset dictionary but none was given"
+                )
+            payload = zlib.decompressobj(zdict=compression_dict).decompress(payload)
         elif marker != b'U':
             # For backward compatibility - if no marker, assume uncompressed
             payload = data
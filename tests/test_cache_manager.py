@@ -1,9 +1,12 @@
 import os
+import dbm.dumb
+import shelve
+import time
 import pytest
 import logging
 
 from src.cache_manager import CacheManager
-from src.cache_config import CacheConfig, CacheLayerType, CacheLayerConfig
+from src.cache_config import CacheConfig, CacheLayerType, CacheLayerConfig, get_cache_config
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -87,3 +90,218 @@ async def test_context_manager(config_shelve):
         assert ret == "context", "Cache value should be retrievable within async context."
         print(f"  ✓ Context manager properly handles cache operations, retrieved: {ret}")
     print("✅ test_context_manager passed!")
+
+@pytest.mark.asyncio
+async def test_default_config(tmp_path, monkeypatch):
+    print("\nRunning test_default_config...")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CACHE_DIR", str(tmp_path / "cache"))
+    get_cache_config.cache_clear()
+    try:
+        async with CacheManager() as cm:
+            assert cm._config is get_cache_config(), "Bare CacheManager should use the shared config."
+            await cm.set("default_key", "default_value")
+            assert await cm.get("default_key") == "default_value", "Default config should cache values."
+            print("  ✓ CacheManager() built from the shared configuration")
+    finally:
+        get_cache_config.cache_clear()
+    print("✅ test_default_config passed!")
+
+def test_config_copy_refreshes_redis_url(config_shelve):
+    assert config_shelve.full_redis_url == "redis://localhost:6379"
+    copied = config_shelve.model_copy(update={"redis_url": "redis://other", "redis_port": 6380})
+    assert copied.full_redis_url == "redis://other:6380", "Copy should not reuse the cached URL."
+    assert config_shelve.full_redis_url == "redis://localhost:6379", "Original should be unchanged."
+
+def test_config_copy_refreshes_layer_views(config_shelve):
+    assert config_shelve.enabled_layer_types == (CacheLayerType.MEMORY, CacheLayerType.DISK)
+    copied = config_shelve.model_copy(update={
+        "use_redis": True,
+        "cache_layers": [
+            CacheLayerConfig(type=CacheLayerType.MEMORY, ttl=30),
+            CacheLayerConfig(type=CacheLayerType.REDIS, ttl=120),
+        ],
+    })
+    assert copied.enabled_layer_types == (CacheLayerType.MEMORY, CacheLayerType.REDIS), \
+        "Copy should report its own layer chain."
+    assert copied.enabled_layer_ttls == (30, 120)
+    assert config_shelve.enabled_layer_types == (CacheLayerType.MEMORY, CacheLayerType.DISK)
+
+@pytest.mark.asyncio
+async def test_get_follows_config_changes(config_shelve):
+    print("\nRunning test_get_follows_config_changes...")
+    config_shelve.read_through = False
+    async with CacheManager(config=config_shelve) as cm:
+        memory_layer = cm._cache_layers[CacheLayerType.MEMORY]
+        disk_layer = cm._cache_layers[CacheLayerType.DISK]
+        await disk_layer.set("rt_key", "rt_value")
+        assert await cm.get("rt_key") == "rt_value"
+        found, _ = await memory_layer.get("rt_key")
+        assert not found, "Disk hits should not be promoted without read-through."
+        
+        # Turned on after construction; get must start promoting disk hits
+        cm._config.read_through = True
+        assert await cm.get("rt_key") == "rt_value"
+        found, _ = await memory_layer.get("rt_key")
+        assert found, "Read-through should follow the updated config."
+        print("  ✓ get picks up config changes on a live instance")
+    print("✅ test_get_follows_config_changes passed!")
+
+@pytest.mark.asyncio
+async def test_disk_metadata_persists_across_reopen(config_shelve):
+    print("\nRunning test_disk_metadata_persists_across_reopen...")
+    async with CacheManager(config=config_shelve) as cm:
+        await cm.set("persist_a", "value_a")
+        await cm.set("persist_b", "value_b")
+        await cm.delete("persist_b")
+    
+    # A new instance replays the metadata journal written by the first one
+    async with CacheManager(config=config_shelve) as cm:
+        disk_layer = cm._cache_layers[CacheLayerType.DISK]
+        found, value = await disk_layer.get(cm._namespace_key("persist_a"))
+        assert found and value == "value_a", "Disk entry should survive a restart."
+        found, _ = await disk_layer.get(cm._namespace_key("persist_b"))
+        assert not found, "Deleted disk entry should stay deleted after a restart."
+        print("  ✓ Disk metadata restored from snapshot and journal")
+    print("✅ test_disk_metadata_persists_across_reopen passed!")
+
+@pytest.mark.asyncio
+async def test_disk_legacy_metadata_migrated(config_shelve):
+    print("\nRunning test_disk_legacy_metadata_migrated...")
+    cache_path = os.path.join(config_shelve.cache_dir, config_shelve.cache_file)
+    metadata_path = f"{cache_path}_metadata"
+    # Earlier versions kept the expiry metadata in a shelve of its own
+    with shelve.open(cache_path) as db:
+        db["legacy_key"] = "legacy_value"
+    with shelve.Shelf(dbm.dumb.open(metadata_path, "c")) as db:
+        db["legacy_key"] = time.time() + 300
+    
+    for _ in range(2):
+        async with CacheManager(config=config_shelve) as cm:
+            disk_layer = cm._cache_layers[CacheLayerType.DISK]
+            found, value = await disk_layer.get("legacy_key")
+            assert found and value == "legacy_value", "Legacy metadata should be migrated."
+        assert not os.path.exists(f"{metadata_path}.dat"), "Legacy metadata files should be removed."
+        assert dbm.whichdb(metadata_path) == "", "Metadata should be stored as a snapshot."
+    print("  ✓ Legacy metadata shelve migrated to a snapshot")
+    print("✅ test_disk_legacy_metadata_migrated passed!")
+
+@pytest.mark.asyncio
+async def test_disk_write_behind(config_shelve):
+    print("\nRunning test_disk_write_behind...")
+    config_shelve.disk_write_behind = True
+    async with CacheManager(config=config_shelve) as cm:
+        disk_layer = cm._cache_layers[CacheLayerType.DISK]
+        key = cm._namespace_key("wb_key")
+        assert await disk_layer.set(key, "wb_value"), "Buffered set should report success."
+        found, value = await disk_layer.get(key)
+        assert found and value == "wb_value", "Buffered value should be readable before it reaches disk."
+        await disk_layer.set(cm._namespace_key("wb_gone"), "gone")
+        assert await disk_layer.delete(cm._namespace_key("wb_gone")), "Buffered value should be deletable."
+    
+    # Closing the first instance writes out everything still buffered
+    async with CacheManager(config=config_shelve) as cm:
+        disk_layer = cm._cache_layers[CacheLayerType.DISK]
+        found, value = await disk_layer.get(cm._namespace_key("wb_key"))
+        assert found and value == "wb_value", "Buffered write should be on disk after close."
+        found, _ = await disk_layer.get(cm._namespace_key("wb_gone"))
+        assert not found, "Deleted buffered value should never reach disk."
+        print("  ✓ Write-behind values served from the buffer and persisted on close")
+    print("✅ test_disk_write_behind passed!")
+
+@pytest.mark.asyncio
+async def test_disk_write_through_supersedes_buffer(config_shelve):
+    print("\nRunning test_disk_write_through_supersedes_buffer...")
+    config_shelve.disk_write_behind = True
+    async with CacheManager(config=config_shelve) as cm:
+        disk_layer = cm._cache_layers[CacheLayerType.DISK]
+        disk_layer._write_behind_max_pending = 2
+        key = cm._namespace_key("wt_key")
+        await disk_layer.set(key, "old")
+        await disk_layer.set(cm._namespace_key("wt_other"), "other")
+        
+        # The buffer is full, so this write goes straight to disk
+        assert await disk_layer.set(key, "new"), "Write-through set should succeed."
+        found, value = await disk_layer.get(key)
+        assert found and value == "new", "Write-through value should replace the buffered one."
+        
+        await disk_layer._drain_task
+        assert not disk_layer._pending, "Write-through should restart draining the full buffer."
+        found, value = await disk_layer.get(key)
+        assert found and value == "new", "Draining the buffer should not revive the older value."
+        print("  ✓ Write-through values supersede buffered ones")
+    print("✅ test_disk_write_through_supersedes_buffer passed!")
+
+@pytest.mark.asyncio
+async def test_disk_cleanup_through_layer(config_shelve):
+    print("\nRunning test_disk_cleanup_through_layer...")
+    config_shelve.disk_usage_monitoring = False
+    async with CacheManager(config=config_shelve) as cm:
+        disk_layer = cm._cache_layers[CacheLayerType.DISK]
+        for i in range(3):
+            await disk_layer.set(f"dc_{i}", i)
+        removed = await cm._cleanup_disk_cache(aggressive=True)
+        assert removed == 3, "Cleanup should remove every entry."
+        found, _ = await disk_layer.get("dc_0")
+        assert not found, "Cleaned up entries should not be served by the layer."
+    
+    # Closing the layer must not write the removed entries back
+    async with CacheManager(config=config_shelve) as cm:
+        found, _ = await cm._cache_layers[CacheLayerType.DISK].get("dc_1")
+        assert not found, "Cleaned up entries should stay removed after a restart."
+        print("  ✓ Disk cleanup goes through the layer's shelf handle")
+    print("✅ test_disk_cleanup_through_layer passed!")
+
+@pytest.mark.asyncio
+async def test_memory_ttl_sweep(config_shelve):
+    print("\nRunning test_memory_ttl_sweep...")
+    async with CacheManager(config=config_shelve) as cm:
+        memory_layer = cm._cache_layers[CacheLayerType.MEMORY]
+        await memory_layer.set("expired_a", "a", ttl=0)
+        await memory_layer.set("expired_b", "b", ttl=0)
+        await memory_layer.set("fresh", "c", ttl=60)
+        removed = await memory_layer.sweep_expired(batch_size=1)
+        assert removed == 2, "Both expired entries should be swept."
+        assert "expired_a" not in memory_layer._cache and "expired_b" not in memory_layer._cache
+        found, value = await memory_layer.get("fresh")
+        assert found and value == "c", "Unexpired entries should survive the sweep."
+        print("  ✓ Expired entries removed in batches, fresh entry kept")
+    print("✅ test_memory_ttl_sweep passed!")
+
+@pytest.mark.asyncio
+async def test_front_tier_cache(config_shelve):
+    print("\nRunning test_front_tier_cache...")
+    config_shelve.l0_cache_size = 2
+    async with CacheManager(config=config_shelve) as cm:
+        memory_layer = cm._cache_layers[CacheLayerType.MEMORY]
+        await cm.set("hot", "v1")
+        # A layer-level change is invisible until the front-tier entry goes
+        await memory_layer.set("hot", "changed")
+        assert await cm.get("hot") == "v1", "Hot key should be served from the front tier."
+        with cm.bypass_local_cache():
+            assert await cm.get("hot") == "changed", "Bypass should read from the layers."
+        await cm.delete("hot")
+        assert await cm.get("hot") is None, "Delete should invalidate the front tier."
+        for key in ("a", "b", "c"):
+            await cm.set(key, key)
+        assert len(cm._l0) == 2 and "a" not in cm._l0, "Front tier should evict its LRU entry."
+        await cm.clear()
+        assert not cm._l0, "Clear should empty the front tier."
+        print("  ✓ Front tier serves, bypasses, invalidates and evicts")
+    print("✅ test_front_tier_cache passed!")
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("namespace", ["default", "app"])
+async def test_invalidate_keys_batch(config_shelve, namespace):
+    print("\nRunning test_invalidate_keys_batch...")
+    config_shelve.namespace = namespace
+    async with CacheManager(config=config_shelve) as cm:
+        await cm.set_many({"inv_a": 1, "inv_b": 2, "inv_c": 3, "inv_keep": 4})
+        await cm._invalidate_keys(["inv_a", "inv_b"])
+        await cm._invalidate_keys(["inv_c"])
+        assert await cm.get("inv_a") is None and await cm.get("inv_b") is None, \
+            "Invalidated keys should be gone from every layer."
+        assert await cm.get("inv_c") is None, "A single invalidated key should be gone too."
+        assert await cm.get("inv_keep") == 4, "Other keys should be untouched."
+        print("  ✓ Batch invalidation removed keys from all layers")
+    print("✅ test_invalidate_keys_batch passed!")
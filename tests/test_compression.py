@@ -7,6 +7,11 @@ import pytest
 
 from src.cache_manager import CacheManager
 from src.cache_config import CacheConfig, CacheLayerType, CacheLayerConfig
+from src.core.exceptions import CacheSerializationError
+from src.cache_enums import SerializationCodec
+from src.utils.serialization import (
+    Serializer, serialize, serialize_uncompressed, deserialize, build_compression_dict
+)
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -161,6 +166,68 @@ async def test_compression_with_different_thresholds(tmp_path):
     
     print("  ✓ Compression with different thresholds test completed!")
 
+def test_incompressible_values_stored_uncompressed():
+    """Test that payloads failing the compressibility probe skip compression."""
+    random_value = os.urandom(8192)
+    serialized = serialize(random_value, enable_compression=True, compression_min_size=100)
+    assert serialized[0:1] == b'U', "Random bytes should not be compressed"
+    assert deserialize(serialized) == random_value
+    
+    text_value = "x" * 8192
+    serialized = serialize(text_value, enable_compression=True, compression_min_size=100)
+    assert serialized[0:1] in (b'C', b'L'), "Repetitive text should be compressed"
+    assert deserialize(serialized) == text_value
+
+def test_preset_dictionary_compression():
+    """Test that a trained dictionary compresses small values and round-trips."""
+    samples = [
+        serialize_uncompressed({"user_id": i, "name": f"user{i}", "email": f"user{i}@example.com",
+                                "roles": ["reader", "writer"], "active": True})
+        for i in range(200)
+    ]
+    compression_dict = build_compression_dict(samples)
+    
+    value = {"user_id": 999, "name": "user999", "email": "user999@example.com",
+             "roles": ["reader", "writer"], "active": True}
+    serialized = serialize(value, enable_compression=True, compression_min_size=16,
+                           compression_dict=compression_dict)
+    assert serialized[0:1] == b'D', "Small value should compress against the dictionary"
+    assert len(serialized) < len(serialize_uncompressed(value))
+    assert deserialize(serialized, compression_dict=compression_dict) == value
+    
+    with pytest.raises(CacheSerializationError):
+        deserialize(serialized)
+
+def test_compression_dict_size():
+    """Test that the dictionary size bound is honoured and must be positive."""
+    samples = [b"alpha", b"beta", b"beta"]
+    assert build_compression_dict(samples, size=4) == b"beta"
+    assert build_compression_dict(samples, size=100) == b"alphabeta"
+    
+    with pytest.raises(ValueError):
+        build_compression_dict(samples, size=0)
+
+def test_pickle_codec_fallback():
+    """Test that the pickle codec only pickles values msgpack cannot encode."""
+    serializer = Serializer(enable_compression=True, compression_min_size=100,
+                            codec=SerializationCodec.PICKLE)
+    
+    assert serializer.serialize({"a": 1})[0:1] == b'U', "msgpack values should stay msgpack"
+    
+    small_set = {1, 2, 3}
+    serialized = serializer.serialize(small_set)
+    assert serialized[0:1] == b'P'
+    assert serializer.deserialize(serialized) == small_set
+    
+    large_set = {f"member-{i}" for i in range(500)}
+    serialized = serializer.serialize(large_set)
+    assert serialized[0:1] == b'Q', "Large pickled values should be compressed"
+    assert serializer.deserialize(serialized) == large_set
+    
+    # Other codecs refuse values msgpack cannot encode
+    with pytest.raises(CacheSerializationError):
+        Serializer().serialize(small_set)
+
 if __name__ == "__main__":
     """Run compression tests directly."""
     asyncio.run(test_cache_compression(None))
@@ -65,6 +65,24 @@ def lfu_config(tmp_path: Path) -> CacheConfig:
         ]
     )
 
+@pytest.fixture
+def clock_config(tmp_path: Path) -> CacheConfig:
+    """Fixture providing cache config with CLOCK eviction policy."""
+    cache_dir = tmp_path / "cache_clock"
+    os.makedirs(cache_dir, exist_ok=True)
+    
+    return CacheConfig(
+        cache_dir=str(cache_dir),
+        cache_file="cache_clock.db",
+        cache_max_size=5,  # Small size to test eviction
+        eviction_policy=EvictionPolicy.CLOCK,
+        use_layered_cache=True,
+        cache_layers=[
+            CacheLayerConfig(type=CacheLayerType.MEMORY, ttl=60, max_size=5),  # Small size for memory layer
+            CacheLayerConfig(type=CacheLayerType.DISK, ttl=300)
+        ]
+    )
+
 @pytest.mark.asyncio
 async def test_lru_eviction(lru_config: CacheConfig) -> None:
     """Test the Least Recently Used eviction policy."""
@@ -209,6 +227,40 @@ async def test_lfu_eviction(lfu_config: CacheConfig) -> None:
     await cache.clear()
     await cache.close()
 
+@pytest.mark.asyncio
+async def test_clock_eviction(clock_config: CacheConfig) -> None:
+    """Test the CLOCK (second-chance) eviction policy."""
+    print("\nTesting CLOCK eviction policy...")
+    cache = CacheManager(config=clock_config)
+    memory_layer = cache._cache_layers[CacheLayerType.MEMORY]
+    
+    # Insert keys in a sequence
+    for i in range(1, 6):  # Insert keys 1-5
+        await cache.set(f"key{i}", f"value{i}")
+    
+    # Reading key1 sets its reference flag without reordering anything
+    await cache.get("key1")
+    print("  Accessed key1")
+    
+    # The hand passes key1 (clearing its flag) and evicts key2 instead
+    await cache.set("key6", "value6")
+    print("  Added key6")
+    
+    key1_in_memory, _ = await memory_layer.get(cache._namespace_key("key1"))
+    key2_in_memory, _ = await memory_layer.get(cache._namespace_key("key2"))
+    print(f"  key1 in memory: {key1_in_memory}")
+    print(f"  key2 in memory: {key2_in_memory}")
+    assert key1_in_memory, "Referenced key1 should get a second chance"
+    assert not key2_in_memory, "Unreferenced key2 should be evicted"
+    
+    # Verify all values are still retrievable, falling back to disk
+    for i in range(1, 7):
+        value = await cache.get(f"key{i}")
+        assert value == f"value{i}", f"key{i} should still be available"
+    
+    await cache.clear()
+    await cache.close()
+
 @pytest.mark.asyncio
 async def test_different_eviction_policies_comparison() -> None:
     """Compare behavior of different eviction policies."""
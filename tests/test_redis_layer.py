@@ -0,0 +1,136 @@
+"""Tests for the Redis cache layer, run against an in-process fake Redis server."""
+
+import logging
+import pytest
+import pytest_asyncio
+
+from src.cache_layers.redis_layer import RedisLayer
+
+# The set_many script needs fakeredis' Lua support (the "lua" extra)
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+def _open_circuit(breaker) -> None:
+    """Record enough failures to open a circuit breaker."""
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+@pytest_asyncio.fixture(scope="function")
+async def fake_redis():
+    """Fixture providing a fake Redis client with an empty keyspace."""
+    client = fakeredis.FakeAsyncRedis()
+    yield client
+    await client.aclose()
+
+@pytest_asyncio.fixture(scope="function")
+async def redis_layer(fake_redis):
+    """Fixture providing a RedisLayer whose connection pool talks to fake_redis."""
+    layer = RedisLayer(namespace="test", ttl=60, redis_url="redis://localhost:6379")
+    # The layer builds its client and scripts on this pool, as with a real server
+    layer._connection_pool = fake_redis.connection_pool
+    yield layer
+    await layer.close()
+
+@pytest.mark.asyncio
+async def test_set_get_delete(redis_layer):
+    """Test single-key round trips, including a value large enough to decode off the loop."""
+    assert await redis_layer.set("test:small", {"a": [1, 2, 3]})
+    assert await redis_layer.get("test:small") == (True, {"a": [1, 2, 3]})
+
+    large = "x" * (128 * 1024)
+    assert await redis_layer.set("test:large", large)
+    assert await redis_layer.get("test:large") == (True, large)
+
+    assert await redis_layer.delete("test:small")
+    assert await redis_layer.get("test:small") == (False, None)
+
+@pytest.mark.asyncio
+async def test_set_many_get_many_across_chunks(redis_layer, fake_redis):
+    """Test batch round trips across the 512-key chunk boundary."""
+    values = {f"test:k{i}": {"v": i} for i in range(1100)}
+    assert await redis_layer.set_many(values, ttl=120)
+    assert 0 < await fake_redis.ttl("test:k1099") <= 120
+
+    keys = list(values) + ["test:missing"]
+    assert await redis_layer.get_many(keys) == values
+
+    streamed = {key: value async for key, value in redis_layer.iget_many(keys)}
+    assert streamed == values
+
+@pytest.mark.asyncio
+async def test_set_many_fractional_ttl(redis_layer, fake_redis):
+    """Test that sub-second TTLs are rounded up instead of failing the batch."""
+    assert await redis_layer.set_many({"test:a": 1, "test:b": 2}, ttl=0.4)
+    assert await fake_redis.ttl("test:a") == 1
+    assert await redis_layer.set("test:c", 3, ttl=2.5)
+    assert await fake_redis.ttl("test:c") == 3
+
+@pytest.mark.asyncio
+async def test_set_many_without_wait(redis_layer, fake_redis):
+    """Test that fire-and-forget writes complete before close returns."""
+    assert await redis_layer.set_many({"test:bg1": 1, "test:bg2": 2}, wait=False)
+    await redis_layer.close()
+    assert await fake_redis.exists("test:bg1", "test:bg2") == 2
+
+@pytest.mark.asyncio
+async def test_delete_many_count(redis_layer):
+    """Test that delete_many reports only the keys that existed."""
+    await redis_layer.set_many({"test:d1": 1, "test:d2": 2, "test:d3": 3})
+    assert await redis_layer.delete_many(["test:d1", "test:d2", "test:nope"]) == 2
+    assert await redis_layer.get_many(["test:d1", "test:d2", "test:d3"]) == {"test:d3": 3}
+
+@pytest.mark.asyncio
+async def test_clear_namespace(redis_layer, fake_redis):
+    """Test that clear removes only keys in the layer's namespace."""
+    await fake_redis.set("other:keep", b"1")
+    await redis_layer.set_many({f"test:c{i}": i for i in range(1200)})
+
+    assert await redis_layer.clear()
+    assert await fake_redis.keys() == [b"other:keep"]
+
+@pytest.mark.asyncio
+async def test_clear_default_namespace_refused(fake_redis):
+    """Test that the default namespace never clears the shared keyspace."""
+    layer = RedisLayer(namespace="default", ttl=60, redis_url="redis://localhost:6379")
+    layer._connection_pool = fake_redis.connection_pool
+    try:
+        await fake_redis.set("shared", b"1")
+        assert not await layer.clear()
+        assert await fake_redis.exists("shared") == 1
+    finally:
+        await layer.close()
+
+@pytest.mark.asyncio
+async def test_open_circuit_reports_misses(redis_layer):
+    """Test that an open circuit turns reads into misses and writes into failures."""
+    await redis_layer.set_many({"test:o1": 1, "test:o2": 2})
+
+    _open_circuit(redis_layer._redis_get_breaker)
+    assert await redis_layer.get("test:o1") == (False, None)
+    assert await redis_layer.get_many(["test:o1", "test:o2"]) == {}
+    assert [item async for item in redis_layer.iget_many(["test:o1"])] == []
+
+    _open_circuit(redis_layer._redis_set_breaker)
+    assert not await redis_layer.set("test:o3", 3)
+    assert not await redis_layer.set_many({"test:o4": 4})
+
+@pytest.mark.asyncio
+async def test_circuit_opening_during_get_many(redis_layer, monkeypatch):
+    """Test that a circuit opening between the check and the MGET yields misses."""
+    await redis_layer.set_many({"test:m1": 1})
+
+    # Allowed by get_many's own check, then refused by the breaker wrapper
+    answers = iter([True])
+    monkeypatch.setattr(redis_layer._redis_get_breaker, "allow_request",
+                        lambda: next(answers, False))
+    assert await redis_layer.get_many(["test:m1"]) == {}
+
+@pytest.mark.asyncio
+async def test_warm_up(redis_layer):
+    """Test that warm_up opens at most max_connections connections."""
+    assert await redis_layer.warm_up(connections=2) == 2
+    assert await redis_layer.warm_up(connections=redis_layer.max_connections + 5) \
+        == redis_layer.max_connections
@@ -208,6 +208,39 @@ async def test_retry_mechanism_exceeding_attempts(resilience_config):
     await cm.close()
     print("  ✓ Retry mechanism failure test completed!")
 
+@pytest.mark.asyncio
+async def test_write_retries_follow_instance_config(resilience_config):
+    """Test that writes and deletes retry per the instance's config, not the import-time default."""
+    print("\nTesting write retries against the instance config...")
+    resilience_config.retry_attempts = 1
+    resilience_config.retry_delay = 0.1
+    
+    cm = CacheManager(config=resilience_config)
+    disk_layer = cm._cache_layers[CacheLayerType.DISK]
+    original_delete = disk_layer.delete
+    
+    attempt_count = 0
+    
+    async def mock_delete_always_fails(key):
+        nonlocal attempt_count
+        attempt_count += 1
+        raise CacheError(f"Simulated failure #{attempt_count}")
+    
+    disk_layer.delete = mock_delete_always_fails
+    
+    try:
+        with pytest.raises(CacheError):
+            await cm.delete("retry_delete_key")
+        expected_attempts = resilience_config.retry_attempts + 1
+        assert attempt_count == expected_attempts, f"Should have attempted {expected_attempts} times, but attempted {attempt_count} times"
+        print(f"  ✓ Delete failed after {attempt_count} attempts, as expected")
+    finally:
+        disk_layer.delete = original_delete
+    
+    await cm.clear()
+    await cm.close()
+    print("  ✓ Write retry test completed!")
+
 if __name__ == "__main__":
     """Run resilience tests directly."""
     asyncio.run(test_circuit_breaker(None))